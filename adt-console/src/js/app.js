@@ -295,6 +295,63 @@ const RemoteManager = (() => {
   return { toggle, isSharing, getUrl: () => publicUrl };
 })();
 
+// --- ADS Event Stream ---
+// Follows /api/ads/stream. Event ids are ledger offsets: a view that loaded
+// /api/ads/events passes that response's X-ADS-Offset as `since` and gets
+// exactly the events appended after its read, then keeps resuming from the
+// last id across reconnects and overflows.
+const ADSStream = (() => {
+  const getUrl = () => localStorage.getItem('adt_center_url') || 'http://localhost:5001';
+
+  function open({ project, since, onEvent, onReset }) {
+    let source = null;
+    let lastId = since || null;
+    let closed = false;
+
+    function connect() {
+      const params = new URLSearchParams();
+      if (project) params.set('project', project);
+      if (lastId) params.set('last_event_id', lastId);
+      const query = params.toString();
+      source = new EventSource(`${getUrl()}/api/ads/stream${query ? '?' + query : ''}`);
+      // The server's first message is `event: open` carrying the start offset.
+      source.addEventListener('open', (message) => {
+        if (message.lastEventId) lastId = message.lastEventId;
+      });
+      source.addEventListener('ads', (message) => {
+        lastId = message.lastEventId;
+        let event;
+        try {
+          event = JSON.parse(message.data);
+        } catch {
+          return;
+        }
+        onEvent(event);
+      });
+      source.addEventListener('reset', (message) => {
+        // Ledger rewritten or healed: cached views must be reloaded.
+        lastId = message.lastEventId;
+        if (onReset) onReset();
+      });
+      source.addEventListener('overflow', () => {
+        // Server dropped us for falling behind; reopen from the last id.
+        source.close();
+        if (!closed) setTimeout(connect, 1000);
+      });
+    }
+
+    connect();
+    return {
+      close() {
+        closed = true;
+        if (source) source.close();
+      },
+    };
+  }
+
+  return { open };
+})();
+
 // --- Git Status Manager (SPEC-023) ---
 const GitStatusManager = (() => {
   const getUrl = () => localStorage.getItem('adt_center_url') || 'http://localhost:5001';
@@ -892,52 +949,36 @@ const GitStatusManager = (() => {
   // --- ADS Notification Watcher ---
   // Extends ContextPanel's event detection with native OS notifications
   const _origCheckForNotifiable = ContextPanel._checkForNotifiable;
-  let lastNotifiedEventCount = 0;
 
   function watchForNativeNotifications() {
     if (!window.__TAURI__) return;
 
-    // Poll ADS for denial/escalation events and fire native notifications
-    setInterval(async () => {
-      try {
-        const res = await fetch('http://localhost:5001/api/ads/events');
-        if (!res.ok) return;
-        const data = await res.json();
-        const events = data.events || [];
-
-        if (lastNotifiedEventCount === 0) {
-          lastNotifiedEventCount = events.length;
-          return;
+    // Subscribe to the ADS stream for denial/escalation events and fire
+    // native notifications. EventSource reconnects on its own and resumes
+    // from the last event id, so nothing is missed while the Center restarts.
+    ADSStream.open({
+      onEvent: (event) => {
+        const type = event.action_type || '';
+        if (type.includes('denied') || type.includes('violation')) {
+          NativeNotify.send(
+            'DTTP Denial',
+            truncateStr(event.description, 100)
+          );
+          TrayBridge.updateStatus('error', SessionManager.getAll().length, 1);
+        } else if (type.includes('escalation') || type.includes('break_glass')) {
+          NativeNotify.send(
+            'Escalation',
+            truncateStr(event.description, 100)
+          );
+          TrayBridge.updateStatus('warning', SessionManager.getAll().length, 1);
+        } else if (type.includes('task_complete')) {
+          NativeNotify.send(
+            'Task Completed',
+            truncateStr(event.description, 100)
+          );
         }
-
-        const newEvents = events.slice(lastNotifiedEventCount);
-        lastNotifiedEventCount = events.length;
-
-        newEvents.forEach(event => {
-          const type = event.action_type || '';
-          if (type.includes('denied') || type.includes('violation')) {
-            NativeNotify.send(
-              'DTTP Denial',
-              truncateStr(event.description, 100)
-            );
-            TrayBridge.updateStatus('error', SessionManager.getAll().length, 1);
-          } else if (type.includes('escalation') || type.includes('break_glass')) {
-            NativeNotify.send(
-              'Escalation',
-              truncateStr(event.description, 100)
-            );
-            TrayBridge.updateStatus('warning', SessionManager.getAll().length, 1);
-          } else if (type.includes('task_complete')) {
-            NativeNotify.send(
-              'Task Completed',
-              truncateStr(event.description, 100)
-            );
-          }
-        });
-      } catch {
-        // ADT Center not running
-      }
-    }, 5000);
+      },
+    });
   }
 
   function truncateStr(str, len) {
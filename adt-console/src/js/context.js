@@ -6,6 +6,11 @@ const ContextPanel = (() => {
   let currentSession = null;
   let escalationCount = 0;
   let pollInterval = null;
+  let slowPollInterval = null;
+  let adsOffset = null;
+  let adsStream = null;
+  let adsStreamProject;
+  let adsRefreshTimer = null;
   let allSpecs = {};
   let showAllRoles = false;
 
@@ -51,6 +56,7 @@ const ContextPanel = (() => {
     await fetchDelegations();
     await fetchDTTPStatus();
     await fetchCapabilityContext(session);
+    followADS(session);
 
     // If Tauri, try reading local files as fallback
     if (window.__TAURI__) {
@@ -1029,6 +1035,7 @@ const ContextPanel = (() => {
         : `${getCenterUrl()}/api/ads/events`;
       const res = await fetch(url);
       if (!res.ok) return;
+      adsOffset = res.headers.get('X-ADS-Offset');
       const data = await res.json();
 
       // Handle both list and object response formats
@@ -1237,19 +1244,45 @@ const ContextPanel = (() => {
       });
     }
 
-        // Browser fallback: poll every 10s
-        pollInterval = setInterval(() => {
-          if (currentSession) {
-            fetchADSEvents(currentSession);
-            fetchTaskData(currentSession);
-            fetchRoleRequests(currentSession);
-            fetchDelegations();
-            fetchRequests();
-            fetchDTTPStatus();
-          }
-        }, 10000);
-      }
-    
+    // ADS-derived panels follow /api/ads/stream (see followADS). The DTTP
+    // health indicator is polled, and so, slowly, are tasks and requests:
+    // their files change without an ADS event.
+    pollInterval = setInterval(fetchDTTPStatus, 30000);
+    slowPollInterval = setInterval(() => {
+      if (!currentSession) return;
+      fetchTaskData(currentSession);
+      fetchRequests();
+    }, 60000);
+  }
+
+  // Re-reads the session's ADS-derived panels when new events are appended,
+  // starting from the X-ADS-Offset of the last /api/ads/events read.
+  function followADS(session) {
+    if (adsStream && adsStreamProject === session.project) return;
+    if (adsStream) adsStream.close();
+    adsStreamProject = session.project;
+    adsStream = ADSStream.open({
+      project: session.project,
+      since: adsOffset,
+      onEvent: () => scheduleADSRefresh(),
+      onReset: () => scheduleADSRefresh(),
+    });
+  }
+
+  function scheduleADSRefresh() {
+    // One refresh per burst of events.
+    if (adsRefreshTimer) return;
+    adsRefreshTimer = setTimeout(() => {
+      adsRefreshTimer = null;
+      if (!currentSession) return;
+      fetchADSEvents(currentSession);
+      fetchTaskData(currentSession);
+      fetchRoleRequests(currentSession);
+      fetchDelegations();
+      fetchRequests();
+    }, 500);
+  }
+
       async function completeTask(taskId, btn) {
         if (!currentSession?.role) {
           ToastManager.show('denial', 'Error', 'No active session role');
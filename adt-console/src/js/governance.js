@@ -11,6 +11,10 @@ const GovernancePanel = (() => {
   let cachedEvents = [];
   let cachedPhases = [];
   let matrixFilter = null;
+  let eventsOffset = null;
+  let eventStream = null;
+  let renderTimer = null;
+  let boardStale = false;
 
   // --- Toggle Panel ---
   function toggle() {
@@ -25,6 +29,7 @@ const GovernancePanel = (() => {
     } else {
       termArea.classList.remove('governance-active');
       govPanel.style.display = 'none';
+      stopFollowing();
     }
 
     const btn = document.getElementById('btn-governance');
@@ -34,27 +39,40 @@ const GovernancePanel = (() => {
   function isActiveState() { return isActive; }
 
   // --- Data Fetching ---
-  async function fetchAll() {
-    const url = API_URL();
+  function projectQuery() {
     const projectName = SessionManager.getActive()?.project;
-    const projectQuery = projectName ? `?project=${encodeURIComponent(projectName)}` : '';
+    return projectName ? `?project=${encodeURIComponent(projectName)}` : '';
+  }
 
-    const [tasksRes, specsRes, eventsRes] = await Promise.allSettled([
-      fetch(`${url}/api/tasks${projectQuery}`).then(r => r.ok ? r.json() : null),
-      fetch(`${url}/api/specs${projectQuery}`).then(r => r.ok ? r.json() : null),
-      fetch(`${url}/api/ads/events${projectQuery}`).then(r => r.ok ? r.json() : null),
+  async function fetchAll() {
+    const [eventsRes] = await Promise.allSettled([
+      fetch(`${API_URL()}/api/ads/events${projectQuery()}`).then(async r => {
+        if (!r.ok) return null;
+        eventsOffset = r.headers.get('X-ADS-Offset');
+        return r.json();
+      }),
+      fetchBoard(),
     ]);
 
-    cachedTasks = tasksRes.status === 'fulfilled' && tasksRes.value
-      ? (tasksRes.value.tasks || []) : [];
-    cachedSpecs = specsRes.status === 'fulfilled' && specsRes.value
-      ? (specsRes.value.specs || []) : [];
     const evData = eventsRes.status === 'fulfilled' ? eventsRes.value : null;
     cachedEvents = evData ? (Array.isArray(evData) ? evData : (evData.events || [])) : [];
 
     await fetchPhases();
   }
 
+  async function fetchBoard() {
+    const url = API_URL();
+    const [tasksRes, specsRes] = await Promise.allSettled([
+      fetch(`${url}/api/tasks${projectQuery()}`).then(r => r.ok ? r.json() : null),
+      fetch(`${url}/api/specs${projectQuery()}`).then(r => r.ok ? r.json() : null),
+    ]);
+
+    cachedTasks = tasksRes.status === 'fulfilled' && tasksRes.value
+      ? (tasksRes.value.tasks || []) : [];
+    cachedSpecs = specsRes.status === 'fulfilled' && specsRes.value
+      ? (specsRes.value.specs || []) : [];
+  }
+
   async function fetchPhases() {
     if (window.__TAURI__) {
       try {
@@ -90,12 +108,54 @@ const GovernancePanel = (() => {
     try {
       await fetchAll();
       renderTab(currentTab);
+      followEvents();
     } catch {
       document.getElementById('gov-content').innerHTML =
         '<div class="gov-offline">ADT Center API offline</div>';
     }
   }
 
+  // --- Live Updates ---
+  // While the panel is open, new ADS events arrive over /api/ads/stream from
+  // the offset of the last /api/ads/events read instead of re-fetching.
+  function followEvents() {
+    stopFollowing();
+    eventStream = ADSStream.open({
+      project: SessionManager.getActive()?.project,
+      since: eventsOffset,
+      onEvent: (event) => {
+        // The offset is taken before the read, so an event may arrive twice.
+        if (event.event_id && cachedEvents.some(e => e.event_id === event.event_id)) return;
+        cachedEvents.push(event);
+        const type = event.action_type || '';
+        scheduleRender(type.includes('task') || type.includes('spec'));
+      },
+      onReset: () => refresh(),
+    });
+  }
+
+  function stopFollowing() {
+    if (eventStream) eventStream.close();
+    eventStream = null;
+    clearTimeout(renderTimer);
+    renderTimer = null;
+  }
+
+  function scheduleRender(refetchBoard) {
+    // Bursts of events re-render once; task/spec events also reload the board.
+    boardStale = boardStale || refetchBoard;
+    if (renderTimer) return;
+    renderTimer = setTimeout(async () => {
+      renderTimer = null;
+      if (!isActive) return;
+      if (boardStale) {
+        boardStale = false;
+        await fetchBoard();
+      }
+      renderTab(currentTab);
+    }, 250);
+  }
+
   // --- Tab Switching ---
   function switchTab(tab) {
     currentTab = tab;
@@ -1,4 +1,6 @@
-from flask import Blueprint, request, jsonify, current_app
+import json
+
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from adt_core.ads.query import ADSQuery
 
 ads_bp = Blueprint("ads", __name__)
@@ -24,25 +26,135 @@ def get_events():
     role = request.args.get("role")
     action_type = request.args.get("action_type")
     spec_ref = request.args.get("spec_ref")
+    session_id = request.args.get("session_id")
+    intent_id = request.args.get("intent_id")
 
+    ledger_offset = current_app.get_ads_broadcaster(paths["ads"]).offset
     events = query.filter_events(
         agent=agent,
         role=role,
         action_type=action_type,
         spec_ref=spec_ref,
+        session_id=session_id,
+        intent_id=intent_id,
         limit=limit,
         offset=offset
     )
     
-    return jsonify(events)
+    response = jsonify(events)
+    # Taken before the read, so a client switching to /stream from here may
+    # see an event twice (same event_id) but never misses one.
+    response.headers["X-ADS-Offset"] = str(ledger_offset)
+    return response
 
-@ads_bp.route("/integrity", methods=["GET"])
+@ads_bp.route("/integrity", methods=["GET", "POST"])
 def check_integrity():
+    """
+    Verifies the hash chain. GET only reads (it resumes from existing
+    checkpoints); POST also writes new checkpoints, like `adt ads verify`.
+    """
     project_name = request.args.get("project")
     paths = current_app.get_project_paths(project_name)
     from adt_core.ads.integrity import ADSIntegrity
-    is_valid, errors = ADSIntegrity.verify_chain(paths["ads"])
+    full = request.args.get("full", "").lower() in ("1", "true", "yes")
+    result = ADSIntegrity.verify(paths["ads"], full=full, write_checkpoints=request.method == "POST")
+    return jsonify(result)
+
+@ads_bp.route("/stats", methods=["GET"])
+def get_stats():
+    project_name = request.args.get("project")
+    paths = current_app.get_project_paths(project_name)
+    bucket = request.args.get("bucket", default=3600, type=int)
+    if bucket < 1:
+        return jsonify({"error": "bucket must be a positive number of seconds"}), 400
+
+    columns = current_app.get_ads_columns(paths["ads"])
     return jsonify({
-        "valid": is_valid,
-        "errors": errors
+        "total": columns.count(),
+        "denials": columns.count(authorized=False),
+        "by_agent": columns.value_counts("agent"),
+        "by_role": columns.value_counts("role"),
+        "by_action_type": columns.value_counts("action_type"),
+        "by_spec": columns.value_counts("spec_ref"),
+        "histogram": [
+            {"ts": ts, "count": count}
+            for ts, count in columns.histogram(bucket, since=request.args.get("since"))
+        ],
     })
+
+@ads_bp.route("/search", methods=["GET"])
+def search_events():
+    project_name = request.args.get("project")
+    paths = current_app.get_project_paths(project_name)
+    from adt_core.ads.mirror import search_ledger
+
+    authorized = request.args.get("authorized")
+    if authorized is not None:
+        authorized = authorized.lower() in ("1", "true", "yes")
+
+    try:
+        events = search_ledger(
+            paths["ads"],
+            text=request.args.get("q"),
+            agent=request.args.get("agent"),
+            role=request.args.get("role"),
+            action_type=request.args.get("action_type"),
+            spec_ref=request.args.get("spec_ref"),
+            session_id=request.args.get("session_id"),
+            authorized=authorized,
+            since=request.args.get("since"),
+            until=request.args.get("until"),
+            limit=request.args.get("limit", default=100, type=int),
+            offset=request.args.get("offset", default=0, type=int),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(events)
+
+@ads_bp.route("/stream", methods=["GET"])
+def stream_events():
+    """
+    Server-Sent Events feed of newly appended events. Each event's id is the
+    ledger offset just past it; reconnecting with Last-Event-ID (or
+    ?last_event_id=, e.g. the X-ADS-Offset of a previous /events poll)
+    replays everything after that point first.
+    """
+    project_name = request.args.get("project")
+    paths = current_app.get_project_paths(project_name)
+
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    since = None
+    if last_id:
+        try:
+            since = int(last_id)
+        except ValueError:
+            return jsonify({"error": "Last-Event-ID must be a ledger offset"}), 400
+        if since < 0:
+            return jsonify({"error": "Last-Event-ID must be a ledger offset"}), 400
+
+    filters = {field: request.args.get(field) for field in
+               ("agent", "role", "action_type", "spec_ref", "session_id", "intent_id")}
+    broadcaster = current_app.get_ads_broadcaster(paths["ads"])
+    subscription = broadcaster.subscribe(since=since, filters=filters)
+    start = broadcaster.offset if since is None else since
+
+    def generate():
+        with subscription:
+            # Sets the client's last event id even before the first event.
+            yield f"retry: 3000\nid: {start}\nevent: open\ndata: {{}}\n\n"
+            while True:
+                message = subscription.get(timeout=15)
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                kind, offset, event = message
+                if kind == "event":
+                    yield f"id: {offset}\nevent: ads\ndata: {json.dumps(event)}\n\n"
+                elif kind == "reset":
+                    yield f"id: {offset}\nevent: reset\ndata: {{}}\n\n"
+                else:
+                    yield "event: overflow\ndata: {}\n\n"
+                    return
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
@@ -12,6 +12,7 @@ from adt_core.ads.logger import ADSLogger
 from adt_core.sdd.registry import SpecRegistry
 from adt_core.sdd.tasks import TaskManager
 from adt_core.ads.capability import CapabilityManager
+from adt_core import gitstate, watch
 
 from adt_core.registry import ProjectRegistry
 
@@ -318,7 +319,14 @@ def _load_json(path):
     with open(path, "r") as f:
         return json.load(f)
 
+# Parsed requests.md per path, kept until the file watcher reports a change.
+_requests_cache = {}
+
 def _parse_requests(file_path):
+    requests_list = watch.get_watcher().load(file_path, _load_requests, _requests_cache)
+    return [dict(r) for r in requests_list]
+
+def _load_requests(file_path):
     if not os.path.exists(file_path):
         return []
     with open(file_path, "r") as f:
@@ -404,11 +412,10 @@ def get_git_status():
     root = res["paths"]["root"]
     
     try:
-        branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=root).decode().strip()
-        status_porcelain = subprocess.check_output(["git", "status", "--porcelain"], cwd=root).decode().strip()
-        
-        # Count lines in porcelain output to get number of changes
-        changes_count = len(status_porcelain.splitlines()) if status_porcelain else 0
+        git = gitstate.get_git_state(root)
+        branch = git.branch()
+        # One porcelain line per changed path
+        changes_count = len(git.status())
         
         return jsonify({
             "branch": branch,
@@ -497,7 +504,7 @@ def session_end():
     if not force:
         try:
             # Check for unstaged/uncommitted changes
-            status = subprocess.check_output(["git", "status", "--porcelain"], cwd=root).decode().strip()
+            status = "\n".join(gitstate.get_git_state(root).status())
             if status:
                 return jsonify({
                     "error": "Uncommitted changes detected. Session cannot be closed without a commit.",
@@ -509,7 +516,7 @@ def session_end():
     # Get current commit hash for ADS record
     commit_hash = "unknown"
     try:
-        commit_hash = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=root).decode().strip()
+        commit_hash = gitstate.get_git_state(root).head() or "unknown"
     except:
         pass
 
@@ -677,6 +684,7 @@ def submit_request():
     os.makedirs(os.path.dirname(requests_path), exist_ok=True)
     with open(requests_path, "a") as f:
         f.write(entry)
+    watch.invalidate(requests_path)
 
     event_id = ADSEventSchema.generate_id("request_sub")
     event = ADSEventSchema.create_event(
@@ -740,6 +748,7 @@ def api_file_request():
     os.makedirs(os.path.dirname(requests_path), exist_ok=True)
     with open(requests_path, "a") as f:
         f.write(entry)
+    watch.invalidate(requests_path)
 
     # Log to ADS
     event_id = ADSEventSchema.generate_id("req_filed")
@@ -894,6 +903,7 @@ def update_request_status(req_id):
 
     with open(requests_path, "w") as f:
         f.write(updated_content)
+    watch.invalidate(requests_path)
 
     event_id = ADSEventSchema.generate_id("req_upd")
     event = ADSEventSchema.create_event(
@@ -1007,7 +1017,7 @@ def get_enforcement_status():
     except:
         pass
         
-    events = res["query"].get_all_events()
+    events = current_app.get_ads_reader(res["paths"]["ads"]).get_events()
     denials = [e for e in events if not e.get("authorized", True)][-10:]
     status["recent_denials"] = denials
     return jsonify(status)
@@ -1153,7 +1163,7 @@ def get_delegations():
     res = _get_project_resources(project_name)
     
     # 1. Get from ADS
-    events = res["query"].get_all_events()
+    events = current_app.get_ads_reader(res["paths"]["ads"]).get_events()
     delegations = []
     
     for event in events:
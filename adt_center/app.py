@@ -1,4 +1,5 @@
 import os
+import threading
 
 import requests as http_client
 import markdown
@@ -6,8 +7,11 @@ from flask import Flask, render_template, request, abort, jsonify
 from flask_cors import CORS
 from markupsafe import Markup
 
+from adt_core.ads.columns import ADSColumnStore
 from adt_core.ads.query import ADSQuery
 from adt_core.ads.logger import ADSLogger
+from adt_core.ads.stream import ADSBroadcaster
+from adt_core.ads.tail import ADSTailReader
 from adt_core.sdd.registry import SpecRegistry
 from adt_core.sdd.tasks import TaskManager
 from adt_core.registry import ProjectRegistry
@@ -15,7 +19,9 @@ from adt_core.registry import ProjectRegistry
 
 def create_app():
     app = Flask(__name__)
-    CORS(app, origins=["tauri://localhost", "http://localhost:*", "http://127.0.0.1:*"])
+    # The console resumes /api/ads/stream from the X-ADS-Offset of its last read.
+    CORS(app, origins=["tauri://localhost", "http://localhost:*", "http://127.0.0.1:*"],
+         expose_headers=["X-ADS-Offset"])
     
     # 1. Project Registry Initialization
     app.project_registry = ProjectRegistry()
@@ -35,6 +41,44 @@ def create_app():
 
     app.get_project_paths = get_project_paths
 
+    # Long-lived ADS readers, one per ledger, so pages and polls only parse
+    # the events appended since the previous request.
+    app.ads_readers = {}
+    ads_readers_lock = threading.Lock()
+
+    def get_ads_reader(ads_path):
+        with ads_readers_lock:
+            reader = app.ads_readers.get(ads_path)
+            if reader is None:
+                reader = app.ads_readers[ads_path] = ADSTailReader(ads_path)
+            return reader
+
+    app.get_ads_reader = get_ads_reader
+
+    # Columnar stores for dashboard counts, kept per ledger like the readers.
+    app.ads_columns = {}
+
+    def get_ads_columns(ads_path):
+        with ads_readers_lock:
+            store = app.ads_columns.get(ads_path)
+            if store is None:
+                store = app.ads_columns[ads_path] = ADSColumnStore(ads_path)
+            return store
+
+    app.get_ads_columns = get_ads_columns
+
+    # One tailer per ledger shared by every /api/ads/stream subscriber.
+    app.ads_broadcasters = {}
+
+    def get_ads_broadcaster(ads_path):
+        with ads_readers_lock:
+            broadcaster = app.ads_broadcasters.get(ads_path)
+            if broadcaster is None:
+                broadcaster = app.ads_broadcasters[ads_path] = ADSBroadcaster(ads_path)
+            return broadcaster
+
+    app.get_ads_broadcaster = get_ads_broadcaster
+
     @app.before_request
     def check_remote_auth():
         token = os.environ.get('ADT_ACCESS_TOKEN')
@@ -110,15 +154,17 @@ def create_app():
         task_manager = TaskManager(paths["tasks"], project_name=paths["name"])
         spec_registry = SpecRegistry(paths["specs"])
         
-        events = query.get_all_events()
+        events = get_ads_reader(paths["ads"]).get_events()
         tasks = task_manager.list_tasks()
         specs = _enrich_specs(spec_registry.list_specs())
         
         active_sessions = query.get_active_sessions()
-        denials = sum(1 for e in events if not e.get("authorized", True))
+        columns = get_ads_columns(paths["ads"])
+        denials = columns.count(authorized=False)
         
         return render_template("dashboard.html",
                                events=events,
+                               event_count=columns.count(),
                                tasks=tasks,
                                specs=specs,
                                active_sessions=active_sessions,
@@ -128,8 +174,7 @@ def create_app():
     def ads_timeline():
         project_name = request.args.get("project")
         paths = get_project_paths(project_name)
-        query = ADSQuery(paths["ads"])
-        events = query.get_all_events()
+        events = get_ads_reader(paths["ads"]).get_events()
         return render_template("ads.html", events=events)
 
     @app.route("/specs")
@@ -227,8 +272,7 @@ def create_app():
                 except: pass
             if os.path.exists(paths["ads"]):
                 try:
-                    with open(paths["ads"], "r") as f:
-                        stats["ads_events"] = sum(1 for _ in f)
+                    stats["ads_events"] = ADSQuery(paths["ads"]).count_events()
                 except: pass
             enriched[name] = {**config, "dttp_running": dttp_running, "stats": stats}
         return enriched
@@ -259,12 +303,10 @@ def create_app():
     def dttp_monitor():
         project_name = request.args.get("project")
         paths = get_project_paths(project_name)
-        query = ADSQuery(paths["ads"])
-        
-        events = query.get_all_events()
+        events = get_ads_reader(paths["ads"]).get_events()
         dttp_actions = ['pending_edit', 'completed_edit', 'denied_edit']
         dttp_events = [e for e in events if e.get("action_type") in dttp_actions]
-        dttp_denied = [e for e in dttp_events if not e.get("authorized", True)]
+        dttp_stats = get_ads_columns(paths["ads"]).value_counts("authorized", action_type=dttp_actions)
         
         # Try to get DTTP service status
         dttp_status = None
@@ -283,7 +325,8 @@ def create_app():
             
         return render_template("dttp.html",
                                dttp_events=dttp_events,
-                               dttp_denied=dttp_denied,
+                               dttp_allowed=dttp_stats.get(True, 0),
+                               dttp_denied=dttp_stats.get(False, 0),
                                dttp_status=dttp_status)
 
     @app.route("/governance")
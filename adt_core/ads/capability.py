@@ -3,7 +3,9 @@ import json
 import hashlib
 import logging
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from adt_core import watch
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,21 @@ def validate_event(data: Dict[str, Any]) -> List[str]:
     return errors
 
 
+# Parsed JSONL files, kept until the file watcher reports a change.
+_jsonl_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+
+def _load_jsonl(file_path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(file_path):
+        return []
+    results = []
+    with open(file_path, "r") as f:
+        for line in f:
+            if line.strip():
+                results.append(json.loads(line))
+    return results
+
+
 class CapabilityManager:
     """Manages storage and retrieval of Capability Change Intents and Triggering Events."""
 
@@ -104,23 +121,19 @@ class CapabilityManager:
             data["ts"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         with open(file_path, "a") as f:
             f.write(json.dumps(data) + "\n")
+        watch.invalidate(file_path)
 
     def _read_jsonl(self, file_path: str) -> List[Dict[str, Any]]:
-        """Helper to read all lines from a JSONL file."""
-        if not os.path.exists(file_path):
-            return []
-        results = []
-        with open(file_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    results.append(json.loads(line))
-        return results
+        """Helper to read all lines from a JSONL file (cached until the file changes)."""
+        records = watch.get_watcher().load(file_path, _load_jsonl, _jsonl_cache)
+        return [dict(record) for record in records]
 
     def _rewrite_jsonl(self, file_path: str, records: List[Dict[str, Any]]):
         """Rewrite a JSONL file with updated records."""
         with open(file_path, "w") as f:
             for record in records:
                 f.write(json.dumps(record) + "\n")
+        watch.invalidate(file_path)
 
     def add_intent(self, intent_data: Dict[str, Any]) -> str:
         """Adds a new Capability Change Intent with SPEC-038A defaults."""
@@ -335,14 +348,8 @@ class GateManager:
         os.makedirs(os.path.dirname(self.gates_path), exist_ok=True)
 
     def _read_gates(self) -> List[Dict[str, Any]]:
-        if not os.path.exists(self.gates_path):
-            return []
-        results = []
-        with open(self.gates_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    results.append(json.loads(line))
-        return results
+        records = watch.get_watcher().load(self.gates_path, _load_jsonl, _jsonl_cache)
+        return [dict(record) for record in records]
 
     def _get_last_gate_hash(self, intent_id: str) -> str:
         """Get the hash of the last gate record for this intent."""
@@ -415,6 +422,7 @@ class GateManager:
 
         with open(self.gates_path, "a") as f:
             f.write(json.dumps(record) + "\n")
+        watch.invalidate(self.gates_path)
 
         # Determine intent status transition
         new_status = None
@@ -0,0 +1,357 @@
+import json
+import logging
+import math
+import os
+import threading
+import uuid
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from .crypto import decode_event
+from .segments import ADSSegments, DerivedStore, ledger_anchor
+
+# Optional vectorized backend. Columns are always held in array.array;
+# numpy only provides zero-copy views over them for the aggregations.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+# Dictionary-encoded string columns. Code 0 is reserved for "missing".
+STRING_COLUMNS = ["agent", "role", "action_type", "spec_ref"]
+
+# column -> array typecode
+_TYPECODES = {
+    "offset": "Q",      # logical byte offset of the event's ledger line
+    "ts": "d",          # epoch seconds, NaN when missing or unparsable
+    "authorized": "B",  # 1 unless the event has a falsy authorized
+    "tier": "h",        # -1 when missing
+}
+_TYPECODES.update({name: "I" for name in STRING_COLUMNS})
+
+_STORE_VERSION = 2
+
+
+class ADSColumnStore:
+    """
+    Derived columnar copy of an ADS ledger for dashboard aggregations.
+
+    Each column is a flat binary file of fixed-width values under
+    <ledger>.cols/, one row per event in ledger order. String columns are
+    dictionary-encoded: <column>.dict lists one JSON string per line and the
+    column stores the line number. Like ADSIndex, the store is extended with
+    the lines appended since the last refresh and is discarded and rebuilt
+    whenever the indexed prefix of the ledger changes, so it can be deleted
+    at any time.
+
+    Filters are passed as keyword arguments: a value, or a list/tuple/set of
+    accepted values, per column (e.g. action_type=["denied_edit"], authorized=False).
+    """
+
+    def __init__(self, file_path: str, store_dir: Optional[str] = None):
+        self.file_path = file_path
+        self.segments = ADSSegments(file_path)
+        self.store_dir = store_dir or file_path + ".cols"
+        self.store = DerivedStore(self.store_dir, _STORE_VERSION, "ADS column store")
+        self.meta_path = self.store.meta_path
+        self._lock = threading.Lock()
+        self._generation: Optional[str] = None
+        self._columns: Dict[str, array] = {}
+        self._dicts: Dict[str, List[Optional[str]]] = {}
+        self._codes: Dict[str, Dict[str, int]] = {}
+        self._dict_offsets: Dict[str, int] = {}
+        self._clear()
+
+    # --- Aggregations ---
+
+    def count(self, **where) -> int:
+        """Number of events matching the filters."""
+        with self._lock:
+            self._refresh()
+            mask = self._mask(where)
+            if mask is None:
+                return len(self._columns["offset"])
+            return int(mask.sum()) if numpy is not None else len(mask)
+
+    def value_counts(self, column: str, **where) -> Dict[Any, int]:
+        """Events per distinct value of a column (missing values are left out)."""
+        if column not in _TYPECODES or column in ("offset", "ts"):
+            raise ValueError(f"Cannot count values of ADS column: {column}")
+        with self._lock:
+            self._refresh()
+            values = self._columns[column]
+            mask = self._mask(where)
+            if numpy is not None:
+                view = numpy.frombuffer(values, dtype=values.typecode)
+                if mask is not None:
+                    view = view[mask]
+                if column in STRING_COLUMNS:
+                    totals = numpy.bincount(view, minlength=len(self._dicts[column]))
+                    return {self._dicts[column][code]: int(n) for code, n in enumerate(totals) if n and code}
+                keys, totals = numpy.unique(view, return_counts=True)
+                counts = dict(zip(keys.tolist(), totals.tolist()))
+            else:
+                counts = Counter(values if mask is None else (values[i] for i in mask))
+                if column in STRING_COLUMNS:
+                    return {self._dicts[column][code]: n for code, n in counts.items() if code}
+            if column == "authorized":
+                return {bool(k): v for k, v in counts.items()}
+            return {k: v for k, v in counts.items() if k != -1}
+
+    def histogram(self, bucket_seconds: int = 3600, since: Optional[str] = None,
+                  **where) -> List[Tuple[str, int]]:
+        """
+        Events per time bucket as (bucket start ISO timestamp, count) pairs in
+        time order. Empty buckets are omitted.
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        floor = _epoch(since) if since else None
+        with self._lock:
+            self._refresh()
+            ts = self._columns["ts"]
+            mask = self._mask(where)
+            if numpy is not None:
+                view = numpy.frombuffer(ts, dtype="d")
+                if mask is not None:
+                    view = view[mask]
+                view = view[~numpy.isnan(view)]
+                if floor is not None:
+                    view = view[view >= floor]
+                keys, totals = numpy.unique(numpy.floor_divide(view, bucket_seconds), return_counts=True)
+                buckets = zip(keys.tolist(), totals.tolist())
+            else:
+                rows = range(len(ts)) if mask is None else mask
+                counts = Counter(
+                    ts[i] // bucket_seconds for i in rows
+                    if not math.isnan(ts[i]) and (floor is None or ts[i] >= floor)
+                )
+                buckets = sorted(counts.items())
+            return [(_iso(int(key) * bucket_seconds), int(n)) for key, n in buckets]
+
+    def offsets(self, **where) -> List[int]:
+        """Logical ledger offsets of the matching events, for ADSQuery-style loading."""
+        with self._lock:
+            self._refresh()
+            offsets = self._columns["offset"]
+            mask = self._mask(where)
+            if mask is None:
+                return offsets.tolist()
+            if numpy is not None:
+                return numpy.frombuffer(offsets, dtype="Q")[mask].tolist()
+            return [offsets[i] for i in mask]
+
+    def refresh(self) -> int:
+        """Brings the store up to date with the ledger and returns the row count."""
+        with self._lock:
+            self._refresh()
+            return len(self._columns["offset"])
+
+    def rebuild(self):
+        """Discards the store and rebuilds it from the ledger."""
+        with self._lock:
+            with self._locked():
+                self.store.reset()
+            self._refresh()
+
+    def _mask(self, where: Dict[str, Any]):
+        """
+        Row selection for the filters: a boolean numpy array, a list of row
+        numbers without numpy, or None when nothing is filtered.
+        """
+        mask = None
+        for column, wanted in where.items():
+            if wanted is None:
+                continue
+            if column not in _TYPECODES or column in ("offset", "ts"):
+                raise ValueError(f"Cannot filter on ADS column: {column}")
+            if not isinstance(wanted, (list, tuple, set, frozenset)):
+                wanted = [wanted]
+            codes = self._encode_filter(column, wanted)
+            values = self._columns[column]
+            if numpy is not None:
+                view = numpy.frombuffer(values, dtype=values.typecode)
+                selected = numpy.isin(view, list(codes))
+                mask = selected if mask is None else mask & selected
+            else:
+                rows = range(len(values)) if mask is None else mask
+                mask = [i for i in rows if values[i] in codes]
+        return mask
+
+    def _encode_filter(self, column: str, wanted) -> set:
+        if column in STRING_COLUMNS:
+            codes = self._codes[column]
+            return {codes[key] for key in map(_dict_key, wanted) if key in codes}
+        if column == "authorized":
+            return {1 if value else 0 for value in wanted}
+        return {int(value) for value in wanted}
+
+    # --- Store maintenance ---
+
+    def _refresh(self):
+        with self._locked():
+            meta = self._update()
+            if meta.get("generation") != self._generation:
+                self._clear()
+                self._generation = meta.get("generation")
+            self._load(meta.get("count", 0))
+
+    def _update(self) -> Dict[str, Any]:
+        meta = self.store.read_meta()
+        try:
+            snapshot = self.segments.snapshot()
+        except FileNotFoundError:
+            if meta.get("indexed_offset"):
+                self.store.reset()
+                return {}
+            return meta
+        with snapshot:
+            return self._update_from(snapshot, meta)
+
+    def _update_from(self, ledger, meta: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.store.matches(meta, ledger):
+            self.store.reset()
+            meta = {"generation": uuid.uuid4().hex}
+
+        start = meta.get("indexed_offset", 0)
+        if ledger.size <= start:
+            return meta
+
+        dicts = self._read_dicts()
+        codes = {column: {key: code for code, key in enumerate(keys)} for column, keys in dicts.items()}
+        new_keys: Dict[str, List[str]] = {column: [] for column in STRING_COLUMNS}
+        rows = {column: array(code) for column, code in _TYPECODES.items()}
+        anchor = meta.get("anchor")
+        indexed_to = start
+        for line_start, line in ledger.iter_lines(start):
+            if not line.endswith(b"\n"):
+                break  # partial line still being written
+            indexed_to = line_start + len(line)
+            if not line.strip():
+                continue
+            anchor = ledger_anchor(line_start, line)
+            try:
+                event = decode_event(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(event, dict):
+                continue
+            rows["offset"].append(line_start)
+            rows["ts"].append(_epoch(event.get("ts")))
+            rows["authorized"].append(1 if event.get("authorized", True) else 0)
+            tier = event.get("tier")
+            rows["tier"].append(tier if type(tier) is int and -1 < tier < 32768 else -1)
+            for column in STRING_COLUMNS:
+                key = _dict_key(event.get(column))
+                if key is None:
+                    rows[column].append(0)
+                    continue
+                code = codes[column].get(key)
+                if code is None:
+                    code = codes[column][key] = len(codes[column])
+                    new_keys[column].append(key)
+                rows[column].append(code)
+
+        if indexed_to == start:
+            return meta
+
+        # Same crash protocol as ADSIndex: a pending marker forces a rebuild if
+        # the column files are left partially extended.
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.store.write_meta(dict(meta, version=_STORE_VERSION, pending=True))
+        for column, keys in new_keys.items():
+            if keys:
+                with open(self._dict_path(column), "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(key) + "\n" for key in keys)
+        for column, values in rows.items():
+            if values:
+                with open(self._column_path(column), "ab") as f:
+                    values.tofile(f)
+
+        meta = {
+            "version": _STORE_VERSION,
+            "generation": meta.get("generation") or uuid.uuid4().hex,
+            "indexed_offset": indexed_to,
+            "anchor": anchor,
+            "count": meta.get("count", 0) + len(rows["offset"]),
+        }
+        self.store.write_meta(meta)
+        return meta
+
+    def _load(self, count: int):
+        """Reads rows and dictionary entries added on disk since the last load."""
+        loaded = len(self._columns["offset"])
+        if count > loaded:
+            for column, values in self._columns.items():
+                with open(self._column_path(column), "rb") as f:
+                    f.seek(loaded * values.itemsize)
+                    values.frombytes(f.read((count - loaded) * values.itemsize))
+        for column in STRING_COLUMNS:
+            path = self._dict_path(column)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                f.seek(self._dict_offsets[column])
+                data = f.read()
+            end = data.rfind(b"\n") + 1
+            keys = self._dicts[column]
+            for line in data[:end].splitlines():
+                key = json.loads(line)
+                self._codes[column][key] = len(keys)
+                keys.append(key)
+            self._dict_offsets[column] += end
+
+    def _clear(self):
+        self._columns = {column: array(code) for column, code in _TYPECODES.items()}
+        self._dicts = {column: [None] for column in STRING_COLUMNS}
+        self._codes = {column: {} for column in STRING_COLUMNS}
+        self._dict_offsets = {column: 0 for column in STRING_COLUMNS}
+
+    def _read_dicts(self) -> Dict[str, List[Optional[str]]]:
+        dicts = {}
+        for column in STRING_COLUMNS:
+            keys: List[Optional[str]] = [None]
+            try:
+                with open(self._dict_path(column), "r", encoding="utf-8") as f:
+                    keys.extend(json.loads(line) for line in f if line.endswith("\n"))
+            except FileNotFoundError:
+                pass
+            dicts[column] = keys
+        return dicts
+
+    def _column_path(self, column: str) -> str:
+        return os.path.join(self.store_dir, column + ".col")
+
+    def _dict_path(self, column: str) -> str:
+        return os.path.join(self.store_dir, column + ".dict")
+
+    def _locked(self):
+        return self.store.lock()
+
+
+def _dict_key(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True)
+
+
+def _epoch(ts: Any) -> float:
+    if not isinstance(ts, str):
+        return math.nan
+    try:
+        parsed = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return math.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -1,15 +1,85 @@
 import hashlib
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+# Optional fast JSON decoder. Only decoding is delegated: the hash chain is
+# defined over json.dumps(sort_keys=True) output, whose byte layout
+# (", "/": " separators, ASCII escapes, float repr) no other encoder reproduces.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 GENESIS_HASH = "0" * 64
 
+# Equivalent to json.dumps(obj, sort_keys=True), without building an encoder per call.
+_canonical_encoder = json.JSONEncoder(sort_keys=True)
 
-def calculate_event_hash(event: Dict[str, Any], prev_hash: str) -> str:
-    """Calculates a SHA-256 hash of the event data chained to the previous hash."""
-    event_copy = {k: v for k, v in event.items() if k != "hash"}
-    event_json = json.dumps(event_copy, sort_keys=True)
+
+def canonical_json(event: Dict[str, Any]) -> str:
+    """Returns the canonical serialization of an event, excluding its 'hash' field."""
+    if "hash" in event:
+        event = dict(event)
+        del event["hash"]
+    return _canonical_encoder.encode(event)
+
+
+def hash_canonical(canonical: str, prev_hash: str) -> str:
+    """Hashes an event's canonical serialization chained to the previous hash."""
     hasher = hashlib.sha256()
     hasher.update(prev_hash.encode("utf-8"))
-    hasher.update(event_json.encode("utf-8"))
+    hasher.update(canonical.encode("utf-8"))
     return hasher.hexdigest()
+
+
+def calculate_event_hash(event: Dict[str, Any], prev_hash: str) -> str:
+    """Calculates a SHA-256 hash of the event data chained to the previous hash."""
+    return hash_canonical(canonical_json(event), prev_hash)
+
+
+def seal_event(event: Dict[str, Any], prev_hash: str) -> str:
+    """
+    Chains an event to prev_hash in place and returns its ledger line (without
+    newline). The canonical serialization is computed once and reused both
+    for the hash and for the line written to disk.
+    """
+    event["prev_hash"] = prev_hash
+    event.pop("hash", None)
+    canonical = _canonical_encoder.encode(event)
+    event["hash"] = hash_canonical(canonical, prev_hash)
+    return canonical[:-1] + ', "hash": "' + event["hash"] + '"}'
+
+
+def decode_event(line: Union[str, bytes]) -> Any:
+    """Parses one ledger line, using orjson when installed."""
+    if orjson is not None:
+        try:
+            event = orjson.loads(line)
+        except (ValueError, TypeError):
+            # orjson rejects some inputs the stdlib accepts (NaN, infinities,
+            # lone surrogates); let json decide.
+            pass
+        else:
+            # orjson (older releases at least) parses integers beyond 64 bits
+            # as floats, which would change the canonical form. Floats are
+            # rare in events, so any float sends the line to the stdlib.
+            kind = type(event)
+            if kind is not float and not ((kind is dict or kind is list) and _contains_float(event)):
+                return event
+    return json.loads(line)
+
+
+_SCALARS = (str, int, bool, type(None))
+
+
+def _contains_float(value: Any) -> bool:
+    items = value.values() if type(value) is dict else value
+    for item in items:
+        kind = type(item)
+        if kind in _SCALARS:
+            continue
+        if kind is float:
+            return True
+        if (kind is dict or kind is list) and _contains_float(item):
+            return True
+    return False
@@ -2,37 +2,43 @@ import json
 import os
 import shutil
 from datetime import datetime, timezone
-from .crypto import GENESIS_HASH, calculate_event_hash
+from .crypto import GENESIS_HASH, decode_event, seal_event
 from .schema import ADSEventSchema
+from .segments import ADSSegments
 
 def heal_ads(file_path: str):
     """
-    Reconstructs the ADS hash chain from genesis.
+    Reconstructs the ADS hash chain from genesis across all segments.
     Acknowledges gaps as a 'historical integrity reset'.
     """
+    segments = ADSSegments(file_path)
+    sealed = segments.sealed()
     backup_path = file_path + ".bak"
-    shutil.copy(file_path, backup_path)
+    if sealed:
+        # Back up the whole logical ledger, sealed segments included.
+        with segments.snapshot() as ledger, open(backup_path, "wb") as backup:
+            for _, line in ledger.iter_lines():
+                backup.write(line)
+    else:
+        shutil.copy(file_path, backup_path)
     print(f"Backup created at {backup_path}")
 
     healed_events = []
     prev_hash = GENESIS_HASH
 
-    with open(file_path, "r") as f:
-        for line_num, line in enumerate(f, 1):
+    with segments.snapshot() as ledger:
+        for line_num, (_, line) in enumerate(ledger.iter_lines(), 1):
             if not line.strip():
                 continue
             
             try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
+                event = decode_event(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 print(f"Skipping invalid JSON at line {line_num}")
                 continue
 
             # Update hashes
-            event["prev_hash"] = prev_hash
-            event["hash"] = calculate_event_hash(event, prev_hash)
-            
-            healed_events.append(event)
+            healed_events.append(seal_event(event, prev_hash))
             prev_hash = event["hash"]
 
     # Add the reset event
@@ -46,14 +52,21 @@ def heal_ads(file_path: str):
         authorized=True,
         tier=1
     )
-    reset_event["prev_hash"] = prev_hash
-    reset_event["hash"] = calculate_event_hash(reset_event, prev_hash)
-    healed_events.append(reset_event)
+    healed_events.append(seal_event(reset_event, prev_hash))
 
-    # Write back
+    # Write back. The healed chain is a single active file; the sealed
+    # segments it replaces are removed (they are preserved in the backup).
+    if sealed:
+        os.remove(segments.manifest_path)
     with open(file_path, "w") as f:
-        for event in healed_events:
-            f.write(json.dumps(event) + "\n")
+        for line in healed_events:
+            f.write(line + "\n")
+    for segment in sealed:
+        if segment.get("codec"):
+            os.remove(segment["stored_path"])
+            os.remove(segment["stored_path"] + ".idx")
+        else:
+            os.remove(segment["path"])
 
     print(f"ADS healed. {len(healed_events)} events written.")
 
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import logging
+import os
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+from .crypto import decode_event
+from .segments import ADSSegments, DerivedStore, ledger_anchor
+
+logger = logging.getLogger(__name__)
+
+INDEXED_FIELDS = ["agent", "role", "action_type", "spec_ref", "session_id", "intent_id"]
+
+_INDEX_VERSION = 2
+_ITEM_SIZE = 8  # posting entries are unsigned 64-bit logical byte offsets
+
+
+class ADSIndex:
+    """
+    Persistent secondary index over an ADS ledger.
+
+    For each indexed field value the index keeps a posting file of byte
+    offsets (<ledger>.idx/<field>/<key>.pos) pointing at the matching lines
+    of events.jsonl, plus all.pos listing every event. Posting files are
+    append-only and are extended with the lines appended since the last
+    indexed offset before every query. The ledger stays the source of truth:
+    if it is truncated or rewritten the index is discarded and rebuilt from
+    events.jsonl alone. Offsets are logical offsets across sealed segments
+    (see ADSSegments), so rotation only ever appends to the index.
+    """
+
+    def __init__(self, file_path: str, index_dir: Optional[str] = None):
+        self.file_path = file_path
+        self.segments = ADSSegments(file_path)
+        self.index_dir = index_dir or file_path + ".idx"
+        self.store = DerivedStore(self.index_dir, _INDEX_VERSION, "ADS index")
+        self.meta_path = self.store.meta_path
+
+    def query(self,
+              filters: Dict[str, Any],
+              limit: Optional[int] = None,
+              offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Returns matching events in ledger order, applying offset/limit over the matches."""
+        filters = {k: v for k, v in filters.items() if v}
+        with self._locked():
+            self._update()
+            with self.segments.snapshot() as ledger:
+                if len(filters) <= 1:
+                    return self._query_single(ledger, filters, limit, offset)
+                return self._query_many(ledger, filters, limit, offset)
+
+    def update(self):
+        """Indexes any events appended since the last update."""
+        with self._locked():
+            self._update()
+
+    def rebuild(self):
+        """Discards the index and rebuilds it from the ledger."""
+        with self._locked():
+            self.store.reset()
+            self._update()
+
+    # --- Query helpers ---
+
+    def _query_single(self, ledger, filters, limit, offset) -> List[Dict[str, Any]]:
+        if filters:
+            field, value = next(iter(filters.items()))
+            posting = self._posting_path(field, value)
+        else:
+            posting = self._all_path()
+        start = offset if offset else 0
+        count = limit if limit else None
+        return self._load_events(ledger, self._read_posting(posting, start, count), filters)
+
+    def _query_many(self, ledger, filters, limit, offset) -> List[Dict[str, Any]]:
+        postings = sorted(
+            (self._read_posting(self._posting_path(field, value)) for field, value in filters.items()),
+            key=len,
+        )
+        matches = set(postings[0])
+        for other in postings[1:]:
+            matches.intersection_update(other)
+            if not matches:
+                break
+        ordered = sorted(matches)
+        start = offset if offset else 0
+        end = start + limit if limit else len(ordered)
+        return self._load_events(ledger, ordered[start:end], filters)
+
+    def _load_events(self, ledger, offsets, filters) -> List[Dict[str, Any]]:
+        events = []
+        for pos in offsets:
+            try:
+                event = decode_event(ledger.read_line(pos))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            # Posting keys are digests; confirm the match against the event itself.
+            if all(event.get(field) == value for field, value in filters.items()):
+                events.append(event)
+        return events
+
+    def _read_posting(self, path: str, start: int = 0, count: Optional[int] = None) -> array:
+        offsets = array("Q")
+        try:
+            with open(path, "rb") as f:
+                f.seek(start * _ITEM_SIZE)
+                data = f.read(count * _ITEM_SIZE if count is not None else -1)
+        except FileNotFoundError:
+            return offsets
+        data = data[:len(data) - len(data) % _ITEM_SIZE]
+        offsets.frombytes(data)
+        return offsets
+
+    # --- Index maintenance ---
+
+    def _update(self):
+        meta = self.store.read_meta()
+        try:
+            snapshot = self.segments.snapshot()
+        except FileNotFoundError:
+            if meta.get("indexed_offset"):
+                self.store.reset()
+            return
+        with snapshot:
+            self._update_from(snapshot, meta)
+
+    def _update_from(self, ledger, meta: Dict[str, Any]):
+        if not self.store.matches(meta, ledger):
+            self.store.reset()
+            meta = self.store.read_meta()
+
+        start = meta.get("indexed_offset", 0)
+        if ledger.size <= start:
+            return
+
+        postings: Dict[Tuple[str, Any], array] = {}
+        all_offsets = array("Q")
+        anchor = meta.get("anchor")
+        indexed_to = start
+        for line_start, line in ledger.iter_lines(start):
+            if not line.endswith(b"\n"):
+                break  # partial line still being written
+            indexed_to = line_start + len(line)
+            if not line.strip():
+                continue
+            anchor = ledger_anchor(line_start, line)
+            try:
+                event = decode_event(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(event, dict):
+                continue
+            all_offsets.append(line_start)
+            for field in INDEXED_FIELDS:
+                value = event.get(field)
+                if value is None or value == "":
+                    continue
+                if not isinstance(value, str):
+                    value = "\x00" + json.dumps(value, sort_keys=True)
+                bucket = postings.get((field, value))
+                if bucket is None:
+                    bucket = postings[(field, value)] = array("Q")
+                bucket.append(line_start)
+
+        if indexed_to == start:
+            return
+
+        # Mark the index dirty while posting files are extended so that a crash
+        # part-way through forces a rebuild instead of leaving duplicate entries.
+        os.makedirs(self.index_dir, exist_ok=True)
+        self.store.write_meta(dict(meta, version=_INDEX_VERSION, pending=True))
+        self._append_posting(self._all_path(), all_offsets)
+        for (field, value), offsets in postings.items():
+            field_dir = os.path.join(self.index_dir, field)
+            os.makedirs(field_dir, exist_ok=True)
+            self._append_posting(os.path.join(field_dir, self._key(value) + ".pos"), offsets)
+
+        self.store.write_meta({
+            "version": _INDEX_VERSION,
+            "indexed_offset": indexed_to,
+            "anchor": anchor,
+            "count": meta.get("count", 0) + len(all_offsets),
+        })
+
+    @staticmethod
+    def _append_posting(path: str, offsets: array):
+        if offsets:
+            with open(path, "ab") as f:
+                offsets.tofile(f)
+
+    @staticmethod
+    def _key(value: Any) -> str:
+        # Strings hash as themselves; other JSON values by their canonical encoding.
+        if not isinstance(value, str):
+            value = "\x00" + json.dumps(value, sort_keys=True)
+        return hashlib.sha1(value.encode("utf-8")).hexdigest()[:24]
+
+    def _posting_path(self, field: str, value: Any) -> str:
+        return os.path.join(self.index_dir, field, self._key(value) + ".pos")
+
+    def _all_path(self) -> str:
+        return os.path.join(self.index_dir, "all.pos")
+
+    # --- Locking ---
+
+    def _locked(self):
+        return self.store.lock()
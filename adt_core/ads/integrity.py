@@ -1,51 +1,396 @@
+import hashlib
+import hmac
 import json
 import logging
-from typing import List, Tuple
+import os
+import secrets
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from .crypto import GENESIS_HASH, calculate_event_hash
+from .crypto import GENESIS_HASH, calculate_event_hash, decode_event
+from .segments import ADSSegments
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+CHECKPOINT_KEY_ENV = "ADT_ADS_CHECKPOINT_KEY"
+
 
 class ADSIntegrity:
     """Tools for verifying the integrity of the ADS hash chain."""
 
     @staticmethod
-    def verify_chain(file_path: str) -> Tuple[bool, List[str]]:
+    def verify_chain(file_path: str, parallel: int = 1) -> Tuple[bool, List[str]]:
         """
         Verifies the entire hash chain in the ADS file.
         Returns (is_valid, list_of_errors).
+
+        With parallel=N the ledger is verified in N worker processes; the
+        errors reported are identical to the serial walk.
+        """
+        result = ADSIntegrity.verify(file_path, full=True, write_checkpoints=False, jobs=parallel)
+        return result["valid"], result["errors"]
+
+    @staticmethod
+    def verify(file_path: str,
+               full: bool = False,
+               checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+               key: Optional[bytes] = None,
+               write_checkpoints: bool = True,
+               jobs: int = 1) -> Dict[str, Any]:
+        """
+        Verifies the hash chain, resuming from the latest trusted checkpoint.
+
+        Checkpoints (<ledger>.checkpoints) record the line number, byte offset
+        and hash of an event up to which the chain has been verified clean, and
+        are signed with HMAC-SHA256. A checkpoint is only trusted if its
+        signature is valid and the event ending at its offset still carries
+        its hash. With full=True the chain is walked from genesis regardless.
+        New checkpoints are written every `checkpoint_interval` events while
+        no error has been found (at chunk boundaries when jobs > 1). With
+        write_checkpoints=False nothing is written, not even a missing key;
+        without a key no checkpoint is trusted.
         """
-        errors = []
-        is_valid = True
-        prev_hash = GENESIS_HASH
+        store = CheckpointStore(file_path, key=key, create_key=write_checkpoints)
+        resumed = None if full else store.latest_trusted()
+
+        if resumed:
+            start_line, start_offset, prev_hash = resumed["line"], resumed["offset"], resumed["hash"]
+        else:
+            start_line, start_offset, prev_hash = 0, 0, GENESIS_HASH
 
         try:
-            with open(file_path, "r") as f:
-                for line_num, line in enumerate(f, 1):
-                    if not line.strip():
-                        continue
+            with ADSSegments(file_path).snapshot() as ledger:
+                size = ledger.size
+            if jobs > 1 and size - start_offset >= PARALLEL_MIN_BYTES:
+                errors, verified, new_checkpoints = _verify_parallel(
+                    file_path, start_line, start_offset, prev_hash, checkpoint_interval, jobs)
+            else:
+                errors, verified, new_checkpoints = _verify_serial(
+                    file_path, start_line, start_offset, prev_hash, checkpoint_interval)
+        except FileNotFoundError:
+            return {
+                "valid": False,
+                "errors": ["ADS file not found"],
+                "mode": "full" if full else "incremental",
+                "resumed_from": None,
+                "events_verified": 0,
+                "checkpoints_written": 0,
+            }
+
+        # A full walk replaces every checkpoint, so none survives past an error it found.
+        if write_checkpoints and (full or new_checkpoints):
+            kept = store.trusted_up_to(resumed) if resumed else []
+            store.write(kept + new_checkpoints)
+
+        return {
+            "valid": not errors,
+            "errors": errors,
+            "mode": "full" if full else "incremental",
+            "resumed_from": {k: resumed[k] for k in ("line", "offset", "hash")} if resumed else None,
+            "events_verified": verified,
+            "checkpoints_written": len(new_checkpoints) if write_checkpoints else 0,
+        }
+
+
+def _verify_serial(file_path: str, start_line: int, start_offset: int, prev_hash: str,
+                   checkpoint_interval: int) -> Tuple[List[str], int, List[Dict[str, Any]]]:
+    errors = []
+    verified = 0
+    since_checkpoint = 0
+    new_checkpoints = []
+
+    with ADSSegments(file_path).snapshot() as ledger:
+        for line_num, (line_offset, line) in enumerate(ledger.iter_lines(start_offset), start_line + 1):
+            offset = line_offset + len(line)
+            if not line.strip():
+                continue
+
+            verified += 1
+            try:
+                event = decode_event(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                errors.append(f"Line {line_num}: Invalid JSON")
+                continue
+
+            if event.get("prev_hash") != prev_hash:
+                errors.append(f"Line {line_num}: Broken chain link (expected prev_hash {prev_hash})")
+
+            expected_hash = calculate_event_hash(event, prev_hash)
+            if event.get("hash") != expected_hash:
+                errors.append(f"Line {line_num}: Invalid hash (expected {expected_hash})")
+
+            prev_hash = event.get("hash", "")
+
+            if not errors and line.endswith(b"\n"):
+                since_checkpoint += 1
+                if since_checkpoint >= checkpoint_interval:
+                    new_checkpoints.append({"line": line_num, "offset": offset, "hash": prev_hash})
+                    since_checkpoint = 0
+
+    return errors, verified, new_checkpoints
+
+
+# --- Parallel verification ---
+#
+# An event's hash depends only on its own content and the prev_hash it should
+# carry, and within a byte range the expected prev_hash of every event but the
+# first is the stored hash of the event before it. Workers therefore verify
+# newline-aligned ranges independently; only the first event of each range
+# waits for the final pass, which threads the running hash across ranges.
+
+PARALLEL_MIN_BYTES = 1 << 20
+_CHUNKS_PER_JOB = 4
+
+
+def _verify_parallel(file_path: str, start_line: int, start_offset: int, prev_hash: str,
+                     checkpoint_interval: int, jobs: int) -> Tuple[List[str], int, List[Dict[str, Any]]]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = _split_ranges(file_path, start_offset, jobs * _CHUNKS_PER_JOB)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(_verify_range, [(file_path, s, e) for s, e in ranges]))
+
+    errors = []
+    verified = 0
+    since_checkpoint = 0
+    new_checkpoints = []
+    line_base = start_line
+
+    for (range_start, range_end), res in zip(ranges, results):
+        range_errors = list(res["errors"])
+        first = res["first"]
+        if first is not None:
+            local_line, first_offset, stored_prev, stored_hash, expected_if_linked = first
+            if stored_prev != prev_hash:
+                range_errors.append((local_line, f"Broken chain link (expected prev_hash {prev_hash})"))
+                expected_hash = calculate_event_hash(_read_event(file_path, first_offset), prev_hash)
+            else:
+                expected_hash = expected_if_linked
+            if stored_hash != expected_hash:
+                range_errors.append((local_line, f"Invalid hash (expected {expected_hash})"))
+            prev_hash = res["last_hash"]
+
+        # Stable sort: a line's own errors keep their link-then-hash order.
+        range_errors.sort(key=lambda item: item[0])
+        errors.extend(f"Line {line_base + n}: {msg}" for n, msg in range_errors)
+        verified += res["verified"]
+        line_base += res["lines"]
 
+        if not errors:
+            since_checkpoint += res["events"]
+            if res["ends_with_event"] and since_checkpoint >= checkpoint_interval:
+                new_checkpoints.append({"line": line_base, "offset": range_end, "hash": prev_hash})
+                since_checkpoint = 0
+
+    return errors, verified, new_checkpoints
+
+
+def _split_ranges(file_path: str, start_offset: int, count: int) -> List[Tuple[int, int]]:
+    """Splits logical [start_offset, EOF) into up to `count` ranges that begin at line starts."""
+    with ADSSegments(file_path).snapshot() as ledger:
+        size = ledger.size
+        span = max(1, (size - start_offset) // max(1, count))
+        bounds = [start_offset]
+        target = start_offset + span
+        while target < size:
+            # finish the line that contains target - 1
+            pos = target - 1 + len(ledger.read_line(target - 1))
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+            target = max(pos, target) + span
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+
+
+def _read_event(file_path: str, offset: int) -> Dict[str, Any]:
+    with ADSSegments(file_path).snapshot() as ledger:
+        return decode_event(ledger.read_line(offset))
+
+
+def _verify_range(args: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Worker: verifies one logical byte range. Line numbers are relative to the range."""
+    file_path, start, end = args
+    with ADSSegments(file_path).snapshot() as ledger:
+        data = ledger.read(start, end)
+
+    pieces = data.split(b"\n")
+    ends_with_newline = data.endswith(b"\n")
+    if ends_with_newline:
+        pieces.pop()
+
+    errors = []
+    first = None
+    prev_hash = None
+    verified = 0
+    events = 0
+    ends_with_event = False
+    offset = start
+
+    for local_line, piece in enumerate(pieces, 1):
+        line_offset = offset
+        offset += len(piece) + 1
+        if not piece.strip():
+            ends_with_event = False
+            continue
+
+        verified += 1
+        try:
+            event = decode_event(piece)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            errors.append((local_line, "Invalid JSON"))
+            ends_with_event = False
+            continue
+
+        events += 1
+        ends_with_event = True
+        if first is None:
+            stored_prev = event.get("prev_hash")
+            expected = calculate_event_hash(event, stored_prev) if isinstance(stored_prev, str) else None
+            first = (local_line, line_offset, stored_prev, event.get("hash"), expected)
+        else:
+            if event.get("prev_hash") != prev_hash:
+                errors.append((local_line, f"Broken chain link (expected prev_hash {prev_hash})"))
+            expected_hash = calculate_event_hash(event, prev_hash)
+            if event.get("hash") != expected_hash:
+                errors.append((local_line, f"Invalid hash (expected {expected_hash})"))
+        prev_hash = event.get("hash", "")
+
+    return {
+        "lines": len(pieces),
+        "verified": verified,
+        "events": events,
+        "first": first,
+        "last_hash": prev_hash,
+        "errors": errors,
+        "ends_with_event": ends_with_event and ends_with_newline,
+    }
+
+
+class CheckpointStore:
+    """Signed verification checkpoints stored next to the ledger."""
+
+    def __init__(self, file_path: str, key: Optional[bytes] = None, path: Optional[str] = None,
+                 create_key: bool = True):
+        self.file_path = file_path
+        self.path = path or file_path + ".checkpoints"
+        self._key = key
+        self._create_key = create_key
+
+    @property
+    def key(self) -> Optional[bytes]:
+        """The HMAC key; None if there is none yet and create_key is False."""
+        if self._key is None:
+            self._key = load_checkpoint_key(create=self._create_key)
+        return self._key
+
+    def sign(self, line: int, offset: int, event_hash: str) -> str:
+        message = f"{line}:{offset}:{event_hash}".encode("utf-8")
+        return hmac.new(self.key, message, hashlib.sha256).hexdigest()
+
+    def read(self) -> List[Dict[str, Any]]:
+        checkpoints = []
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
                     try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        errors.append(f"Line {line_num}: Invalid JSON")
-                        is_valid = False
+                        cp = json.loads(line)
+                        checkpoints.append({
+                            "line": int(cp["line"]),
+                            "offset": int(cp["offset"]),
+                            "hash": str(cp["hash"]),
+                            "sig": str(cp["sig"]),
+                        })
+                    except (ValueError, KeyError, TypeError):
                         continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read ADS checkpoints {self.path}: {e}")
+        return checkpoints
 
-                    if event.get("prev_hash") != prev_hash:
-                        errors.append(f"Line {line_num}: Broken chain link (expected prev_hash {prev_hash})")
-                        is_valid = False
+    def latest_trusted(self) -> Optional[Dict[str, Any]]:
+        """Returns the newest checkpoint that is signed and still matches the ledger."""
+        checkpoints = self.read()
+        if not checkpoints or self.key is None:
+            return None
+        for cp in reversed(checkpoints):
+            if self._trusted(cp):
+                return cp
+        return None
 
-                    expected_hash = calculate_event_hash(event, prev_hash)
-                    if event.get("hash") != expected_hash:
-                        errors.append(f"Line {line_num}: Invalid hash (expected {expected_hash})")
-                        is_valid = False
+    def trusted_up_to(self, checkpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [cp for cp in self.read()
+                if cp["offset"] <= checkpoint["offset"] and self._signature_ok(cp)]
 
-                    prev_hash = event.get("hash", "")
+    def write(self, checkpoints: List[Dict[str, Any]]):
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                for cp in checkpoints:
+                    sig = self.sign(cp["line"], cp["offset"], cp["hash"])
+                    f.write(json.dumps({"line": cp["line"], "offset": cp["offset"],
+                                        "hash": cp["hash"], "sig": sig}) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write ADS checkpoints {self.path}: {e}")
 
-        except FileNotFoundError:
-            errors.append("ADS file not found")
-            return False, errors
+    def _signature_ok(self, cp: Dict[str, Any]) -> bool:
+        return hmac.compare_digest(cp["sig"], self.sign(cp["line"], cp["offset"], cp["hash"]))
+
+    def _trusted(self, cp: Dict[str, Any]) -> bool:
+        if not self._signature_ok(cp):
+            logger.warning(f"Ignoring ADS checkpoint at line {cp['line']} with an invalid signature")
+            return False
+        # The ledger must still hold the checkpointed event right before the offset.
+        if cp["offset"] <= 0:
+            return False
+        try:
+            with ADSSegments(self.file_path).snapshot() as ledger:
+                if cp["offset"] > ledger.size:
+                    return False
+                data = ledger.read(max(0, cp["offset"] - 65536), cp["offset"])
+        except OSError:
+            return False
+        if not data.endswith(b"\n"):
+            return False
+        last_line = data[:-1].rsplit(b"\n", 1)[-1]
+        try:
+            return json.loads(last_line).get("hash") == cp["hash"]
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            return False
+
+
+def load_checkpoint_key(key_path: Optional[str] = None, create: bool = True) -> Optional[bytes]:
+    """
+    Returns the HMAC key for ADS checkpoints: ADT_ADS_CHECKPOINT_KEY if set,
+    otherwise ~/.adt/ads_checkpoint.key, which is created on first use
+    (unless create is False; then None is returned).
+    """
+    env_key = os.environ.get(CHECKPOINT_KEY_ENV)
+    if env_key:
+        return env_key.encode("utf-8")
+
+    key_path = key_path or os.path.expanduser("~/.adt/ads_checkpoint.key")
+    try:
+        with open(key_path, "rb") as f:
+            key = f.read().strip()
+        if key:
+            return key
+    except FileNotFoundError:
+        pass
+    if not create:
+        return None
 
-        return is_valid, errors
+    key = secrets.token_hex(32).encode("ascii")
+    os.makedirs(os.path.dirname(key_path), exist_ok=True)
+    try:
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process created the key first; use theirs.
+        return load_checkpoint_key(key_path)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
@@ -1,8 +1,12 @@
+import asyncio
 import json
 import logging
 import os
+import queue
 import sys
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 # Cross-platform file locking
 try:
@@ -15,18 +19,74 @@ try:
 except ImportError:
     msvcrt = None
 
-from adt_core.ads.crypto import GENESIS_HASH, calculate_event_hash
+from adt_core.ads.crypto import GENESIS_HASH, decode_event, seal_event
 from adt_core.ads.schema import ADSEventSchema
+from adt_core.ads.segments import ADSSegments
 
 logger = logging.getLogger(__name__)
 
+
+class _PendingWrite:
+    """A queued event waiting for the group-commit writer to make it durable."""
+
+    __slots__ = ("event", "done", "error", "on_done")
+
+    def __init__(self, event: Dict[str, Any], on_done: Optional[Callable[["_PendingWrite"], None]] = None):
+        self.event = event
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.on_done = on_done  # called from the writer thread once committed (or failed)
+
+
 class ADSLogger:
-    def __init__(self, file_path: str):
+    """
+    Append-only writer for the ADS hash chain.
+
+    By default every log() call takes the file lock, appends one line and
+    fsyncs it. With group_commit=True, concurrent log() calls are queued and a
+    single writer thread chains them in arrival order, appends the whole batch
+    with one write() and one fsync, then releases every waiting caller. Each
+    caller still returns only once its event is durable on disk.
+
+    The hash of the last event is cached in memory and in a sidecar
+    (<ledger>.head) keyed by the ledger's inode, size and mtime, so appends
+    only read the tail of the file when another writer has touched it.
+
+    When max_segment_bytes or max_segment_events is set, the active file is
+    sealed into a numbered segment once it reaches either limit and a fresh
+    active file continues the chain (see ADSSegments). With segment_codec
+    set ("gzip" or "zstd"), sealed segments are then compressed in the
+    background.
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 group_commit: bool = False,
+                 max_batch_size: int = 256,
+                 max_wait_ms: float = 0.0,
+                 max_segment_bytes: int = 0,
+                 max_segment_events: int = 0,
+                 segment_codec: Optional[str] = None):
         self.file_path = file_path
+        self.head_path = file_path + '.head'
+        self.segments = ADSSegments(file_path)
+        self.max_segment_bytes = max(0, int(max_segment_bytes))
+        self.max_segment_events = max(0, int(max_segment_events))
+        self.segment_codec = segment_codec or None
+        self._compressor: Optional[threading.Thread] = None
+        # ((inode, size, mtime_ns), last hash, events in the active file or None if unknown)
+        self._head: Optional[Tuple[Tuple[int, int, int], str, Optional[int]]] = None
+        self.group_commit = group_commit
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: "queue.Queue[Optional[_PendingWrite]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        self.segments.recover()
         if not os.path.exists(self.file_path):
             with open(self.file_path, 'w') as f:
                 pass
@@ -36,41 +96,267 @@ class ADSLogger:
             return None
         with open(self.file_path, 'rb') as f:
             try:
-                f.seek(0, os.SEEK_END)
-                pos = f.tell()
-                while pos > 0:
-                    pos -= 1
-                    f.seek(pos)
-                    if f.read(1) == bytes([10]):
-                        line = f.readline()
-                        if line.strip(): return json.loads(line.decode('utf-8'))
-                f.seek(0)
-                line = f.readline()
-                if line.strip(): return json.loads(line.decode('utf-8'))
-            except (json.JSONDecodeError, OSError) as e:
+                line = self._read_last_line(f)
+                if line: return decode_event(line)
+            except (ValueError, OSError) as e:
                 logger.error(f"Error reading last event from {self.file_path}: {e}")
                 return None
         return None
 
+    @staticmethod
+    def _read_last_line(f, chunk_size: int = 8192) -> bytes:
+        """Returns the last non-empty line of a binary file, reading backwards in chunks."""
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        newline = bytes([10])
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+            stripped = data.rstrip()
+            if newline in stripped:
+                return stripped.rsplit(newline, 1)[1]
+        return data.strip()
+
+    def _head_key(self, st: os.stat_result) -> Tuple[int, int, int]:
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _current_head(self, f) -> Tuple[str, Optional[int]]:
+        """
+        Returns the hash of the last event in the ledger and the number of
+        events in the active file (None if unknown).
+
+        Must be called with the file lock held. The cached head is trusted only
+        while the file's inode, size and mtime still match what this logger last
+        wrote; otherwise the sidecar is consulted and, failing that, the tail of
+        the file is read. An empty active file chains to the last sealed segment.
+        """
+        key = self._head_key(os.fstat(f.fileno()))
+        if self._head is not None and self._head[0] == key:
+            return self._head[1], self._head[2]
+
+        sidecar = self._read_head_sidecar()
+        if sidecar is not None and sidecar[0] == key:
+            self._head = sidecar
+            return sidecar[1], sidecar[2]
+
+        if key[1] == 0:
+            prev_hash = self.segments.last_hash() or GENESIS_HASH
+            count = 0
+        else:
+            last_event = self._get_last_event()
+            prev_hash = last_event.get('hash', GENESIS_HASH) if last_event else GENESIS_HASH
+            count = None
+        self._head = (key, prev_hash, count)
+        return prev_hash, count
+
+    def _read_head_sidecar(self) -> Optional[Tuple[Tuple[int, int, int], str, Optional[int]]]:
+        try:
+            with open(self.head_path, 'r') as f:
+                data = json.load(f)
+            count = data.get('events')
+            return ((int(data['inode']), int(data['size']), int(data['mtime_ns'])), str(data['hash']),
+                    int(count) if count is not None else None)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable ADS head sidecar {self.head_path}: {e}")
+            return None
+
+    def _store_head(self, f, head_hash: str, count: Optional[int] = None):
+        key = self._head_key(os.fstat(f.fileno()))
+        self._head = (key, head_hash, count)
+        try:
+            with open(self.head_path, 'w') as hf:
+                json.dump({"hash": head_hash, "inode": key[0], "size": key[1], "mtime_ns": key[2],
+                           "events": count}, hf)
+        except OSError as e:
+            logger.warning(f"Could not update ADS head sidecar {self.head_path}: {e}")
+
     def log(self, event: Dict[str, Any]) -> str:
         if not ADSEventSchema.validate(event):
             raise ValueError('Event does not match schema')
-        
-        with open(self.file_path, 'a+') as f:
-            self._lock(f)
+
+        if not self.group_commit:
+            self._append([event])
+            return event['event_id']
+
+        pending = _PendingWrite(event)
+        self._ensure_writer()
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return event['event_id']
+
+    async def log_async(self, event: Dict[str, Any]) -> str:
+        """
+        log() for asyncio callers. The event goes through the group-commit
+        writer thread whatever group_commit is set to, so any number of
+        awaiting callers share that one thread instead of each blocking one.
+        """
+        if not ADSEventSchema.validate(event):
+            raise ValueError('Event does not match schema')
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(pending: _PendingWrite):
             try:
-                last_event = self._get_last_event()
-                prev_hash = last_event.get('hash', GENESIS_HASH) if last_event else GENESIS_HASH
-                event['prev_hash'] = prev_hash
-                event['hash'] = calculate_event_hash(event, prev_hash)
-                nl = chr(10)
-                f.write(json.dumps(event) + nl)
-                f.flush()
-                os.fsync(f.fileno())
-            finally:
-                self._unlock(f)
+                loop.call_soon_threadsafe(_settle, future, pending.error)
+            except RuntimeError:
+                pass  # the event loop is gone; nobody is waiting any more
+
+        self._ensure_writer()
+        self._queue.put(_PendingWrite(event, on_done=resolve))
+        await future
         return event['event_id']
 
+    def log_many(self, events: List[Dict[str, Any]]) -> List[str]:
+        """
+        Appends several events as one contiguous, atomic group: one write and
+        one fsync, and either all of them reach the ledger or none do.
+        """
+        for event in events:
+            if not ADSEventSchema.validate(event):
+                raise ValueError('Event does not match schema')
+        if events:
+            # Taken straight to the file lock, so the group never interleaves
+            # with a group-commit batch written by the writer thread.
+            self._append(events)
+        return [event['event_id'] for event in events]
+
+    def close(self):
+        """Flushes queued group-commit writes and stops the writer thread."""
+        with self._writer_lock:
+            writer = self._writer
+            if writer is not None:
+                self._queue.put(None)
+                writer.join()
+                self._writer = None
+        compressor = self._compressor
+        if compressor is not None:
+            compressor.join()
+
+    def _append(self, events: List[Dict[str, Any]]):
+        """Chains and appends events under the file lock with a single write and fsync."""
+        while True:
+            with open(self.file_path, 'a+') as f:
+                self._lock(f)
+                try:
+                    if self._rotated_away(f):
+                        continue  # another writer sealed this file while we waited
+                    prev_hash, count = self._current_head(f)
+                    lines = []
+                    for event in events:
+                        lines.append(seal_event(event, prev_hash))
+                        prev_hash = event['hash']
+                    nl = chr(10)
+                    f.write(nl.join(lines) + nl)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    count = count + len(events) if count is not None else None
+                    self._store_head(f, prev_hash, count)
+                    if self._segment_full(f, count):
+                        self.segments.seal_active(f)
+                        self._head = None
+                        self._start_compressor()
+                    return
+                finally:
+                    self._unlock(f)
+
+    def _start_compressor(self):
+        if not self.segment_codec:
+            return
+        if self._compressor is not None and self._compressor.is_alive():
+            return  # the running pass picks up every plain sealed segment
+        self._compressor = threading.Thread(
+            target=self._compress_sealed, name="ads-segment-compress", daemon=True
+        )
+        self._compressor.start()
+
+    def _compress_sealed(self):
+        try:
+            self.segments.compress(self.segment_codec)
+        except Exception as e:
+            logger.error(f"Compressing sealed ADS segments of {self.file_path} failed: {e}")
+
+    def _rotated_away(self, f) -> bool:
+        try:
+            return os.stat(self.file_path).st_ino != os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    def _segment_full(self, f, count: Optional[int]) -> bool:
+        if self.max_segment_bytes and os.fstat(f.fileno()).st_size >= self.max_segment_bytes:
+            return True
+        if self.max_segment_events:
+            if count is None:
+                with open(self.file_path, 'rb') as rf:
+                    count = sum(1 for line in rf if line.strip())
+                self._head = (self._head[0], self._head[1], count)
+            return count >= self.max_segment_events
+        return False
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="ads-group-commit", daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                # Drain whatever is already queued, then wait out the rest of
+                # the window for late arrivals.
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[_PendingWrite]):
+        try:
+            self._append([p.event for p in batch])
+        except (TypeError, ValueError) as e:
+            # Serialization failed before anything was written. Commit the
+            # events one at a time so a single bad event only fails its caller.
+            if len(batch) == 1:
+                batch[0].error = e
+            else:
+                for p in batch:
+                    self._commit_batch([p])
+        except BaseException as e:
+            logger.error(f"Group commit of {len(batch)} events to {self.file_path} failed: {e}")
+            for p in batch:
+                p.error = e
+        finally:
+            for p in batch:
+                p.done.set()
+                if p.on_done is not None:
+                    p.on_done(p)
+
     def _lock(self, f):
         if fcntl:
             fcntl.flock(f, fcntl.LOCK_EX)
@@ -82,3 +368,12 @@ class ADSLogger:
             fcntl.flock(f, fcntl.LOCK_UN)
         elif msvcrt:
             msvcrt.locking(f.fileno(), msvcrt.LK_ULOCK, 1)
+
+
+def _settle(future: "asyncio.Future", error: Optional[BaseException]):
+    if future.done():
+        return  # cancelled, or already settled by a per-event retry
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
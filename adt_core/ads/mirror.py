@@ -0,0 +1,341 @@
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from typing import Dict, Any, List, Optional, Tuple
+
+from .crypto import GENESIS_HASH, calculate_event_hash, decode_event
+from .segments import ADSSegments, anchor_matches, ledger_anchor
+
+logger = logging.getLogger(__name__)
+
+_MIRROR_VERSION = 2
+
+# Largest page search_ledger() returns.
+MAX_SEARCH_LIMIT = 1000
+
+# Columns copied out of each event so they can be filtered with an index.
+MIRRORED_FIELDS = ["event_id", "ts", "agent", "role", "action_type", "spec_ref", "session_id"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL UNIQUE,
+    event_id TEXT,
+    ts TEXT,
+    agent TEXT,
+    role TEXT,
+    action_type TEXT,
+    spec_ref TEXT,
+    session_id TEXT,
+    authorized INTEGER NOT NULL,
+    tier INTEGER,
+    prev_hash TEXT,
+    hash TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_agent ON events (agent);
+CREATE INDEX IF NOT EXISTS events_role ON events (role);
+CREATE INDEX IF NOT EXISTS events_action_type ON events (action_type);
+CREATE INDEX IF NOT EXISTS events_spec_ref ON events (spec_ref);
+CREATE INDEX IF NOT EXISTS events_session_id ON events (session_id);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS events_authorized ON events (authorized);
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5 (
+    description, rationale, details,
+    content='', tokenize='unicode61'
+);
+"""
+
+
+class ADSMirror:
+    """
+    Disposable SQLite mirror of an ADS ledger (<ledger>.sqlite).
+
+    Every event is copied into an indexed `events` table, keyed by its
+    logical ledger offset, and its description, rationale and the string
+    values of action_data/files_modified go into an FTS5 table. Ingestion
+    follows the ledger the same way ADSIndex does: lines appended since the
+    last ingested offset are added before every search, and if the ingested
+    prefix no longer matches the ledger the mirror is emptied and rebuilt.
+    The ledger stays the source of truth; verify() checks the mirrored
+    rows against the hash chain and the ledger itself.
+    """
+
+    def __init__(self, file_path: str, db_path: Optional[str] = None):
+        self.file_path = file_path
+        self.segments = ADSSegments(file_path)
+        self.db_path = db_path or file_path + ".sqlite"
+
+    def search(self,
+               text: Optional[str] = None,
+               agent: Optional[str] = None,
+               role: Optional[str] = None,
+               action_type: Optional[str] = None,
+               spec_ref: Optional[str] = None,
+               session_id: Optional[str] = None,
+               authorized: Optional[bool] = None,
+               since: Optional[str] = None,
+               until: Optional[str] = None,
+               limit: int = 100,
+               offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Returns matching events, newest first. `text` is split on whitespace
+        and every word must appear (as a phrase of its tokens) in the
+        description, rationale or action details.
+        """
+        clauses, params = [], []
+        for field, value in (("agent", agent), ("role", role), ("action_type", action_type),
+                             ("spec_ref", spec_ref), ("session_id", session_id)):
+            if value:
+                clauses.append(f"e.{field} = ?")
+                params.append(value)
+        if authorized is not None:
+            clauses.append("e.authorized = ?")
+            params.append(1 if authorized else 0)
+        if since:
+            clauses.append("e.ts >= ?")
+            params.append(since)
+        if until:
+            clauses.append("e.ts < ?")
+            params.append(until)
+        match = self._match_expression(text) if text else None
+        if match:
+            clauses.append("e.id IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)")
+            params.append(match)
+        elif text:
+            return []  # only punctuation: nothing can match
+
+        sql = "SELECT e.raw FROM events e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.offset DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._connect() as conn:
+            self._ingest(conn)
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(raw) for (raw,) in rows]
+
+    def update(self) -> int:
+        """Ingests any events appended since the last update; returns how many."""
+        with self._connect() as conn:
+            return self._ingest(conn)
+
+    def rebuild(self) -> int:
+        """Empties the mirror and ingests the whole ledger."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._clear(conn)
+            conn.execute("COMMIT")
+            return self._ingest(conn)
+
+    def verify(self) -> Tuple[bool, List[str]]:
+        """
+        Checks the mirror against the chain: every row's hash must match its
+        recomputed hash and link to the previous row, and each row must still
+        be the exact line at its offset in the ledger.
+        """
+        errors = []
+        with self._connect() as conn:
+            self._ingest(conn)
+            rows = conn.execute("SELECT offset, raw, prev_hash, hash FROM events ORDER BY offset")
+            try:
+                snapshot = self.segments.snapshot()
+            except FileNotFoundError:
+                return False, ["ADS file not found"]
+            with snapshot:
+                expected_prev = GENESIS_HASH
+                for offset, raw, prev_hash, stored_hash in rows:
+                    event = json.loads(raw)
+                    if prev_hash != expected_prev:
+                        errors.append(f"Offset {offset}: prev_hash does not link to the previous mirrored event")
+                    if calculate_event_hash(event, prev_hash or "") != stored_hash:
+                        errors.append(f"Offset {offset}: hash does not match mirrored content")
+                    try:
+                        line = snapshot.read_line(offset)
+                    except OSError as e:
+                        errors.append(f"Offset {offset}: {e}")
+                    else:
+                        if decode_event(line) != event:
+                            errors.append(f"Offset {offset}: mirrored event differs from the ledger")
+                    expected_prev = stored_hash
+        return not errors, errors
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            self._ingest(conn)
+            return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    # --- Ingestion ---
+
+    def _ingest(self, conn: sqlite3.Connection) -> int:
+        try:
+            snapshot = self.segments.snapshot()
+        except FileNotFoundError:
+            snapshot = None
+        if snapshot is None:
+            if self._meta(conn).get("indexed_offset"):
+                conn.execute("BEGIN IMMEDIATE")
+                self._clear(conn)
+                conn.execute("COMMIT")
+            return 0
+        with snapshot:
+            meta = self._meta(conn)
+            if meta.get("indexed_offset", 0) == snapshot.size and self._matches(meta, snapshot):
+                return 0  # fast path, without taking the write lock
+            # Re-read under the write lock: another process may have ingested.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                added = self._ingest_locked(conn, snapshot)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return added
+
+    def _ingest_locked(self, conn: sqlite3.Connection, ledger) -> int:
+        meta = self._meta(conn)
+        if not self._matches(meta, ledger):
+            self._clear(conn)
+            meta = {}
+        start = meta.get("indexed_offset", 0)
+        if ledger.size <= start:
+            return 0
+
+        rows, texts = [], []
+        anchor = meta.get("anchor")
+        indexed_to = start
+        for line_start, line in ledger.iter_lines(start):
+            if not line.endswith(b"\n"):
+                break  # partial line still being written
+            indexed_to = line_start + len(line)
+            if not line.strip():
+                continue
+            anchor = ledger_anchor(line_start, line)
+            try:
+                event = decode_event(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(event, dict):
+                continue
+            tier = event.get("tier")
+            rows.append(
+                [line_start]
+                + [_text(event.get(field)) for field in MIRRORED_FIELDS]
+                + [1 if event.get("authorized", True) else 0,
+                   tier if type(tier) is int else None,
+                   _text(event.get("prev_hash")),
+                   _text(event.get("hash")),
+                   line.decode("utf-8").rstrip("\r\n")]
+            )
+            texts.append((
+                line_start,
+                _text(event.get("description")) or "",
+                _text(event.get("rationale")) or "",
+                " ".join(_strings([event.get("action_data"), event.get("files_modified")])),
+            ))
+
+        if rows:
+            conn.executemany(
+                "INSERT INTO events (offset, event_id, ts, agent, role, action_type, spec_ref, session_id, "
+                "authorized, tier, prev_hash, hash, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT INTO events_fts (rowid, description, rationale, details) "
+                "SELECT id, ?, ?, ? FROM events WHERE offset = ?",
+                [(description, rationale, details, line_start)
+                 for line_start, description, rationale, details in texts],
+            )
+        self._set_meta(conn, {"version": _MIRROR_VERSION, "indexed_offset": indexed_to, "anchor": anchor})
+        if rows:
+            logger.debug(f"Mirrored {len(rows)} ADS events into {self.db_path}")
+        return len(rows)
+
+    @staticmethod
+    def _matches(meta: Dict[str, Any], ledger) -> bool:
+        """Checks that the ingested prefix of the ledger is still the same bytes."""
+        if not meta:
+            return True  # empty mirror
+        if meta.get("version") != _MIRROR_VERSION:
+            return False
+        return anchor_matches(meta, ledger)
+
+    # --- SQLite helpers ---
+
+    def _connect(self) -> closing:
+        # Autocommit mode; ingestion manages its own BEGIN IMMEDIATE/COMMIT.
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return closing(conn)
+
+    @staticmethod
+    def _meta(conn) -> Dict[str, Any]:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'state'").fetchone()
+        if row is None:
+            return {}
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return {"version": None}
+
+    @staticmethod
+    def _set_meta(conn, meta: Dict[str, Any]):
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('state', ?)", (json.dumps(meta),))
+
+    @staticmethod
+    def _clear(conn):
+        conn.execute("DELETE FROM events")
+        conn.execute("INSERT INTO events_fts (events_fts) VALUES ('delete-all')")
+        conn.execute("DELETE FROM meta")
+
+    @staticmethod
+    def _match_expression(text: str) -> Optional[str]:
+        # Each word becomes a quoted FTS5 phrase, so paths and punctuation
+        # (src/app.py, SPEC-017) match as token sequences instead of being
+        # parsed as query syntax.
+        phrases = ['"' + word.replace('"', '""') + '"' for word in text.split() if any(c.isalnum() for c in word)]
+        return " AND ".join(phrases) if phrases else None
+
+
+def search_ledger(ads_path: str, limit: int = 100, offset: int = 0, **filters) -> List[Dict[str, Any]]:
+    """
+    Search of /api/ads/search and `adt ads search`: checks the page
+    arguments, then runs ADSMirror.search() with the filters. Raises
+    ValueError for an out-of-range limit or offset.
+    """
+    if limit < 1 or limit > MAX_SEARCH_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    return ADSMirror(ads_path).search(limit=limit, offset=offset, **filters)
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True)
+
+
+def _strings(value: Any) -> List[str]:
+    """All string leaves of a JSON value, in order."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        found = []
+        for item in value:
+            found.extend(_strings(item))
+        return found
+    return []
@@ -1,49 +1,104 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from .crypto import decode_event
+from .index import ADSIndex
+from .segments import ADSSegments
 
 logger = logging.getLogger(__name__)
 
 class ADSQuery:
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self.segments = ADSSegments(file_path)
 
     def get_all_events(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Dict[str, Any]]:
         if limit is not None and offset is None:
             return self._tail_events(limit)
         events = []
         try:
-            with open(self.file_path, 'r') as f:
-                for i, line in enumerate(f):
+            with self.segments.snapshot() as snap:
+                for i, (_, line) in enumerate(snap.iter_lines()):
                     if not line.strip(): continue
                     if offset is not None and i < offset: continue
-                    try: events.append(json.loads(line))
-                    except json.JSONDecodeError: continue
+                    try: events.append(decode_event(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError): continue
                     if limit is not None and len(events) >= limit: break
         except FileNotFoundError: pass
         except Exception as e:
             logger.error(f"Error reading all events from {self.file_path}: {e}")
         return events
 
+    def read_since(self, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Parses only the complete lines appended after byte offset `offset`.
+        Returns (events, new_offset); pass new_offset to the next call. A
+        trailing line without its newline is left for the next call.
+
+        Offsets are logical: they run across sealed segments into the active
+        file, so a cursor is unaffected when the ledger rotates.
+        """
+        entries, new_offset = self.read_entries_since(offset)
+        return [event for _, event in entries], new_offset
+
+    def read_entries_since(self, offset: int = 0,
+                           end: Optional[int] = None) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
+        """
+        Like read_since, but pairs each event with the offset just past its
+        line, i.e. the offset to resume from after that event. With `end`,
+        reads only the complete lines before that offset.
+        """
+        entries = []
+        try:
+            with self.segments.snapshot() as snap:
+                data = snap.read(offset, end)
+        except FileNotFoundError:
+            return entries, offset
+        end = data.rfind(bytes([10]))
+        if end < 0:
+            return entries, offset
+        pos = offset
+        for line in data[:end + 1].splitlines(keepends=True):
+            pos += len(line)
+            if not line.strip(): continue
+            try: entries.append((pos, decode_event(line)))
+            except (json.JSONDecodeError, UnicodeDecodeError): continue
+        return entries, offset + end + 1
+
+    def size(self) -> int:
+        """Logical size in bytes of the ledger across all segments."""
+        try:
+            with self.segments.snapshot() as snap:
+                return snap.size
+        except FileNotFoundError:
+            return 0
+
+    def count_events(self) -> int:
+        """Number of non-blank lines in the ledger; sealed segments are counted from the manifest."""
+        count = sum(segment["events"] for segment in self.segments.sealed())
+        try:
+            with open(self.file_path, 'rb') as f:
+                count += sum(1 for line in f if line.strip())
+        except FileNotFoundError:
+            pass
+        return count
+
     def _tail_events(self, limit: int) -> List[Dict[str, Any]]:
         if limit <= 0: return []
         events = []
         try:
-            if not os.path.exists(self.file_path): return []
-            file_size = os.path.getsize(self.file_path)
-            if file_size == 0: return []
-            with open(self.file_path, 'rb') as f:
+            with self.segments.snapshot() as snap:
+                if snap.size == 0: return []
                 buffer_size = 4096
-                f.seek(0, os.SEEK_END)
-                pos = f.tell()
+                pos = snap.size
                 lines_found = 0
                 data = b''
                 newline = bytes([10])
                 while pos > 0 and lines_found <= limit:
                     seek_pos = max(0, pos - buffer_size)
-                    f.seek(seek_pos)
-                    chunk = f.read(pos - seek_pos)
+                    chunk = snap.read(seek_pos, pos)
                     data = chunk + data
                     lines_found += chunk.count(newline)
                     pos = seek_pos
@@ -51,21 +106,33 @@ class ADSQuery:
                 target_lines = all_lines[-limit:] if len(all_lines) > limit else all_lines
                 for line in target_lines:
                     if line.strip():
-                        try: events.append(json.loads(line))
+                        try: events.append(decode_event(line))
                         except json.JSONDecodeError: continue
         except FileNotFoundError: pass
         except (OSError, Exception) as e:
             logger.error(f"Error tailing events from {self.file_path}: {e}")
         return events
 
-    def filter_events(self, agent=None, role=None, action_type=None, spec_ref=None, limit=None, offset=None) -> List[Dict[str, Any]]:
+    def filter_events(self, agent=None, role=None, action_type=None, spec_ref=None, limit=None, offset=None,
+                      session_id=None, intent_id=None) -> List[Dict[str, Any]]:
+        filters = {
+            "agent": agent, "role": role, "action_type": action_type,
+            "spec_ref": spec_ref, "session_id": session_id, "intent_id": intent_id,
+        }
+        if os.path.exists(self.file_path):
+            try:
+                return ADSIndex(self.file_path).query(filters, limit=limit, offset=offset)
+            except OSError as e:
+                # e.g. read-only project checkout: fall back to a full scan
+                logger.warning(f"ADS index unavailable for {self.file_path}, scanning ledger: {e}")
+        return self._scan_filter(filters, limit=limit, offset=offset)
+
+    def _scan_filter(self, filters: Dict[str, Any], limit=None, offset=None) -> List[Dict[str, Any]]:
         all_events = self.get_all_events()
+        active = {k: v for k, v in filters.items() if v}
         filtered = []
         for event in all_events:
-            if agent and event.get('agent') != agent: continue
-            if role and event.get('role') != role: continue
-            if action_type and event.get('action_type') != action_type: continue
-            if spec_ref and event.get('spec_ref') != spec_ref: continue
+            if any(event.get(k) != v for k, v in active.items()): continue
             filtered.append(event)
         start = offset if offset else 0
         end = start + limit if limit else len(filtered)
@@ -79,33 +146,15 @@ class ADSQuery:
         """
         Counts active sessions by matching session_start and session_end events.
         """
-        details = self.get_active_sessions_details()
-        return len(details)
+        from .sessions import SessionTable
+        return SessionTable(self.file_path).count()
 
     def get_active_sessions_details(self) -> List[Dict[str, Any]]:
         """
         Returns a list of details for all currently active sessions.
-        """
-        all_events = self.get_all_events()
-        active_sessions = {}  # agent -> session_detail_dict
 
-        for event in all_events:
-            agent = event.get('agent')
-            action = event.get('action_type')
-            if not agent or not action:
-                continue
-            
-            if action == 'session_start':
-                active_sessions[agent] = {
-                    "agent": agent,
-                    "role": event.get("role"),
-                    "spec_id": event.get("spec_ref"),
-                    "session_id": event.get("session_id"),
-                    "ts": event.get("ts"),
-                    "sandbox": event.get("action_data", {}).get("sandbox", False)
-                }
-            elif action == 'session_end':
-                if agent in active_sessions:
-                    del active_sessions[agent]
-        
-        return list(active_sessions.values())
+        Served from the materialized session table, which only applies the
+        events appended since its last checkpoint.
+        """
+        from .sessions import SessionTable
+        return SessionTable(self.file_path).get_active()
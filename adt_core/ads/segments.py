@@ -0,0 +1,642 @@
+import bisect
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import zlib
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Cross-platform file locking
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Optional zstd codec for sealed segments; gzip is always available.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .crypto import calculate_event_hash, decode_event
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 1
+_READ_CHUNK = 1 << 20
+DEFAULT_BLOCK_SIZE = 256 * 1024
+# Seconds a manifest entry may wait for its rename before another process
+# treats the rotation as interrupted and finishes it.
+ROTATION_GRACE_SECONDS = 5
+
+CODEC_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def available_codecs() -> List[str]:
+    return ["gzip"] + (["zstd"] if zstandard is not None else [])
+
+
+def _compress_block(codec: str, data: bytes) -> bytes:
+    if codec == "gzip":
+        # Each block is a complete gzip member; the concatenation is still a
+        # valid .gz file that gunzip can read end to end.
+        c = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return c.compress(data) + c.flush()
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    raise ValueError(f"Unknown ADS segment codec: {codec}")
+
+
+def _decompress_block(codec: str, data: bytes) -> bytes:
+    if codec == "gzip":
+        return zlib.decompress(data, 31)
+    if codec == "zstd":
+        if zstandard is None:
+            raise OSError("ADS segment is zstd-compressed but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise OSError(f"Unknown ADS segment codec: {codec}")
+
+
+class ADSSegments:
+    """
+    Sealed segments of an ADS ledger.
+
+    The ledger path (events.jsonl) is always the active segment that receives
+    appends. When the logger rotates it, the active file is renamed to the
+    next sealed segment (events.000001.jsonl, events.000002.jsonl, ...) and
+    the segment's size, line and event counts and final hash are recorded in
+    events.manifest.json. The hash chain simply continues in the new active
+    segment, whose first event chains to the sealed segment's last hash.
+
+    Readers see the sealed segments followed by the active one as a single
+    logical file: byte offsets and line numbers run across segment
+    boundaries, so offset cursors and indexes are unaffected by rotation.
+    Sealed segments never change once recorded in the manifest, except that
+    compress() may replace one with a block-compressed copy of the same bytes
+    (events.000001.jsonl.gz plus a block index, events.000001.jsonl.gz.idx)
+    that readers decompress one block at a time.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        root, ext = os.path.splitext(file_path)
+        self._root = root
+        self._ext = ext or ".jsonl"
+        self.manifest_path = root + ".manifest.json"
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        self._cache_lock = threading.Lock()
+
+    # --- Manifest ---
+
+    def manifest(self) -> Dict[str, Any]:
+        """Returns the manifest, with each segment's logical start offset and line."""
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return {"version": _MANIFEST_VERSION, "segments": []}
+        key = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1]
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {"version": _MANIFEST_VERSION, "segments": []}
+        start = 0
+        start_line = 0
+        for segment in manifest.get("segments", []):
+            segment["path"] = os.path.join(os.path.dirname(self.file_path), segment["name"])
+            if segment.get("codec"):
+                segment["stored_path"] = segment["path"] + CODEC_EXTENSIONS[segment["codec"]]
+            segment["start"] = start
+            segment["start_line"] = start_line
+            start += segment["bytes"]
+            start_line += segment["lines"]
+        with self._cache_lock:
+            self._cache = (key, manifest)
+        return manifest
+
+    def sealed(self) -> List[Dict[str, Any]]:
+        return self.manifest().get("segments", [])
+
+    def last_hash(self) -> Optional[str]:
+        """Final hash of the newest sealed segment, or None if nothing is sealed."""
+        segments = self.sealed()
+        return segments[-1]["last_hash"] if segments else None
+
+    def segment_path(self, seq: int) -> str:
+        return f"{self._root}.{seq:06d}{self._ext}"
+
+    # --- Rotation ---
+
+    def seal_active(self, f) -> Dict[str, Any]:
+        """
+        Seals the active segment. `f` is the active file, open and locked by
+        the caller (ADSLogger) so no append can interleave.
+
+        The manifest entry is written before the rename; a reader that sees
+        the entry while the rename is still pending recognises the active
+        file by its inode and retries (see snapshot()).
+        """
+        st = os.fstat(f.fileno())
+        lines = events = 0
+        prev_hash = last_hash = None
+        with open(self.file_path, "rb") as rf:
+            for line in rf:
+                lines += 1
+                if not line.strip():
+                    continue
+                events += 1
+                try:
+                    event = decode_event(line)
+                except (ValueError, UnicodeDecodeError):
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                if prev_hash is None:
+                    prev_hash = event.get("prev_hash")
+                last_hash = event.get("hash", last_hash)
+
+        with self._manifest_lock():
+            return self._seal(st, lines, events, prev_hash, last_hash)
+
+    def _seal(self, st, lines, events, prev_hash, last_hash) -> Dict[str, Any]:
+        segments = self._stored_entries()
+        seq = segments[-1]["seq"] + 1 if segments else 1
+        entry = {
+            "seq": seq,
+            "name": os.path.basename(self.segment_path(seq)),
+            "bytes": st.st_size,
+            "lines": lines,
+            "events": events,
+            "prev_hash": prev_hash,
+            "last_hash": last_hash,
+            "inode": st.st_ino,
+            "sealed_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        }
+        self._write_manifest({"version": _MANIFEST_VERSION, "segments": segments + [entry]})
+        os.rename(self.file_path, self.segment_path(seq))
+        with open(self.file_path, "a"):
+            pass
+        logger.info(f"Sealed ADS segment {entry['name']} ({events} events, {st.st_size} bytes)")
+        return entry
+
+    def recover(self):
+        """
+        Completes a rotation interrupted between the manifest write and the
+        rename. Runs under the manifest lock, which seal_active holds across
+        both steps, and only once the entry is older than the grace period.
+        """
+        segments = self.sealed()
+        if not segments or self._segment_exists(segments[-1]):
+            return
+        with self._manifest_lock():
+            segments = self.sealed()
+            if not segments:
+                return
+            last = segments[-1]
+            if self._segment_exists(last) or not self._rotation_stale(last):
+                return
+            try:
+                st = os.stat(self.file_path)
+            except FileNotFoundError:
+                return
+            if st.st_ino == last.get("inode") and st.st_size == last["bytes"]:
+                os.rename(self.file_path, last["path"])
+                with open(self.file_path, "a"):
+                    pass
+                logger.warning(f"Completed interrupted ADS rotation of {last['name']}")
+
+    @staticmethod
+    def _rotation_stale(segment: Dict[str, Any]) -> bool:
+        sealed_at = segment.get("sealed_at")
+        try:
+            age = (datetime.now(timezone.utc) -
+                   datetime.fromisoformat(sealed_at.replace("Z", "+00:00"))).total_seconds()
+        except (AttributeError, ValueError):
+            return False
+        return age > ROTATION_GRACE_SECONDS
+
+    # --- Compression ---
+
+    def compress(self, codec: str = "gzip", block_size: int = DEFAULT_BLOCK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Compresses every sealed segment that is still stored plain. Blocks end
+        on line boundaries, so a block index of (logical offset, stored offset)
+        pairs lets readers seek to any line and decompress a single block.
+        Returns the manifest entries that were compressed.
+        """
+        _compress_block(codec, b"")  # fail early on an unavailable codec
+        done = []
+        for segment in self.sealed():
+            if segment.get("codec") or not os.path.exists(segment["path"]):
+                continue
+            stored_path = segment["path"] + CODEC_EXTENSIONS[codec]
+            stored_bytes = self._write_compressed(segment["path"], stored_path, codec, block_size)
+            error = self._verify_copy(dict(segment, codec=codec, stored_path=stored_path))
+            if error:
+                # Keep the plain segment; the next pass tries again.
+                for path in (stored_path, stored_path + ".idx"):
+                    if os.path.exists(path):
+                        os.remove(path)
+                logger.error(f"Not compressing ADS segment {segment['name']}: {error}")
+                continue
+            with self._manifest_lock():
+                entries = self._stored_entries()
+                entry = next((e for e in entries if e["seq"] == segment["seq"]), None)
+                if entry is None or entry.get("codec"):
+                    continue
+                entry["codec"] = codec
+                entry["stored_bytes"] = stored_bytes
+                self._write_manifest({"version": _MANIFEST_VERSION, "segments": entries})
+            # Readers holding the old manifest fall back to the compressed copy.
+            os.remove(segment["path"])
+            done.append(entry)
+            logger.info(f"Compressed ADS segment {entry['name']} with {codec}: "
+                        f"{segment['bytes']} -> {stored_bytes} bytes")
+        return done
+
+    @staticmethod
+    def _write_compressed(plain_path: str, stored_path: str, codec: str, block_size: int) -> int:
+        index = array("Q")
+        tmp_path = f"{stored_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_index = tmp_path + ".idx"
+        with open(plain_path, "rb") as src, open(tmp_path, "wb") as dst:
+            logical = stored = 0
+            pending = b""
+            while True:
+                chunk = src.read(block_size)
+                data = pending + chunk
+                if not data:
+                    break
+                if chunk:
+                    cut = data.rfind(b"\n") + 1
+                    if cut == 0:
+                        pending = data  # a single line longer than the block size
+                        continue
+                    block, pending = data[:cut], data[cut:]
+                else:
+                    block, pending = data, b""
+                compressed = _compress_block(codec, block)
+                index.extend((logical, stored))
+                dst.write(compressed)
+                logical += len(block)
+                stored += len(compressed)
+            index.extend((logical, stored))
+            dst.flush()
+            os.fsync(dst.fileno())
+        with open(tmp_index, "wb") as f:
+            index.tofile(f)
+        os.replace(tmp_index, stored_path + ".idx")
+        os.replace(tmp_path, stored_path)
+        return stored
+
+    @staticmethod
+    def _verify_copy(segment: Dict[str, Any]) -> Optional[str]:
+        """
+        Re-reads a compressed copy and checks its hash chain against the
+        manifest entry. Returns a description of the first problem, or None.
+        """
+        prev_hash = segment.get("prev_hash")
+        with LedgerSnapshot([segment], None) as copy:
+            if copy.size != segment["bytes"]:
+                return f"compressed copy holds {copy.size} bytes, expected {segment['bytes']}"
+            for offset, line in copy.iter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    event = decode_event(line)
+                except (ValueError, UnicodeDecodeError):
+                    return f"unreadable event at offset {offset} of the compressed copy"
+                if not isinstance(event, dict) or event.get("prev_hash") != prev_hash:
+                    return f"broken chain link at offset {offset} of the compressed copy"
+                if event.get("hash") != calculate_event_hash(event, prev_hash):
+                    return f"invalid hash at offset {offset} of the compressed copy"
+                prev_hash = event["hash"]
+        if prev_hash != segment.get("last_hash"):
+            return "compressed copy does not end at the segment's last hash"
+        return None
+
+    def _stored_entries(self) -> List[Dict[str, Any]]:
+        """Manifest entries without the fields derived on load."""
+        return [dict((k, v) for k, v in s.items() if k not in ("path", "stored_path", "start", "start_line"))
+                for s in self.sealed()]
+
+    @staticmethod
+    def _segment_exists(segment: Dict[str, Any]) -> bool:
+        return os.path.exists(segment.get("stored_path") or segment["path"])
+
+    def _manifest_lock(self):
+        return FileLock(self.manifest_path + ".lock")
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+        with self._cache_lock:
+            self._cache = None
+
+    # --- Reading ---
+
+    def snapshot(self) -> "LedgerSnapshot":
+        """
+        Returns a consistent view of the sealed segments plus the active file.
+        Retries while a rotation is in flight.
+        """
+        for _ in range(100):
+            sealed = self.sealed()
+            try:
+                active = open(self.file_path, "rb")
+            except FileNotFoundError:
+                if sealed and self._segment_exists(sealed[-1]):
+                    return LedgerSnapshot(sealed, None)
+                if not sealed:
+                    raise
+                time.sleep(0.001)
+                continue
+            if (sealed and not sealed[-1].get("codec")
+                    and os.fstat(active.fileno()).st_ino == sealed[-1].get("inode")):
+                # Manifest already lists the segment this file is about to become.
+                active.close()
+                self.recover_if_stale(sealed[-1])
+                time.sleep(0.001)
+                continue
+            if self.sealed() != sealed:
+                active.close()
+                continue
+            return LedgerSnapshot(sealed, active)
+        raise OSError(f"ADS ledger {self.file_path} kept rotating while being read")
+
+    def recover_if_stale(self, segment: Dict[str, Any]):
+        # A writer that crashed mid-rotation leaves the manifest ahead of the
+        # rename; recover() gives a live writer the grace period first.
+        if not self._rotation_stale(segment):
+            return
+        try:
+            self.recover()
+        except OSError as e:
+            logger.warning(f"Could not complete interrupted ADS rotation: {e}")
+
+
+class LedgerSnapshot:
+    """Read-only view of a segmented ledger addressed by logical byte offset."""
+
+    def __init__(self, sealed: List[Dict[str, Any]], active):
+        self._parts: List[Tuple[int, int, Any]] = []  # (start, size, segment entry or active file)
+        start = 0
+        for segment in sealed:
+            self._parts.append((start, segment["bytes"], segment))
+            start += segment["bytes"]
+        self.sealed_bytes = start
+        self.sealed_lines = sum(s["lines"] for s in sealed)
+        self._active = active
+        if active is not None:
+            size = os.fstat(active.fileno()).st_size
+            self._parts.append((start, size, active))
+            start += size
+        self.size = start
+        self._open: Dict[str, Any] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        for f in self._open.values():
+            f.close()
+        self._open.clear()
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+    def read(self, start: int, end: Optional[int] = None) -> bytes:
+        """Returns the logical bytes in [start, end)."""
+        end = self.size if end is None else min(end, self.size)
+        chunks = []
+        for part_start, part_size, source in self._parts:
+            part_end = part_start + part_size
+            if part_end <= start or part_start >= end:
+                continue
+            f = self._file(source)
+            lo = max(start, part_start) - part_start
+            hi = min(end, part_end) - part_start
+            f.seek(lo)
+            chunks.append(f.read(hi - lo))
+        return b"".join(chunks)
+
+    def read_line(self, offset: int) -> bytes:
+        """Returns the line starting at logical `offset`, including its newline."""
+        data = b""
+        pos = offset
+        while pos < self.size:
+            chunk = self.read(pos, pos + 4096)
+            nl = chunk.find(b"\n")
+            if nl >= 0:
+                return data + chunk[:nl + 1]
+            data += chunk
+            pos += len(chunk)
+        return data
+
+    def iter_lines(self, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+        """Yields (logical_offset, line) from `start`; lines keep their newline."""
+        pos = start
+        pending = b""
+        pending_at = start
+        while pos < self.size:
+            chunk = self.read(pos, pos + _READ_CHUNK)
+            if not chunk:
+                break
+            pos += len(chunk)
+            data = pending + chunk
+            lines = data.split(b"\n")
+            pending = lines.pop()
+            offset = pending_at
+            for line in lines:
+                yield offset, line + b"\n"
+                offset += len(line) + 1
+            pending_at = offset
+        if pending:
+            yield pending_at, pending
+
+    def _file(self, source):
+        if not isinstance(source, dict):
+            return source
+        f = self._open.get(source["name"])
+        if f is None:
+            f = self._open[source["name"]] = _open_segment(source)
+        return f
+
+
+class FileLock:
+    """Exclusive inter-process lock on a lock file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._f = open(self.path, "a+")
+        if fcntl:
+            fcntl.flock(self._f, fcntl.LOCK_EX)
+        elif msvcrt:
+            msvcrt.locking(self._f.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl:
+                fcntl.flock(self._f, fcntl.LOCK_UN)
+            elif msvcrt:
+                msvcrt.locking(self._f.fileno(), msvcrt.LK_ULOCK, 1)
+        finally:
+            self._f.close()
+        return False
+
+
+def ledger_anchor(line_start: int, line: bytes) -> Dict[str, Any]:
+    """Anchor a derived store records for the last ledger line it consumed."""
+    return {"offset": line_start, "digest": hashlib.sha1(line).hexdigest()}
+
+
+def anchor_matches(meta: Dict[str, Any], ledger: LedgerSnapshot) -> bool:
+    """Checks that the prefix of the ledger a derived store consumed is still the same bytes."""
+    if ledger.size < meta.get("indexed_offset", 0):
+        return False
+    anchor = meta.get("anchor")
+    if not anchor:
+        return True
+    try:
+        line = ledger.read_line(anchor["offset"])
+    except OSError:
+        return False
+    return hashlib.sha1(line).hexdigest() == anchor["digest"]
+
+
+class DerivedStore:
+    """
+    Directory of files derived from a ledger (ADSIndex, ADSColumnStore).
+
+    meta.json records the format version and how far the ledger was
+    consumed (indexed_offset and the anchor of the last line). Stores mark
+    the meta "pending" before extending their files, so a crash part-way
+    through forces a rebuild; reset() empties the directory for one.
+    """
+
+    def __init__(self, directory: str, version: int, label: str):
+        self.directory = directory
+        self.version = version
+        self.label = label
+        self.meta_path = os.path.join(directory, "meta.json")
+
+    def lock(self) -> FileLock:
+        return FileLock(os.path.join(self.directory, ".lock"))
+
+    def matches(self, meta: Dict[str, Any], ledger: LedgerSnapshot) -> bool:
+        if not meta or meta.get("pending"):
+            return False
+        if meta.get("version") != self.version:
+            return False
+        return anchor_matches(meta, ledger)
+
+    def reset(self):
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name == ".lock":
+                    continue
+                path = os.path.join(self.directory, name)
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+
+    def read_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable {self.label} metadata {self.meta_path}: {e}")
+            return {"version": None}
+
+    def write_meta(self, meta: Dict[str, Any]):
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+
+def _open_segment(segment: Dict[str, Any]):
+    """Opens a sealed segment for seek/read of its uncompressed bytes."""
+    if not segment.get("codec"):
+        try:
+            return open(segment["path"], "rb")
+        except FileNotFoundError:
+            # Compressed since this manifest was read; find the stored copy.
+            for codec, ext in CODEC_EXTENSIONS.items():
+                if os.path.exists(segment["path"] + ext):
+                    return _CompressedSegment(segment["path"] + ext, codec)
+            raise
+    return _CompressedSegment(segment["stored_path"], segment["codec"])
+
+
+class _CompressedSegment:
+    """File-like reader over a block-compressed segment (seek/read/close only)."""
+
+    def __init__(self, path: str, codec: str):
+        self.codec = codec
+        index = array("Q")
+        with open(path + ".idx", "rb") as f:
+            index.frombytes(f.read())
+        self._logical = index[0::2]
+        self._stored = index[1::2]
+        self._f = open(path, "rb")
+        self._pos = 0
+        self._block: Tuple[int, bytes] = (-1, b"")
+
+    def seek(self, pos: int):
+        self._pos = pos
+
+    def read(self, n: int) -> bytes:
+        out = []
+        end = min(self._pos + n, self._logical[-1])
+        while self._pos < end:
+            i = bisect.bisect_right(self._logical, self._pos) - 1
+            data = self._load(i)
+            lo = self._pos - self._logical[i]
+            piece = data[lo:lo + (end - self._pos)]
+            if not piece:
+                raise OSError(f"Block {i} of compressed ADS segment is shorter than its index says")
+            out.append(piece)
+            self._pos += len(piece)
+        return b"".join(out)
+
+    def _load(self, i: int) -> bytes:
+        if self._block[0] != i:
+            self._f.seek(self._stored[i])
+            raw = self._f.read(self._stored[i + 1] - self._stored[i])
+            self._block = (i, _decompress_block(self.codec, raw))
+        return self._block[1]
+
+    def close(self):
+        self._f.close()
@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+from .tail import LedgerCursor
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_VERSION = 1
+
+
+class SessionTable:
+    """
+    Materialized table of active agent sessions.
+
+    The table is keyed by agent, exactly like the session_start/session_end
+    pairing ADSQuery used to replay from the whole ledger: a session_start
+    opens (or replaces) the agent's session and a session_end closes it. The
+    table is advanced with only the events appended since the last refresh
+    and is checkpointed next to the ledger (<ledger>.sessions.json), so a
+    restarted process resumes from the checkpoint instead of replaying the
+    full ledger. If the ledger is replaced or rewritten the table is rebuilt.
+    """
+
+    def __init__(self, file_path: str, checkpoint_path: Optional[str] = None):
+        self.file_path = file_path
+        self.checkpoint_path = checkpoint_path or file_path + ".sessions.json"
+        self._cursor = LedgerCursor(file_path)
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load_checkpoint()
+
+    def refresh(self):
+        """Applies events appended since the last refresh."""
+        with self._lock:
+            self._refresh()
+
+    def get_active(self) -> List[Dict[str, Any]]:
+        """
+        Returns the active sessions with their role, spec, sandbox flag, the
+        number of events the agent has logged in the session and its duration.
+        """
+        with self._lock:
+            self._refresh()
+            now = datetime.now(timezone.utc)
+            sessions = []
+            for session in self._active.values():
+                details = dict(session)
+                details["duration_seconds"] = _seconds_between(session.get("ts"), now)
+                sessions.append(details)
+            return sessions
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._active)
+
+    def _refresh(self):
+        events, reset = self._cursor.read()
+        if reset:
+            self._active = {}
+        if not events and not reset:
+            return
+        for event in events:
+            self._apply(event)
+        self._save_checkpoint()
+
+    def _apply(self, event: Dict[str, Any]):
+        agent = event.get('agent')
+        action = event.get('action_type')
+        if not agent or not action:
+            return
+
+        if action == 'session_start':
+            action_data = event.get("action_data")
+            self._active[agent] = {
+                "agent": agent,
+                "role": event.get("role"),
+                "spec_id": event.get("spec_ref"),
+                "session_id": event.get("session_id"),
+                "ts": event.get("ts"),
+                "sandbox": action_data.get("sandbox", False) if isinstance(action_data, dict) else False,
+                "event_count": 1,
+                "last_ts": event.get("ts"),
+            }
+        elif action == 'session_end':
+            self._active.pop(agent, None)
+        else:
+            session = self._active.get(agent)
+            if session is not None:
+                session["event_count"] += 1
+                session["last_ts"] = event.get("ts")
+
+    # --- Checkpoint ---
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session checkpoint {self.checkpoint_path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != _CHECKPOINT_VERSION:
+            return
+        try:
+            self._cursor = LedgerCursor.from_dict(self.file_path, data["cursor"])
+            self._active = {s["agent"]: s for s in data["sessions"]}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed session checkpoint {self.checkpoint_path}: {e}")
+            self._cursor = LedgerCursor(self.file_path)
+            self._active = {}
+
+    def _save_checkpoint(self):
+        data = {
+            "version": _CHECKPOINT_VERSION,
+            "cursor": self._cursor.to_dict(),
+            "sessions": list(self._active.values()),
+        }
+        tmp_path = f"{self.checkpoint_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            logger.warning(f"Could not write session checkpoint {self.checkpoint_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _seconds_between(ts: Optional[str], now: datetime) -> Optional[float]:
+    if not ts:
+        return None
+    try:
+        start = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return max(0.0, round((now - start).total_seconds(), 3))
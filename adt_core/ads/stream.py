@@ -0,0 +1,219 @@
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+
+from .query import ADSQuery
+from .tail import LedgerCursor
+
+logger = logging.getLogger(__name__)
+
+# Per-subscriber backlog; a subscriber that falls this far behind is dropped
+# and is expected to reconnect with its last offset.
+SUBSCRIBER_QUEUE_SIZE = 10000
+
+# Bytes of backlog a resuming subscriber reads from the ledger at a time.
+REPLAY_PAGE_BYTES = 1024 * 1024
+
+
+class ADSBroadcaster:
+    """
+    Fans newly appended ADS events out to any number of subscribers.
+
+    One background thread per ledger follows the file with a LedgerCursor
+    and hands each event, tagged with the logical offset just past its line,
+    to every matching subscriber. Offsets double as resume tokens: a
+    subscriber that passes the last offset it saw first receives everything
+    appended after it, then the live events, with nothing missed or
+    repeated. The backlog is read page by page by the subscriber itself as
+    it consumes, so neither the lock nor its queue ever holds it whole. The
+    thread runs only while someone is subscribed.
+    """
+
+    def __init__(self, file_path: str, poll_interval: float = 0.5):
+        self.file_path = file_path
+        self.poll_interval = poll_interval
+        self._query = ADSQuery(file_path)
+        self._cursor: Optional[LedgerCursor] = None
+        self._subscribers: List["Subscription"] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def offset(self) -> int:
+        """Offset up to which events have been published."""
+        with self._lock:
+            return self._cursor.offset if self._cursor else self._last_line_end()
+
+    def subscribe(self, since: Optional[int] = None,
+                  filters: Optional[Dict[str, Any]] = None) -> "Subscription":
+        """
+        Registers a subscriber. With `since`, events after that offset are
+        replayed first; otherwise only events appended from now on arrive.
+        An offset beyond the ledger (it was rewritten since) gets a "reset".
+        """
+        with self._lock:
+            if self._cursor is None:
+                self._cursor = LedgerCursor(self.file_path)
+                self._cursor.seek(self._last_line_end())
+            current = self._cursor.offset
+            sub = Subscription(self, filters, after=current)
+            if since is not None and since > current:
+                sub._control("reset", current)
+            elif since is not None and since < current:
+                sub._replay_from, sub._replay_to = since, current  # the tail thread publishes the rest
+            self._subscribers.append(sub)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"ads-broadcast:{self.file_path}", daemon=True
+                )
+                self._thread.start()
+        return sub
+
+    def poll(self):
+        """Publishes anything appended since the last poll (also run by the tail thread)."""
+        with self._lock:
+            if self._cursor is None:
+                return
+            entries, reset = self._cursor.read_entries()
+            if reset:
+                # The ledger was rewritten (e.g. healed); offsets before this
+                # point are meaningless now. Skip to the end and tell everyone.
+                end = self._cursor.offset
+                for sub in self._subscribers:
+                    sub._control("reset", end)
+                return
+            for end, event in entries:
+                for sub in self._subscribers:
+                    sub._offer(end, event)
+
+    def notify(self):
+        """Wakes the tail thread early, e.g. from a file-change notification."""
+        self._wake.set()
+
+    def _last_line_end(self) -> int:
+        """Offset just past the last complete line of the ledger."""
+        try:
+            snapshot = self._query.segments.snapshot()
+        except FileNotFoundError:
+            return 0
+        with snapshot:
+            end = snapshot.size
+            while end > 0:
+                start = max(0, end - 65536)
+                newline = snapshot.read(start, end).rfind(b"\n")
+                if newline >= 0:
+                    return start + newline + 1
+                end = start
+            return 0
+
+    def _unsubscribe(self, sub: "Subscription"):
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+            if not self._subscribers:
+                self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            with self._lock:
+                if not self._subscribers:
+                    # Forget the cursor: the next subscriber starts from "now".
+                    self._thread = None
+                    self._cursor = None
+                    return
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"ADS broadcast for {self.file_path} failed to read the ledger: {e}")
+
+
+class Subscription:
+    """A subscriber's queue of (kind, offset, event) messages."""
+
+    def __init__(self, broadcaster: ADSBroadcaster, filters: Optional[Dict[str, Any]] = None,
+                 after: int = 0):
+        self._broadcaster = broadcaster
+        self.filters = {k: v for k, v in (filters or {}).items() if v}
+        self.overflowed = False
+        self._after = after  # offsets up to here were already seen
+        self._replay_from = self._replay_to = after  # backlog still to read from the ledger
+        self._replayed: deque = deque()
+        self._queue: "queue.Queue[Tuple[str, int, Optional[Dict[str, Any]]]]" = queue.Queue(SUBSCRIBER_QUEUE_SIZE)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[str, int, Optional[Dict[str, Any]]]]:
+        """
+        Next message, or None on timeout. Kinds are "event", "reset" (the
+        ledger was rewritten) and "overflow" (the subscriber fell behind and
+        was dropped; reconnect from the last offset).
+        """
+        if self._replayed or self._replay_from < self._replay_to:
+            message = self._next_replayed()
+            if message is not None:
+                return message
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._broadcaster._unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _next_replayed(self) -> Optional[Tuple[str, int, Optional[Dict[str, Any]]]]:
+        query = self._broadcaster._query
+        while not self._replayed and self._replay_from < self._replay_to:
+            start = self._replay_from
+            entries, read_to = query.read_entries_since(start, min(start + REPLAY_PAGE_BYTES, self._replay_to))
+            if read_to == start:  # a line longer than a page
+                entries, read_to = query.read_entries_since(start, self._replay_to)
+                if read_to == start:
+                    break
+            self._replayed.extend(("event", end, event) for end, event in entries if self._matches(event))
+            self._replay_from = read_to
+        return self._replayed.popleft() if self._replayed else None
+
+    def _matches(self, event: Dict[str, Any]) -> bool:
+        return all(event.get(k) == v for k, v in self.filters.items())
+
+    def _offer(self, end: int, event: Dict[str, Any]):
+        if self.overflowed or end <= self._after:
+            return
+        if not self._matches(event):
+            return
+        try:
+            self._queue.put_nowait(("event", end, event))
+        except queue.Full:
+            self._drop()
+
+    def _control(self, kind: str, offset: int):
+        if self.overflowed:
+            return
+        if kind == "reset":
+            self._after = offset
+            self._replay_to = self._replay_from  # the backlog's offsets are meaningless now
+            self._replayed.clear()
+        try:
+            self._queue.put_nowait((kind, offset, None))
+        except queue.Full:
+            self._drop()
+
+    def _drop(self):
+        self.overflowed = True
+        logger.warning(f"ADS stream subscriber fell {SUBSCRIBER_QUEUE_SIZE} events behind; dropping it")
+        # Make room for the notice so the consumer learns why it stopped.
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put_nowait(("overflow", 0, None))
@@ -0,0 +1,154 @@
+import base64
+import logging
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from .query import ADSQuery
+
+logger = logging.getLogger(__name__)
+
+_ANCHOR_BYTES = 96
+
+
+class LedgerCursor:
+    """
+    Byte-offset cursor over an ADS ledger.
+
+    read() returns the events appended since the previous call. Offsets are
+    logical (see ADSSegments), so rotating the active segment is invisible.
+    If the ledger is truncated (size below the cursor) or replaced or
+    rewritten (the bytes just before the cursor changed, e.g. after heal_ads),
+    the cursor restarts at offset 0 and read() reports the reset so the
+    caller can discard whatever it derived from the old contents.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._query = ADSQuery(file_path)
+        self.offset = 0
+        self._anchor: Optional[Tuple[int, bytes]] = None
+        self.resets = 0
+
+    def read(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """Returns (new_events, was_reset)."""
+        entries, reset = self.read_entries()
+        return [event for _, event in entries], reset
+
+    def read_entries(self) -> Tuple[List[Tuple[int, Dict[str, Any]]], bool]:
+        """Returns ([(end_offset, event), ...], was_reset); see ADSQuery.read_entries_since."""
+        reset = False
+        try:
+            snapshot = self._query.segments.snapshot()
+        except FileNotFoundError:
+            if self.offset:
+                self._reset("ledger removed")
+                return [], True
+            return [], False
+
+        with snapshot:
+            size = snapshot.size
+            if size < self.offset:
+                reset = self._reset("ledger truncated")
+            elif not self._anchor_intact(snapshot):
+                reset = self._reset("ledger rewritten")
+
+        if size == self.offset:
+            return [], reset
+        entries, new_offset = self._query.read_entries_since(self.offset)
+        if new_offset != self.offset:
+            self.offset = new_offset
+            self._anchor = self._read_anchor(new_offset)
+        return entries, reset
+
+    def seek(self, offset: int):
+        """Moves the cursor to `offset`, which must be the start of a line."""
+        self.offset = offset
+        self._anchor = self._read_anchor(offset) if offset else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable cursor state for checkpoints."""
+        anchor = None
+        if self._anchor is not None:
+            anchor = {"start": self._anchor[0], "bytes": base64.b64encode(self._anchor[1]).decode("ascii")}
+        return {"offset": self.offset, "anchor": anchor}
+
+    @classmethod
+    def from_dict(cls, file_path: str, data: Dict[str, Any]) -> "LedgerCursor":
+        cursor = cls(file_path)
+        cursor.offset = int(data.get("offset", 0))
+        anchor = data.get("anchor")
+        if anchor:
+            cursor._anchor = (int(anchor["start"]), base64.b64decode(anchor["bytes"]))
+        return cursor
+
+    def _reset(self, reason: str) -> bool:
+        logger.info(f"ADS cursor for {self.file_path} restarting from offset 0: {reason}")
+        self.offset = 0
+        self._anchor = None
+        self.resets += 1
+        return True
+
+    def _read_anchor(self, end: int) -> Optional[Tuple[int, bytes]]:
+        start = max(0, end - _ANCHOR_BYTES)
+        try:
+            with self._query.segments.snapshot() as snapshot:
+                return start, snapshot.read(start, end)
+        except OSError:
+            return None
+
+    def _anchor_intact(self, snapshot) -> bool:
+        if self._anchor is None:
+            return True
+        start, expected = self._anchor
+        try:
+            return snapshot.read(start, start + len(expected)) == expected
+        except OSError:
+            return False
+
+
+class ADSTailReader:
+    """
+    Long-lived reader that keeps a parsed copy of an ADS ledger in memory.
+
+    Each refresh parses only the bytes appended since the previous call; a
+    replaced, truncated or rewritten ledger is re-read from the start.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._cursor = LedgerCursor(file_path)
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def offset(self) -> int:
+        """Byte offset just past the last complete line that has been read."""
+        return self._cursor.offset
+
+    @property
+    def resets(self) -> int:
+        """Number of times the reader detected a rewritten ledger and started over."""
+        return self._cursor.resets
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        """Reads newly appended events and returns them."""
+        with self._lock:
+            return self._refresh()
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        """Returns all events in the ledger, refreshing first."""
+        with self._lock:
+            self._refresh()
+            return list(self._events)
+
+    def get_last_events(self, limit: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            return self._events[-limit:] if limit > 0 else []
+
+    def _refresh(self) -> List[Dict[str, Any]]:
+        new_events, reset = self._cursor.read()
+        if reset:
+            self._events = []
+        self._events.extend(new_events)
+        return new_events
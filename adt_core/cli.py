@@ -543,6 +543,9 @@ def install_hooks(project_path: str, framework_root: str):
     claude_dir = os.path.join(project_path, ".claude")
     claude_settings = os.path.join(claude_dir, "settings.local.json")
     claude_hook = os.path.join(framework_root, "adt_sdk", "hooks", "claude_pretool.py")
+    # The shim asks the project's hook daemon (hookd.py) when one is running
+    # and otherwise runs the hook above in-process.
+    hook_shim = os.path.join(framework_root, "adt_sdk", "hooks", "pretool_shim.py")
     
     if os.path.exists(claude_hook):
         os.makedirs(claude_dir, exist_ok=True)
@@ -555,11 +558,13 @@ def install_hooks(project_path: str, framework_root: str):
         
         hooks = settings.get("hooks", {})
         pre_tool = hooks.get("PreToolUse", [])
-        claude_cmd = f"python3 {claude_hook}"
+        claude_cmd = f"python3 -S {hook_shim} claude"
         # Check both nested format (correct) and flat format (legacy)
         if not any(
-            claude_hook in (h.get("command", ""), next((sub.get("command", "") for sub in h.get("hooks", [])), ""))
+            hook in command
             for h in pre_tool
+            for command in (h.get("command", ""), next((sub.get("command", "") for sub in h.get("hooks", [])), ""))
+            for hook in (claude_hook, claude_cmd)
         ):
             pre_tool.append({
                 "matcher": "Write|Edit|NotebookEdit",
@@ -587,11 +592,13 @@ def install_hooks(project_path: str, framework_root: str):
 
         hooks = settings.get("hooks", {})
         before_tool = hooks.get("BeforeTool", [])
-        gemini_cmd = f"python3 {gemini_hook}"
+        gemini_cmd = f"python3 -S {hook_shim} gemini"
         # Check both nested format (correct) and flat format (legacy)
         if not any(
-            gemini_hook in (h.get("command", ""), next((sub.get("command", "") for sub in h.get("hooks", [])), ""))
+            hook in command
             for h in before_tool
+            for command in (h.get("command", ""), next((sub.get("command", "") for sub in h.get("hooks", [])), ""))
+            for hook in (gemini_hook, gemini_cmd)
         ):
             before_tool.append({
                 "matcher": "write_file|replace",
@@ -671,8 +678,8 @@ def projects_command(args):
         ads_path = os.path.join(project.get("path"), "_cortex", "ads", "events.jsonl")
         if os.path.exists(ads_path):
             try:
-                with open(ads_path, "r") as f:
-                    count = sum(1 for _ in f)
+                from adt_core.ads.query import ADSQuery
+                count = ADSQuery(ads_path).count_events()
                 print(f"ADS:     {count} events")
             except: pass
             
@@ -778,6 +785,75 @@ def requests_command(args):
         else:
             print(f"ERROR: {result.get('error', 'Unknown error')}")
 
+def ads_command(args):
+    from adt_core.ads.integrity import ADSIntegrity
+
+    if args.subcommand == 'verify':
+        ads_path = args.path or os.path.join(os.getcwd(), '_cortex', 'ads', 'events.jsonl')
+        result = ADSIntegrity.verify(ads_path, full=args.full, jobs=args.jobs)
+        resumed = result['resumed_from']
+        if resumed:
+            print(f"Resumed from checkpoint at line {resumed['line']} (offset {resumed['offset']})")
+        else:
+            print("Verified from genesis")
+        print(f"Events verified: {result['events_verified']}")
+        if result['valid']:
+            print("ADS Integrity: VERIFIED")
+        else:
+            print("ADS Integrity: FAILED")
+            for error in result['errors']:
+                print(f"  - {error}")
+            sys.exit(1)
+
+    elif args.subcommand == 'compact':
+        from adt_core.ads.segments import ADSSegments
+        ads_path = args.path or os.path.join(os.getcwd(), '_cortex', 'ads', 'events.jsonl')
+        try:
+            compressed = ADSSegments(ads_path).compress(args.codec)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        if not compressed:
+            print("No uncompressed sealed segments.")
+        for entry in compressed:
+            ratio = entry['bytes'] / max(1, entry['stored_bytes'])
+            print(f"{entry['name']}: {entry['bytes']} -> {entry['stored_bytes']} bytes ({ratio:.1f}x)")
+
+    elif args.subcommand == 'search':
+        from adt_core.ads.mirror import search_ledger
+        ads_path = args.path or os.path.join(os.getcwd(), '_cortex', 'ads', 'events.jsonl')
+        authorized = {'allowed': True, 'denied': False}.get(args.status)
+        try:
+            events = search_ledger(
+                ads_path,
+                text=' '.join(args.text) or None,
+                agent=args.agent,
+                role=args.role,
+                action_type=args.action_type,
+                spec_ref=args.spec,
+                session_id=args.session,
+                authorized=authorized,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                offset=args.offset,
+            )
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        if args.json:
+            print(json.dumps(events, indent=2))
+            return
+        if not events:
+            print("No matching events.")
+        for event in events:
+            flag = "" if event.get('authorized', True) else " [DENIED]"
+            print(f"{event.get('ts', '')[:19]}  {event.get('agent', '')}/{event.get('role', '')}  "
+                  f"{event.get('action_type', '')}{flag}  {event.get('spec_ref') or ''}")
+            description = event.get('description') or event.get('rationale') or ''
+            if description:
+                print(f"    {description[:160]}")
+
 def main():
     parser = argparse.ArgumentParser(prog='adt', description='ADT Framework CLI')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
@@ -826,6 +902,34 @@ def main():
     requests_complete.add_argument('id', help='Request ID (e.g. REQ-001)')
     requests_complete.add_argument('--status', '-s', default='COMPLETED', help='Status to set (default: COMPLETED)')
 
+    # ads group
+    ads_parser = subparsers.add_parser('ads', help='Inspect the Authoritative Data Source')
+    ads_sub = ads_parser.add_subparsers(dest='subcommand', help='ADS subcommands')
+
+    ads_verify = ads_sub.add_parser('verify', help='Verify the ADS hash chain')
+    ads_verify.add_argument('--full', action='store_true', help='Walk the chain from genesis, ignoring checkpoints')
+    ads_verify.add_argument('--jobs', '-j', type=int, default=1, help='Verify in N worker processes (default: 1)')
+    ads_verify.add_argument('--path', help='Path to events.jsonl (default: ./_cortex/ads/events.jsonl)')
+
+    ads_compact = ads_sub.add_parser('compact', help='Compress sealed ADS segments')
+    ads_compact.add_argument('--codec', choices=['gzip', 'zstd'], default='gzip', help='Compression codec (default: gzip)')
+    ads_compact.add_argument('--path', help='Path to events.jsonl (default: ./_cortex/ads/events.jsonl)')
+
+    ads_search = ads_sub.add_parser('search', help='Full-text search of ADS events (newest first)')
+    ads_search.add_argument('text', nargs='*', help='Words that must appear in the description, rationale or action details')
+    ads_search.add_argument('--agent', help='Filter by agent')
+    ads_search.add_argument('--role', help='Filter by role')
+    ads_search.add_argument('--action-type', dest='action_type', help='Filter by action type')
+    ads_search.add_argument('--spec', help='Filter by spec reference')
+    ads_search.add_argument('--status', choices=['allowed', 'denied'], help='Filter by authorization outcome')
+    ads_search.add_argument('--session', help='Filter by session id')
+    ads_search.add_argument('--since', help='Only events at or after this ISO timestamp')
+    ads_search.add_argument('--until', help='Only events before this ISO timestamp')
+    ads_search.add_argument('--limit', type=int, default=50, help='Maximum events to show (default: 50, at most 1000)')
+    ads_search.add_argument('--offset', type=int, default=0, help='Skip this many matching events (default: 0)')
+    ads_search.add_argument('--json', action='store_true', help='Print matching events as JSON')
+    ads_search.add_argument('--path', help='Path to events.jsonl (default: ./_cortex/ads/events.jsonl)')
+
     # connect group
     connect_parser = subparsers.add_parser('connect', help='Manage remote access')
     connect_sub = connect_parser.add_subparsers(dest='subcommand', help='Connect subcommands')
@@ -866,6 +970,11 @@ def main():
         tasks_command(args)
     elif args.command == 'requests':
         requests_command(args)
+    elif args.command == 'ads':
+        if args.subcommand:
+            ads_command(args)
+        else:
+            ads_parser.print_help()
     else:
         parser.print_help()
 
@@ -1,9 +1,14 @@
+import asyncio
 import logging
 import os
 import shutil
-from typing import Dict, Any
+import tempfile
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-from adt_core.dttp.sync import GitSync
+from adt_core.dttp.sync import AsyncGitSync, GitSync
+
+if TYPE_CHECKING:
+    from adt_core.dttp.commit_queue import CommitQueue
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +16,11 @@ logger = logging.getLogger(__name__)
 class ActionHandler:
     """Handles execution of authorized DTTP actions."""
 
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, commit_queue: Optional["CommitQueue"] = None):
         self.project_root = os.path.realpath(project_root)
         self.git_sync = GitSync(self.project_root)
+        # When set, file changes are committed and pushed in the background.
+        self.commit_queue = commit_queue
 
     def _resolve_path(self, relative_path: str) -> str:
         """Resolves a relative path and ensures it stays within project_root."""
@@ -22,10 +29,12 @@ class ActionHandler:
             raise PermissionError(f"Path escapes project root: {relative_path}")
         return resolved
 
-    def execute(self, action: str, params: Dict[str, Any], agent: str = None, role: str = None) -> Dict[str, Any]:
+    def execute(self, action: str, params: Dict[str, Any], agent: str = None, role: str = None,
+                spec_id: str = None) -> Dict[str, Any]:
         """Dispatches action to the appropriate handler."""
         self.current_agent = agent
         self.current_role = role
+        self.current_spec = spec_id
         handler_name = f"_handle_{action}"
         if hasattr(self, handler_name):
             handler = getattr(self, handler_name)
@@ -40,58 +49,121 @@ class ActionHandler:
         return {"status": "error", "message": f"Unknown action: {action}"}
 
     def _handle_edit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._auto_sync(*self._edit_file(params))
+
+    def _handle_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._handle_edit(params)
+
+    def _handle_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._auto_sync(*self._delete_file(params))
+
+    def _handle_patch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handles partial file edits (old_string -> new_string replacement)."""
+        return self._auto_sync(*self._patch_file(params))
+
+    def _auto_sync(self, result: Dict[str, Any], sync: Optional[Tuple[str, str]]) -> Dict[str, Any]:
+        self._sync(sync, self.current_agent, self.current_role, self.current_spec)
+        return result
+
+    def _sync(self, sync: Optional[Tuple[str, str]], agent: str, role: str, spec_id: str):
+        if sync and self.commit_queue is not None:
+            self.commit_queue.submit(sync[0], sync[1], agent=agent, role=role, spec_id=spec_id)
+        elif sync:
+            self.git_sync.commit_and_push(sync[0], sync[1], agent=agent, role=role)
+
+    def execute_atomically(self, changes: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], bool]:
+        """
+        Applies file changes ({"action", "params", "agent", "role", "spec_id"},
+        actions from FILE_CHANGES) as a unit. Each target is snapshotted
+        before it is changed; if a change fails, the earlier ones are undone
+        and nothing is committed. Returns (results, ok): undone changes
+        report status "rolled_back" and changes never attempted None.
+        """
+        snapshots: List[_FileSnapshot] = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(changes)
+        syncs = []
+        ok = True
+        try:
+            for i, change in enumerate(changes):
+                params = change["params"]
+                try:
+                    snapshots.append(_FileSnapshot(self._resolve_path(params["file"])))
+                    result, sync = self.apply_file_change(change["action"], params)
+                except PermissionError as e:
+                    logger.warning("Permission denied: %s", e)
+                    result, sync = {"status": "denied", "message": str(e)}, None
+                except Exception as e:
+                    logger.error("Action %s failed: %s", change["action"], e)
+                    result, sync = {"status": "error", "message": str(e)}, None
+                results[i] = result
+                syncs.append(sync)
+                if result.get("status") != "success":
+                    ok = False
+                    break
+
+            if not ok:
+                for snapshot in reversed(snapshots):
+                    try:
+                        snapshot.restore()
+                    except OSError as e:
+                        logger.error("Could not roll back %s: %s", snapshot.path, e)
+                failed = len(syncs) - 1
+                for i in range(failed):
+                    results[i] = {"status": "rolled_back", "message": f"batch item {failed} failed"}
+                return results, False
+        finally:
+            for snapshot in snapshots:
+                snapshot.discard()
+
+        for change, sync in zip(changes, syncs):
+            self._sync(sync, change.get("agent"), change.get("role"), change.get("spec_id"))
+        return results, True
+
+    # --- File changes ---
+    # Each returns (result, sync): sync is the (path, message) to commit
+    # afterwards, or None if nothing changed.
+
+    def apply_file_change(self, action: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Tuple[str, str]]]:
+        """Applies an edit/create/delete/patch to the working tree without committing it."""
+        return FILE_CHANGES[action](self, params)
+
+    def _edit_file(self, params: Dict[str, Any]):
         file_path = self._resolve_path(params["file"])
         content = params["content"]
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, "w") as f:
             f.write(content)
-        
-        # Auto-Sync
-        self.git_sync.commit_and_push(file_path, f"edit {params["file"]}", agent=self.current_agent, role=self.current_role)
-        
-        return {"status": "success", "result": "file_written", "bytes": len(content)}
-
-    def _handle_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return self._handle_edit(params)
+        return {"status": "success", "result": "file_written", "bytes": len(content)}, (file_path, f"edit {params['file']}")
 
-    def _handle_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _delete_file(self, params: Dict[str, Any]):
         file_path = self._resolve_path(params["file"])
         if os.path.isdir(file_path):
             shutil.rmtree(file_path)
         else:
             os.remove(file_path)
-            
-        # Auto-Sync
-        self.git_sync.commit_and_push(params["file"], f"delete {params["file"]}", agent=self.current_agent, role=self.current_role)
-        
-        return {"status": "success", "result": "file_deleted"}
+        return {"status": "success", "result": "file_deleted"}, (params["file"], f"delete {params['file']}")
 
-    def _handle_patch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Handles partial file edits (old_string -> new_string replacement)."""
+    def _patch_file(self, params: Dict[str, Any]):
         file_path = self._resolve_path(params["file"])
         old_string = params["old_string"]
         new_string = params["new_string"]
 
         if not os.path.isfile(file_path):
-            return {"status": "error", "message": f"File not found: {params['file']}"}
+            return {"status": "error", "message": f"File not found: {params['file']}"}, None
 
         with open(file_path, "r") as f:
             content = f.read()
 
         count = content.count(old_string)
         if count == 0:
-            return {"status": "error", "message": "old_string not found in file"}
+            return {"status": "error", "message": "old_string not found in file"}, None
         if count > 1:
-            return {"status": "error", "message": f"old_string is ambiguous ({count} matches)"}
+            return {"status": "error", "message": f"old_string is ambiguous ({count} matches)"}, None
 
         new_content = content.replace(old_string, new_string, 1)
         with open(file_path, "w") as f:
             f.write(new_content)
-            
-        # Auto-Sync
-        self.git_sync.commit_and_push(file_path, f"patch {params["file"]}", agent=self.current_agent, role=self.current_role)
-
-        return {"status": "success", "result": "file_patched", "bytes": len(new_content)}
+        return {"status": "success", "result": "file_patched", "bytes": len(new_content)}, (file_path, f"patch {params['file']}")
 
     def _handle_deploy(self, params: Dict[str, Any]) -> Dict[str, Any]:
         return {"status": "success", "result": "deploy_simulated", "target": params.get("target")}
@@ -131,3 +203,114 @@ class ActionHandler:
         if self.git_sync._run_git(["tag", "-a", tag_name, "-m", message]):
             return {"status": "success", "result": f"tag {tag_name} created"}
         return {"status": "error", "message": "Tag creation failed"}
+
+
+class _FileSnapshot:
+    """A path's state before a batch changed it, so the change can be undone."""
+
+    __slots__ = ("path", "data", "tree")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data: Optional[bytes] = None
+        self.tree: Optional[str] = None
+        if os.path.isdir(path):
+            self.tree = tempfile.mkdtemp(prefix="adt-batch-")
+            shutil.copytree(path, os.path.join(self.tree, "saved"))
+        elif os.path.isfile(path):
+            with open(path, "rb") as f:
+                self.data = f.read()
+
+    def restore(self):
+        if os.path.isdir(self.path) and not os.path.islink(self.path):
+            shutil.rmtree(self.path)
+        elif os.path.lexists(self.path):
+            os.remove(self.path)
+        if self.tree is not None:
+            shutil.copytree(os.path.join(self.tree, "saved"), self.path)
+        elif self.data is not None:
+            with open(self.path, "wb") as f:
+                f.write(self.data)
+
+    def discard(self):
+        if self.tree is not None:
+            shutil.rmtree(self.tree, ignore_errors=True)
+            self.tree = None
+
+
+FILE_CHANGES = {
+    "edit": ActionHandler._edit_file,
+    "create": ActionHandler._edit_file,
+    "delete": ActionHandler._delete_file,
+    "patch": ActionHandler._patch_file,
+}
+
+
+class AsyncActionHandler:
+    """
+    asyncio counterpart of ActionHandler, with the same results and errors.
+
+    Git runs as awaited subprocesses (AsyncGitSync). File changes are
+    handed to the default executor, as regular files have no non-blocking
+    I/O; they are short compared to the git calls that follow them.
+    """
+
+    def __init__(self, handler: ActionHandler):
+        self.handler = handler
+        self.project_root = handler.project_root
+        self.git_sync = AsyncGitSync(handler.project_root)
+
+    async def execute(self, action: str, params: Dict[str, Any], agent: str = None, role: str = None,
+                      spec_id: str = None) -> Dict[str, Any]:
+        try:
+            if action in FILE_CHANGES:
+                result, sync = await asyncio.to_thread(self.handler.apply_file_change, action, params)
+                commit_queue = self.handler.commit_queue
+                if sync and commit_queue is not None:
+                    commit_queue.submit(sync[0], sync[1], agent=agent, role=role, spec_id=spec_id)
+                elif sync:
+                    await self.git_sync.commit_and_push(sync[0], sync[1], agent=agent, role=role)
+                return result
+            git_handler = getattr(self, f"_handle_{action}", None)
+            if git_handler is not None:
+                return await git_handler(params, agent, role)
+        except PermissionError as e:
+            logger.warning("Permission denied: %s", e)
+            return {"status": "denied", "message": str(e)}
+        except Exception as e:
+            logger.error("Action %s failed: %s", action, e)
+            return {"status": "error", "message": str(e)}
+        # The remaining actions are simulated and return straight away.
+        return self.handler.execute(action, params, agent=agent, role=role, spec_id=spec_id)
+
+    async def _handle_git_commit(self, params: Dict[str, Any], agent: str, role: str) -> Dict[str, Any]:
+        message = params.get("message", "automated commit")
+        full_message = f"[ADT] {message}"
+        if agent and role:
+            full_message += f" - {agent} ({role})"
+
+        files = params.get("files", ["."])
+        for f in files:
+            if not await self.git_sync._run_git(["add", f]):
+                return {"status": "error", "message": f"Failed to add {f}"}
+
+        if await self.git_sync._run_git(["commit", "-m", full_message]):
+            return {"status": "success", "result": "committed"}
+        return {"status": "error", "message": "Commit failed (maybe nothing to commit?)"}
+
+    async def _handle_git_push(self, params: Dict[str, Any], agent: str, role: str) -> Dict[str, Any]:
+        remote = params.get("remote", "origin")
+        branch = params.get("branch", "main")
+        if await self.git_sync._run_git(["push", remote, branch]):
+            return {"status": "success", "result": f"pushed to {remote}/{branch}"}
+        return {"status": "error", "message": "Push failed"}
+
+    async def _handle_git_tag(self, params: Dict[str, Any], agent: str, role: str) -> Dict[str, Any]:
+        tag_name = params.get("tag")
+        message = params.get("message", f"Release {tag_name}")
+        if not tag_name:
+            return {"status": "error", "message": "Tag name required"}
+
+        if await self.git_sync._run_git(["tag", "-a", tag_name, "-m", message]):
+            return {"status": "success", "result": f"tag {tag_name} created"}
+        return {"status": "error", "message": "Tag creation failed"}
@@ -0,0 +1,188 @@
+"""
+asyncio DTTP service.
+
+The same endpoints as the Flask app in service.py, as a plain ASGI
+application around AsyncDTTPGateway: a request waiting on an ADS append or
+a git subprocess holds no thread, so one process serves hundreds of
+concurrent agents. Run it with --server uvicorn, or under any ASGI server:
+
+    from adt_core.dttp.asgi import create_dttp_asgi_app
+    app = create_dttp_asgi_app(DTTPConfig.from_project_root("."))
+"""
+import asyncio
+import json
+import logging
+import time
+from urllib.parse import parse_qs
+
+from adt_core.dttp.config import DTTPConfig
+from adt_core.dttp.gateway import AsyncDTTPGateway
+from adt_core.dttp.service import (
+    ServiceStats, _request_error, close_gateway, create_gateway, finish_request, normalize_log_event, parse_batch,
+    policy_response, status_body, sync_status_body,
+)
+
+logger = logging.getLogger(__name__)
+
+# Request bodies larger than this are refused (a full batch is well below).
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class _BadRequest(Exception):
+    def __init__(self, status: int, body: dict):
+        super().__init__(body.get("message"))
+        self.status = status
+        self.body = body
+
+
+class DTTPAsgiApp:
+    """ASGI callable serving the DTTP endpoints (http and lifespan scopes)."""
+
+    def __init__(self, config: DTTPConfig):
+        self.config = config
+        self.gateway = create_gateway(config)
+        self.async_gateway = AsyncDTTPGateway(self.gateway)
+        self.stats = ServiceStats()
+        self.start_time = time.time()
+        self._routes = {
+            ("POST", "/request"): self._request,
+            ("POST", "/request/batch"): self._request_batch,
+            ("POST", "/log"): self._log,
+            ("GET", "/status"): self._status,
+            ("GET", "/policy"): self._policy,
+            ("GET", "/policy/delta"): self._policy_delta,
+            ("GET", "/sync/status"): self._sync_status,
+        }
+        self._paths = {path for _, path in self._routes}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def shutdown(self):
+        """Commits queued changes and closes the ADS logger (the server has drained requests)."""
+        await asyncio.to_thread(close_gateway, self.gateway, self.config.shutdown_timeout)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        path = scope["path"].rstrip("/") or "/"
+        handler = self._routes.get((scope["method"], path))
+        try:
+            if handler is None:
+                if path in self._paths:
+                    raise _BadRequest(405, {"status": "error", "code": "METHOD_NOT_ALLOWED",
+                                            "message": f"{scope['method']} not allowed on {path}"})
+                raise _BadRequest(404, {"status": "error", "code": "NOT_FOUND", "message": f"No route {path}"})
+            body = await self._read_json(receive) if scope["method"] == "POST" else None
+            status, payload, *headers = await handler(body, scope)
+        except _BadRequest as e:
+            status, payload, headers = e.status, e.body, []
+        except Exception:
+            logger.exception("DTTP request %s %s failed", scope["method"], path)
+            status, payload, headers = 500, {"status": "error", "code": "INTERNAL_ERROR",
+                                             "message": "Internal server error"}, []
+        await _send_json(send, status, payload, headers)
+
+    @staticmethod
+    async def _read_json(receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise _BadRequest(400, {"status": "error", "code": "INVALID_BODY", "message": "Client disconnected"})
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise _BadRequest(413, {"status": "error", "code": "BODY_TOO_LARGE",
+                                        "message": f"Request body exceeds {MAX_BODY_BYTES} bytes"})
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        try:
+            return json.loads(b"".join(chunks))
+        except ValueError:
+            return None
+
+    async def _request(self, data, _scope):
+        if not data or not isinstance(data, dict):
+            return 400, {"status": "error", "code": "INVALID_BODY", "message": "Request body must be JSON"}
+        error = _request_error(data)
+        if error:
+            return 400, error
+
+        result = await self.async_gateway.request(
+            agent=data["agent"],
+            role=data["role"],
+            spec_id=data["spec_id"],
+            action=data["action"],
+            params=data["params"],
+            rationale=data["rationale"],
+            dry_run=bool(data.get("dry_run", False)),
+        )
+
+        return finish_request(self.gateway, self.stats, data, result), result
+
+    async def _request_batch(self, data, _scope):
+        error, merged, mode, dry_run = parse_batch(data)
+        if error:
+            return 400, error
+        # A batch is one atomic ADS append per phase; run it whole off the loop.
+        result = await asyncio.to_thread(self.gateway.request_batch, merged, mode=mode, dry_run=dry_run)
+        result["policy_revision"] = self.gateway.policy_engine.revision_tag
+        self.stats.record(requests=len(merged), denials=result["denied"])
+        return 200, result
+
+    async def _log(self, data, _scope):
+        if not data or not isinstance(data, dict):
+            return 400, {"status": "error", "code": "INVALID_BODY", "message": "Request body must be JSON"}
+        try:
+            event_id = await self.gateway.logger.log_async(normalize_log_event(data))
+        except ValueError as e:
+            return 400, {"status": "error", "code": "INVALID_EVENT", "message": str(e)}
+        return 200, {"status": "success", "event_id": event_id}
+
+    async def _status(self, _data, _scope):
+        return 200, status_body(self.config, self.gateway, self.stats, self.start_time)
+
+    async def _policy(self, _data, scope):
+        return self._policy_reply(scope)
+
+    async def _policy_delta(self, _data, scope):
+        since = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("since", [""])[0]
+        return self._policy_reply(scope, since)
+
+    def _policy_reply(self, scope, since=None):
+        if_none_match = next((value.decode("latin-1") for name, value in scope.get("headers", [])
+                              if name.lower() == b"if-none-match"), None)
+        status, body, tag = policy_response(self.gateway, if_none_match, since)
+        return status, body, (b"etag", f'"{tag}"'.encode())
+
+    async def _sync_status(self, _data, _scope):
+        return 200, sync_status_body(self.gateway)
+
+
+async def _send_json(send, status: int, payload, headers=()):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()),
+                    *headers],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def create_dttp_asgi_app(config: DTTPConfig) -> DTTPAsgiApp:
+    """Create the asyncio DTTP ASGI application."""
+    return DTTPAsgiApp(config)
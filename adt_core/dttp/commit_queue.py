@@ -0,0 +1,295 @@
+"""
+Background git commit/push pipeline for DTTP file actions.
+
+Committing inline costs every edit a `git add`, `git commit` and `git push`
+before the agent gets its response. With a CommitQueue the ActionHandler
+only records the change; a worker thread commits the changes of each
+coalescing window as one commit and then pushes, retrying failed commits
+and pushes with backoff. Commit hashes (and failures) are logged to the ADS
+once they land.
+
+Changes are grouped per window (everything in the window), per session
+(one agent in one role) or per spec; a group is committed window_s after
+its first change. One worker runs all git commands, so commits and pushes
+never race each other for the index.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.schema import ADSEventSchema
+from adt_core.dttp.sync import GitSync
+
+logger = logging.getLogger(__name__)
+
+COMMIT_GROUPINGS = ("window", "session", "spec")
+
+# Upper bound of the wait before a failed commit is retried.
+MAX_RETRY_BACKOFF_S = 60.0
+
+
+class _Change:
+    __slots__ = ("path", "message", "agent", "role", "spec_id")
+
+    def __init__(self, path: str, message: str, agent: Optional[str], role: Optional[str], spec_id: Optional[str]):
+        self.path = path
+        self.message = message
+        self.agent = agent
+        self.role = role
+        self.spec_id = spec_id
+
+
+class _Group:
+    __slots__ = ("key", "changes", "opened", "due", "failures")
+
+    def __init__(self, key, window_s: float):
+        self.key = key
+        self.changes: List[_Change] = []
+        self.opened = time.monotonic()
+        self.due = self.opened + window_s  # pushed back after a failed commit
+        self.failures = 0
+
+
+class CommitQueue:
+    """Coalesces DTTP file changes into background git commits and pushes."""
+
+    def __init__(self, git_sync: GitSync, ads_logger: Optional[ADSLogger] = None,
+                 window_s: float = 2.0, group_by: str = "window", push: bool = True,
+                 push_retries: int = 3, retry_backoff_s: float = 1.0):
+        if group_by not in COMMIT_GROUPINGS:
+            raise ValueError(f"group_by must be one of: {', '.join(COMMIT_GROUPINGS)}")
+        self.git_sync = git_sync
+        self.ads_logger = ads_logger
+        self.window_s = window_s
+        self.group_by = group_by
+        self.push = push
+        self.push_retries = push_retries
+        self.retry_backoff_s = retry_backoff_s
+
+        self._cond = threading.Condition()
+        self._groups: "OrderedDict[Any, _Group]" = OrderedDict()
+        self._committing = 0  # changes taken by the worker, not yet committed
+        self._flushing = 0
+        self._closed = False
+        self._stopping = threading.Event()  # cuts push backoff short on close
+        self._thread: Optional[threading.Thread] = None
+
+        self.commits = 0
+        self.commit_failures = 0
+        self.pushes = 0
+        self.push_failures = 0
+        self.unpushed_commits = 0
+        self.last_commit: Optional[str] = None
+        self.last_commit_lag_s: Optional[float] = None
+        self.last_push_at: Optional[float] = None
+
+    def submit(self, path: str, message: str, agent: str = None, role: str = None, spec_id: str = None):
+        """Queues a changed path for the next commit of its group; returns at once."""
+        if self.group_by == "session":
+            key = (agent, role)
+        elif self.group_by == "spec":
+            key = spec_id
+        else:
+            key = None
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CommitQueue is closed")
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group(key, self.window_s)
+            group.changes.append(_Change(path, message, agent, role, spec_id))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dttp-commit-queue", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = sum(len(g.changes) for g in self._groups.values())
+            oldest = min((g.opened for g in self._groups.values()), default=None)
+            return {
+                "enabled": True,
+                "group_by": self.group_by,
+                "window_seconds": self.window_s,
+                "queue_depth": pending + self._committing,
+                "pending_groups": len(self._groups),
+                "lag_seconds": round(time.monotonic() - oldest, 3) if oldest is not None else 0.0,
+                "commits": self.commits,
+                "commit_failures": self.commit_failures,
+                "last_commit": self.last_commit,
+                "last_commit_lag_seconds": self.last_commit_lag_s,
+                "unpushed_commits": self.unpushed_commits,
+                "pushes": self.pushes,
+                "push_failures": self.push_failures,
+                "last_push_at": self.last_push_at,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commits (and pushes) everything queued now. False if timeout ran out
+        first or a commit failed; failed changes stay queued for a retry.
+        """
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                # Groups waiting out a commit backoff do not hold the flush.
+                self._cond.wait_for(lambda: not self._committing and
+                                    all(g.failures for g in self._groups.values()), timeout)
+                return not self._groups and not self._committing
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flushes, then stops the worker. Later submits raise RuntimeError."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if not flushed:
+            logger.warning("CommitQueue closed with %d changes uncommitted", self.status()["queue_depth"])
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    due = [key for key, group in self._groups.items()
+                           if self._closed or now >= group.due or (self._flushing and not group.failures)]
+                    if due or self._closed:
+                        break
+                    next_due = min((g.due for g in self._groups.values()), default=None)
+                    self._cond.wait(None if next_due is None else next_due - now)
+                if not due:
+                    return
+                groups = [self._groups.pop(key) for key in due]
+                self._committing = sum(len(g.changes) for g in groups)
+            try:
+                for group in groups:
+                    if not self._commit(group):
+                        self._requeue(group)
+                if self.push and self.unpushed_commits:
+                    self._push()
+            except Exception as e:
+                logger.error("CommitQueue: %s", e)
+            finally:
+                with self._cond:
+                    self._committing = 0
+                    self._cond.notify_all()
+
+    def _requeue(self, group: _Group):
+        """Puts a group whose commit failed back, due again after a backoff."""
+        with self._cond:
+            self._committing -= len(group.changes)
+            if self._closed:
+                logger.error("CommitQueue: closing with %d changes uncommitted", len(group.changes))
+                return
+            group.failures += 1
+            group.due = time.monotonic() + min(self.retry_backoff_s * (2 ** (group.failures - 1)),
+                                               MAX_RETRY_BACKOFF_S)
+            newer = self._groups.pop(group.key, None)
+            if newer is not None:  # changes submitted meanwhile join the retry
+                group.changes.extend(newer.changes)
+            self._groups[group.key] = group
+            self._groups.move_to_end(group.key, last=False)
+
+    def _commit(self, group: _Group) -> bool:
+        """Commits a group; False if git failed and the group should be retried."""
+        changes = group.changes
+        messages = list(dict.fromkeys(c.message for c in changes))
+        sessions = list(dict.fromkeys((c.agent, c.role) for c in changes))
+        specs = list(dict.fromkeys(c.spec_id for c in changes if c.spec_id))
+
+        subject = messages[0] if len(messages) == 1 else f"{len(messages)} changes: {', '.join(messages[:3])}" + \
+            (", ..." if len(messages) > 3 else "")
+        message = f"[ADT] {subject}"
+        if len(sessions) == 1 and sessions[0][0] and sessions[0][1]:
+            message += f" - {sessions[0][0]} ({sessions[0][1]})"
+        if len(messages) > 1:
+            message += "\n\n" + "\n".join(f"- {c.message} - {c.agent} ({c.role})" for c in changes)
+
+        paths = list(dict.fromkeys(c.path for c in changes))
+        commit = self.git_sync.commit(paths, message)
+        if not commit:
+            if self.git_sync.has_changes(paths) is False:
+                logger.warning("CommitQueue: nothing committed for %d changes", len(changes))
+                return True
+            with self._cond:
+                self.commit_failures += 1
+            logger.warning("CommitQueue: commit of %d changes failed (attempt %d)", len(changes),
+                           group.failures + 1)
+            self._log(self._system_event("git_commit_failed",
+                                         f"Commit of {len(changes)} change(s) failed; retrying with backoff",
+                                         files=paths, attempts=group.failures + 1))
+            return False
+        lag = round(time.monotonic() - group.opened, 3)
+        with self._cond:
+            self.commits += 1
+            self.unpushed_commits += 1
+            self.last_commit = commit
+            self.last_commit_lag_s = lag
+
+        agent, role = sessions[0] if len(sessions) == 1 else ("SYSTEM", "system")
+        self._log(ADSEventSchema.create_event(
+            event_id=ADSEventSchema.generate_id("git_commit"),
+            agent=agent or "SYSTEM",
+            role=role or "system",
+            action_type="git_commit",
+            description=f"Committed {len(changes)} change(s) as {commit[:12]}: {subject}",
+            spec_ref=",".join(specs) or "none",
+            authorized=True,
+            commit=commit,
+            files=paths,
+            lag_seconds=lag,
+        ))
+        return True
+
+    def _push(self):
+        attempts = self.push_retries + 1
+        for attempt in range(attempts):
+            if self.git_sync.push():
+                with self._cond:
+                    pushed, self.unpushed_commits = self.unpushed_commits, 0
+                    self.pushes += 1
+                    self.last_push_at = time.time()
+                self._log(self._system_event("git_push",
+                                             f"Pushed {pushed} commit(s) up to {self.last_commit[:12]}",
+                                             commit=self.last_commit, attempts=attempt + 1))
+                return
+            if attempt + 1 < attempts:
+                self._stopping.wait(self.retry_backoff_s * (2 ** attempt))
+        with self._cond:
+            self.push_failures += 1
+        logger.warning("CommitQueue: push failed after %d attempts", attempts)
+        self._log(self._system_event("git_push_failed",
+                                     f"Push of {self.unpushed_commits} commit(s) failed after {attempts} attempts; "
+                                     "retrying with the next commit", commit=self.last_commit, attempts=attempts))
+
+    @staticmethod
+    def _system_event(action_type: str, description: str, **fields) -> Dict[str, Any]:
+        return ADSEventSchema.create_event(
+            event_id=ADSEventSchema.generate_id(action_type),
+            agent="SYSTEM",
+            role="system",
+            action_type=action_type,
+            description=description,
+            spec_ref="none",
+            authorized=True,
+            **fields,
+        )
+
+    def _log(self, event: Dict[str, Any]):
+        if self.ads_logger is None:
+            return
+        try:
+            self.ads_logger.log(event)
+        except Exception as e:
+            logger.error("CommitQueue: could not log %s to ADS: %s", event["action_type"], e)
@@ -1,8 +1,30 @@
+import logging
 import os
 import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Tuning keys of config/dttp.json and their parsers. Each is parsed on its
+# own, so a malformed value falls back to that key's default only.
+_TUNING_KEYS = {
+    "ads_group_commit": bool,
+    "ads_max_batch_size": int,
+    "ads_max_wait_ms": float,
+    "ads_segment_max_bytes": int,
+    "ads_segment_max_events": int,
+    "ads_segment_codec": lambda value: value or '',
+    "server": lambda value: value or 'werkzeug',
+    "server_workers": int,
+    "server_threads": int,
+    "shutdown_timeout": float,
+    "git_commit_queue": bool,
+    "git_commit_window_ms": float,
+    "git_commit_group_by": lambda value: value or 'window',
+    "git_push_retries": int,
+}
+
 @dataclass
 class DTTPConfig:
     port: int = 5002
@@ -15,6 +37,20 @@ class DTTPConfig:
     enforcement_mode: str = 'development'
     access_token: Optional[str] = None
     is_framework_project: bool = False
+    ads_group_commit: bool = False
+    ads_max_batch_size: int = 256
+    ads_max_wait_ms: float = 0.0
+    ads_segment_max_bytes: int = 0
+    ads_segment_max_events: int = 0
+    ads_segment_codec: str = ''
+    server: str = 'werkzeug'
+    server_workers: int = 1
+    server_threads: int = 16
+    shutdown_timeout: float = 30.0
+    git_commit_queue: bool = False
+    git_commit_window_ms: float = 2000.0
+    git_commit_group_by: str = 'window'
+    git_push_retries: int = 3
 
     @staticmethod
     def get_user_config_dir() -> str:
@@ -61,6 +97,7 @@ class DTTPConfig:
         
         # Merge from config/dttp.json if it exists
         dttp_json = os.path.join(project_root, "config", "dttp.json")
+        data = {}
         if os.path.exists(dttp_json):
             try:
                 import json
@@ -72,6 +109,15 @@ class DTTPConfig:
                     if "enforcement_mode" in data: config.enforcement_mode = data["enforcement_mode"]
             except: pass
 
+        if isinstance(data, dict):
+            for key, parse in _TUNING_KEYS.items():
+                if key not in data:
+                    continue
+                try:
+                    setattr(config, key, parse(data[key]))
+                except (TypeError, ValueError) as e:
+                    logger.warning("Ignoring invalid %s in %s: %r (%s)", key, dttp_json, data[key], e)
+
         for key, val in overrides.items():
             if hasattr(config, key):
                 setattr(config, key, val)
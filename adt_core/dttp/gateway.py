@@ -1,9 +1,9 @@
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from adt_core.ads.logger import ADSLogger
 from adt_core.ads.schema import ADSEventSchema
 from .policy import PolicyEngine
-from .actions import ActionHandler
+from .actions import FILE_CHANGES, ActionHandler, AsyncActionHandler
 
 # SPEC-020: HARDCODED Protected Paths (Sovereign/Constitutional)
 # These are compiled into the gateway logic and cannot be configured away.
@@ -27,6 +27,23 @@ CONSTITUTIONAL_PATHS = [
     "adt_core/ads/crypto.py",
 ]
 
+BATCH_MODES = ("best_effort", "all_or_nothing")
+
+
+class _Authorization:
+    """Outcome of the checks for one request, before anything is executed."""
+
+    __slots__ = ("action", "path", "tier", "denial", "event")
+
+    def __init__(self, action: str, path: Optional[str], tier: int = 3,
+                 denial: Optional[Dict[str, Any]] = None, event: Optional[Dict[str, Any]] = None):
+        self.action = action
+        self.path = path
+        self.tier = tier
+        self.denial = denial  # response to return if the request is denied
+        self.event = event  # ADS event recording the denial
+
+
 class DTTPGateway:
     """The main validation and execution gateway for DTTP requests."""
 
@@ -40,6 +57,19 @@ class DTTPGateway:
         self.logger = logger
         self.is_framework = is_framework
 
+    def rules(self) -> Dict[str, Any]:
+        """
+        The fixed rules _authorize applies on top of the policy engine, for
+        clients that evaluate policy locally (advisory only).
+        """
+        return {
+            "is_framework": self.is_framework,
+            "project_root": self.action_handler.project_root,
+            "sovereign_paths": list(SOVEREIGN_PATHS),
+            "governance_locked": list(GOVERNANCE_LOCKED),
+            "constitutional_paths": list(CONSTITUTIONAL_PATHS),
+        }
+
     def request(self,
                 agent: str,
                 role: str,
@@ -52,6 +82,126 @@ class DTTPGateway:
         Processes a DTTP request: validates, logs pre-action, executes, logs post-action.
         If dry_run=True, runs all validation but skips execution.
         """
+        auth = self._authorize(agent, role, spec_id, action, params, rationale)
+        if auth.denial is not None:
+            self.logger.log(auth.event)
+            return auth.denial
+
+        # 4. Dry-run: validation passed, skip execution
+        if dry_run:
+            self.logger.log(self._dry_run_event(agent, role, spec_id, rationale, auth))
+            return {"status": "allowed", "dry_run": True}
+
+        # 5. Log Pre-action
+        self.logger.log(self._pre_action_event(agent, role, spec_id, rationale, auth))
+
+        # 6. Execute
+        result = self.action_handler.execute(auth.action, params, agent=agent, role=role, spec_id=spec_id)
+
+        # 7. Log Post-action
+        self.logger.log(self._post_action_event(agent, role, spec_id, auth, result))
+
+        return {"status": "allowed", "result": result}
+
+    def request_batch(self,
+                      items: List[Dict[str, Any]],
+                      mode: str = "best_effort",
+                      dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Processes several requests (dicts with the keyword arguments of
+        request()) with one policy pass and grouped ADS writes.
+
+        Every item is checked first. In "best_effort" mode the authorized
+        items run and denials are reported per item. In "all_or_nothing"
+        mode nothing runs unless every item is authorized and is a file
+        change (edit, create, delete, patch); the others are reported as
+        skipped. The changes are then applied as a unit: if one fails, the
+        files changed before it are restored, nothing is committed and the
+        batch status is "failed". The denial and dry-run events go to the
+        ledger in one group commit. Executed items keep write-ahead
+        logging: all pre-action events are committed together before the
+        first action runs and all post-action events together afterwards.
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Unknown batch mode: {mode}")
+
+        auths = [self._authorize(item["agent"], item["role"], item["spec_id"], item["action"],
+                                 item["params"], item["rationale"]) for item in items]
+        denied = [auth.denial is not None for auth in auths]
+        atomic = mode == "all_or_nothing"
+        # Only file changes can be undone, so only they may join an atomic batch.
+        not_revertible = [atomic and not dry_run and auth.denial is None and auth.action not in FILE_CHANGES
+                          for auth in auths]
+        blocked = atomic and (any(denied) or any(not_revertible))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        events = []
+        to_execute = []
+        for i, (item, auth) in enumerate(zip(items, auths)):
+            if auth.denial is not None:
+                events.append(auth.event)
+                results[i] = auth.denial
+            elif not_revertible[i]:
+                results[i] = {"status": "skipped", "reason": "not_revertible"}
+            elif blocked:
+                results[i] = {"status": "skipped", "reason": "batch_denied"}
+            elif dry_run:
+                events.append(self._dry_run_event(item["agent"], item["role"], item["spec_id"],
+                                                  item["rationale"], auth))
+                results[i] = {"status": "allowed", "dry_run": True}
+            else:
+                events.append(self._pre_action_event(item["agent"], item["role"], item["spec_id"],
+                                                     item["rationale"], auth))
+                to_execute.append(i)
+        if events:
+            self.logger.log_many(events)
+
+        post_events = []
+        failed = False
+        if atomic and to_execute:
+            executed, ok = self.action_handler.execute_atomically([
+                {"action": auths[i].action, "params": items[i]["params"], "agent": items[i]["agent"],
+                 "role": items[i]["role"], "spec_id": items[i]["spec_id"]} for i in to_execute])
+            failed = not ok
+            for i, result in zip(to_execute, executed):
+                item, auth = items[i], auths[i]
+                if result is None:
+                    results[i] = {"status": "skipped", "reason": "batch_failed"}
+                    continue
+                post_events.append(self._post_action_event(item["agent"], item["role"], item["spec_id"],
+                                                           auth, result))
+                results[i] = {"status": "allowed" if ok else "failed", "result": result}
+        else:
+            for i in to_execute:
+                item, auth = items[i], auths[i]
+                result = self.action_handler.execute(auth.action, item["params"], agent=item["agent"],
+                                                     role=item["role"], spec_id=item["spec_id"])
+                post_events.append(self._post_action_event(item["agent"], item["role"], item["spec_id"],
+                                                           auth, result))
+                results[i] = {"status": "allowed", "result": result}
+        if post_events:
+            self.logger.log_many(post_events)
+
+        denials = sum(denied)
+        if failed:
+            status = "failed"
+        elif not denials and not blocked:
+            status = "allowed"
+        elif blocked or denials == len(items):
+            status = "denied"
+        else:
+            status = "partial"
+        return {"status": status, "mode": mode, "dry_run": dry_run,
+                "denied": denials, "results": results}
+
+    def _authorize(self,
+                   agent: str,
+                   role: str,
+                   spec_id: str,
+                   action: str,
+                   params: Dict[str, Any],
+                   rationale: str) -> _Authorization:
+        """Runs every check for a request without logging or executing it."""
         # SPEC-036 / REQ-029: Normalize action type
         # Treat 'write' and 'create' as 'edit' (full file write)
         # Treat 'replace' as 'patch' (partial file update)
@@ -63,19 +213,22 @@ class DTTPGateway:
         path = params.get("file") or params.get("path")
         normalized_path = os.path.normpath(path) if path else None
 
+        def deny(reason: str, event_prefix: str, tier: int, **event_fields) -> _Authorization:
+            event = ADSEventSchema.create_event(
+                event_id=ADSEventSchema.generate_id(event_prefix), agent=agent, role=role,
+                spec_ref=spec_id, authorized=False, tier=tier, escalation=True, **event_fields
+            )
+            return _Authorization(action, path, tier, denial={"status": "denied", "reason": reason}, event=event)
+
         # 0. Path Containment Check (SPEC-031 Amendment A)
         if path:
             try:
                 # This ensures the path is within project_root
                 self.action_handler._resolve_path(path)
-            except PermissionError as e:
-                event_id = ADSEventSchema.generate_id("containment_violation")
-                self.logger.log(ADSEventSchema.create_event(
-                    event_id=event_id, agent=agent, role=role, action_type="denied_containment",
-                    description=f"DENIED: Path {path} escapes project root. Rationale: {rationale}",
-                    spec_ref=spec_id, authorized=False, tier=1, escalation=True
-                ))
-                return {"status": "denied", "reason": "path_outside_project_root"}
+            except PermissionError:
+                return deny("path_outside_project_root", "containment_violation", tier=1,
+                            action_type="denied_containment",
+                            description=f"DENIED: Path {path} escapes project root. Rationale: {rationale}")
 
         # SPEC-038: Intent Validation
         intent_id = params.get("intent_id")
@@ -84,53 +237,29 @@ class DTTPGateway:
             cm = CapabilityManager(self.action_handler.project_root)
             intent = cm.get_intent(intent_id)
             if not intent:
-                event_id = ADSEventSchema.generate_id("intent_not_found")
-                self.logger.log(ADSEventSchema.create_event(
-                    event_id=event_id, agent=agent, role=role, action_type="denied_intent",
-                    description=f"DENIED: Intent {intent_id} not found. Rationale: {rationale}",
-                    spec_ref=spec_id, authorized=False, tier=3, escalation=True,
-                    intent_id=intent_id
-                ))
-                return {"status": "denied", "reason": "intent_not_found"}
-            
+                return deny("intent_not_found", "intent_not_found", tier=3,
+                            action_type="denied_intent", intent_id=intent_id,
+                            description=f"DENIED: Intent {intent_id} not found. Rationale: {rationale}")
+
             if intent.get("status") in ["Completed", "Cancelled"]:
-                event_id = ADSEventSchema.generate_id("intent_inactive")
-                self.logger.log(ADSEventSchema.create_event(
-                    event_id=event_id, agent=agent, role=role, action_type="denied_intent",
-                    description=f"DENIED: Intent {intent_id} is {intent.get('status')}. Rationale: {rationale}",
-                    spec_ref=spec_id, authorized=False, tier=3, escalation=True,
-                    intent_id=intent_id
-                ))
-                return {"status": "denied", "reason": "intent_inactive"}
+                return deny("intent_inactive", "intent_inactive", tier=3,
+                            action_type="denied_intent", intent_id=intent_id,
+                            description=f"DENIED: Intent {intent_id} is {intent.get('status')}. Rationale: {rationale}")
 
         # 0b. Governance Lock Check (SPEC-031 Amendment A)
         if normalized_path in GOVERNANCE_LOCKED:
             if not self.is_framework:
                 # Project's own agents CANNOT modify their own governance files
-                event_id = ADSEventSchema.generate_id("gov_lock_violation")
-                self.logger.log(ADSEventSchema.create_event(
-                    event_id=event_id, agent=agent, role=role, action_type="governance_lock_violation",
-                    description=f"DENIED: Agent attempted to modify governance-locked file {normalized_path}. Rationale: {rationale}",
-                    spec_ref=spec_id, authorized=False, tier=1, escalation=True
-                ))
-                return {"status": "denied", "reason": "governance_file_protected"}
+                return deny("governance_file_protected", "gov_lock_violation", tier=1,
+                            action_type="governance_lock_violation",
+                            description=f"DENIED: Agent attempted to modify governance-locked file {normalized_path}. Rationale: {rationale}")
 
         # 1. Sovereign Path Check (Tier 1) - SPEC-020 Section 2.1
         # Skip for external projects (SPEC-031)
         if self.is_framework and normalized_path in SOVEREIGN_PATHS:
-            event_id = ADSEventSchema.generate_id("sovereign_violation")
-            self.logger.log(ADSEventSchema.create_event(
-                event_id=event_id,
-                agent=agent,
-                role=role,
-                action_type="sovereign_path_violation",
-                description=f"DENIED: Attempt to modify sovereign path {normalized_path}. Rationale: {rationale}",
-                spec_ref=spec_id,
-                authorized=False,
-                tier=1,
-                escalation=True
-            ))
-            return {"status": "denied", "reason": "sovereign_path_violation"}
+            return deny("sovereign_path_violation", "sovereign_violation", tier=1,
+                        action_type="sovereign_path_violation",
+                        description=f"DENIED: Attempt to modify sovereign path {normalized_path}. Rationale: {rationale}")
 
         # 2. Constitutional Path Check (Tier 2) - SPEC-020 Section 2.2
         tier = 3
@@ -159,100 +288,108 @@ class DTTPGateway:
                 authorized_paths = self.policy_engine.validator.get_authorized_paths(spec_id)
                 explicit_match = any(normalized_path == os.path.normpath(ap) for ap in authorized_paths)
                 if not explicit_match:
-                    reason = "tier2_authorization_required"
-                    event_id = ADSEventSchema.generate_id("tier2_denied")
-                    self.logger.log(ADSEventSchema.create_event(
-                        event_id=event_id,
-                        agent=agent,
-                        role=role,
-                        action_type="tier2_denied",
-                        description=f"DENIED: {tier2_reason} requires explicit spec listing. Rationale: {rationale}",
-                        spec_ref=spec_id,
-                        authorized=False,
-                        tier=2,
-                        escalation=True
-                    ))
-                    return {"status": "denied", "reason": reason}
+                    return deny("tier2_authorization_required", "tier2_denied", tier=2,
+                                action_type="tier2_denied",
+                                description=f"DENIED: {tier2_reason} requires explicit spec listing. Rationale: {rationale}")
 
             if not tier2_justification:
-                reason = "tier2_authorization_required"
-                event_id = ADSEventSchema.generate_id("tier2_denied")
-                self.logger.log(ADSEventSchema.create_event(
-                    event_id=event_id,
-                    agent=agent,
-                    role=role,
-                    action_type="tier2_denied",
-                    description=f"DENIED: {tier2_reason} requires tier2_justification. Rationale: {rationale}",
-                    spec_ref=spec_id,
-                    authorized=False,
-                    tier=2,
-                    escalation=True
-                ))
-                return {"status": "denied", "reason": reason}
+                return deny("tier2_authorization_required", "tier2_denied", tier=2,
+                            action_type="tier2_denied",
+                            description=f"DENIED: {tier2_reason} requires tier2_justification. Rationale: {rationale}")
 
         # 3. Standard Policy Validation
         allowed, reason = self.policy_engine.validate_request(role, spec_id, action, path)
         
         if not allowed:
-            # Log denial
-            event_id = ADSEventSchema.generate_id(f"denial_{action}")
-            self.logger.log(ADSEventSchema.create_event(
-                event_id=event_id,
-                agent=agent,
-                role=role,
-                action_type=f"denied_{action}",
-                description=f"DENIED: {reason}. Rationale provided: {rationale}",
-                spec_ref=spec_id,
-                authorized=False,
-                tier=tier,
-                escalation=True
-            ))
-            return {"status": "denied", "reason": reason}
+            return deny(reason, f"denial_{action}", tier=tier,
+                        action_type=f"denied_{action}",
+                        description=f"DENIED: {reason}. Rationale provided: {rationale}")
 
-        # 4. Dry-run: validation passed, skip execution
-        if dry_run:
-            dry_event_id = ADSEventSchema.generate_id(f"dry_run_{action}")
-            self.logger.log(ADSEventSchema.create_event(
-                event_id=dry_event_id,
-                agent=agent,
-                role=role,
-                action_type=f"dry_run_validated_{action}",
-                description=f"Dry-run validated {action} on {path}. Rationale: {rationale}",
-                spec_ref=spec_id,
-                authorized=True,
-                tier=tier,
-            ))
-            return {"status": "allowed", "dry_run": True}
+        return _Authorization(action, path, tier)
 
-        # 5. Log Pre-action
-        pre_event_id = ADSEventSchema.generate_id(f"pending_{action}")
-        self.logger.log(ADSEventSchema.create_event(
-            event_id=pre_event_id,
+    @staticmethod
+    def _dry_run_event(agent: str, role: str, spec_id: str, rationale: str,
+                       auth: _Authorization) -> Dict[str, Any]:
+        return ADSEventSchema.create_event(
+            event_id=ADSEventSchema.generate_id(f"dry_run_{auth.action}"),
             agent=agent,
             role=role,
-            action_type=f"pending_{action}" if tier == 3 else "tier2_authorized",
-            description=f"Requesting {action} on {path}. Rationale: {rationale}",
+            action_type=f"dry_run_validated_{auth.action}",
+            description=f"Dry-run validated {auth.action} on {auth.path}. Rationale: {rationale}",
             spec_ref=spec_id,
             authorized=True,
-            tier=tier,
-            status="pending"
-        ))
+            tier=auth.tier,
+        )
 
-        # 6. Execute
-        result = self.action_handler.execute(action, params, agent=agent, role=role)
+    @staticmethod
+    def _pre_action_event(agent: str, role: str, spec_id: str, rationale: str,
+                          auth: _Authorization) -> Dict[str, Any]:
+        return ADSEventSchema.create_event(
+            event_id=ADSEventSchema.generate_id(f"pending_{auth.action}"),
+            agent=agent,
+            role=role,
+            action_type=f"pending_{auth.action}" if auth.tier == 3 else "tier2_authorized",
+            description=f"Requesting {auth.action} on {auth.path}. Rationale: {rationale}",
+            spec_ref=spec_id,
+            authorized=True,
+            tier=auth.tier,
+            status="pending"
+        )
 
-        # 7. Log Post-action
-        post_event_id = ADSEventSchema.generate_id(f"completed_{action}")
-        self.logger.log(ADSEventSchema.create_event(
-            event_id=post_event_id,
+    @staticmethod
+    def _post_action_event(agent: str, role: str, spec_id: str, auth: _Authorization,
+                           result: Dict[str, Any]) -> Dict[str, Any]:
+        return ADSEventSchema.create_event(
+            event_id=ADSEventSchema.generate_id(f"completed_{auth.action}"),
             agent=agent,
             role=role,
-            action_type=f"completed_{action}",
-            description=f"Completed {action} on {path}. Result: {result.get('status')}",
+            action_type=f"completed_{auth.action}",
+            description=f"Completed {auth.action} on {auth.path}. Result: {result.get('status')}",
             spec_ref=spec_id,
             authorized=True,
-            tier=tier,
+            tier=auth.tier,
             execution_result=result
-        ))
+        )
+
+
+class AsyncDTTPGateway:
+    """
+    asyncio front end of a DTTPGateway, sharing its policy engine, action
+    handler and ADS logger.
+
+    The checks are DTTPGateway._authorize itself, so validation order and
+    ADS events are identical to the sync gateway. Only the waiting is
+    different: ADS appends are awaited on the logger's writer thread,
+    git runs as awaited subprocesses, so a pending request holds no
+    thread and one process can serve hundreds of them concurrently.
+    """
+
+    def __init__(self, gateway: DTTPGateway):
+        self.gateway = gateway
+        self.logger = gateway.logger
+        self.action_handler = AsyncActionHandler(gateway.action_handler)
+
+    async def request(self,
+                      agent: str,
+                      role: str,
+                      spec_id: str,
+                      action: str,
+                      params: Dict[str, Any],
+                      rationale: str,
+                      dry_run: bool = False) -> Dict[str, Any]:
+        """Same as DTTPGateway.request()."""
+        gateway = self.gateway
+        auth = gateway._authorize(agent, role, spec_id, action, params, rationale)
+        if auth.denial is not None:
+            await self.logger.log_async(auth.event)
+            return auth.denial
+
+        if dry_run:
+            await self.logger.log_async(gateway._dry_run_event(agent, role, spec_id, rationale, auth))
+            return {"status": "allowed", "dry_run": True}
+
+        await self.logger.log_async(gateway._pre_action_event(agent, role, spec_id, rationale, auth))
+        result = await self.action_handler.execute(auth.action, params, agent=agent, role=role, spec_id=spec_id)
+        await self.logger.log_async(gateway._post_action_event(agent, role, spec_id, auth, result))
 
         return {"status": "allowed", "result": result}
@@ -1,7 +1,11 @@
 import json
 import logging
 import os
-from typing import Dict, List, Any
+import threading
+from typing import Dict, List, Any, Optional
+
+from adt_core import watch
+from .paths import PathTrie
 
 logger = logging.getLogger(__name__)
 
@@ -12,48 +16,54 @@ class JurisdictionManager:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self._jurisdictions = {}
-        self._last_mtime = 0.0
+        self._tries: Dict[str, PathTrie] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
         self._reload()
 
     def _reload(self):
-        """Load jurisdictions from config file, tracking mtime to detect changes."""
-        if not os.path.exists(self.config_path):
-            self._jurisdictions = {}
+        """Load jurisdictions from config file when the file watcher reports a change."""
+        version = watch.version(self.config_path)
+        if version == self._version:
             return
-        try:
-            mtime = os.path.getmtime(self.config_path)
-            if mtime != self._last_mtime:
+        jurisdictions = {}
+        if os.path.exists(self.config_path):
+            try:
                 with open(self.config_path, "r") as f:
                     data = json.load(f)
-                    self._jurisdictions = data.get("jurisdictions", {})
-                self._last_mtime = mtime
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to load jurisdictions config %s: %s", self.config_path, e)
-            self._jurisdictions = {}
+                    jurisdictions = data.get("jurisdictions", {})
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Failed to load jurisdictions config %s: %s", self.config_path, e)
+        tries = {role: PathTrie(self._allowed_paths(config)) for role, config in jurisdictions.items()}
+        # Published together, version last (see SpecValidator._reload_config).
+        with self._lock:
+            self._jurisdictions, self._tries, self._version = jurisdictions, tries, version
+
+    @staticmethod
+    def _allowed_paths(config: Any) -> List[str]:
+        # Support both simple list format and SPEC-026 object format
+        if isinstance(config, list):
+            return config
+        if isinstance(config, dict):
+            return config.get("paths", [])
+        return []
+
+    @property
+    def version(self) -> int:
+        """Change version of the loaded config (reloads first if the file changed)."""
+        self._reload()
+        return self._version
 
     def reload(self):
         """Manually force reload jurisdictions."""
-        self._last_mtime = 0.0
+        self._version = None
         self._reload()
 
     def is_in_jurisdiction(self, role: str, path: str) -> bool:
         """Checks if a path is within a role's jurisdiction."""
         self._reload()
-        normalized = os.path.normpath(path)
-        config = self._jurisdictions.get(role, [])
-        
-        # Support both simple list format and SPEC-026 object format
-        allowed_paths = []
-        if isinstance(config, list):
-            allowed_paths = config
-        elif isinstance(config, dict):
-            allowed_paths = config.get("paths", [])
-            
-        for allowed_path in allowed_paths:
-            allowed_norm = os.path.normpath(allowed_path)
-            if normalized == allowed_norm or normalized.startswith(allowed_norm + os.sep):
-                return True
-        return False
+        trie = self._tries.get(role)
+        return trie is not None and trie.covers(path)
 
     def get_jurisdictions(self) -> Dict[str, Any]:
         """Returns the full jurisdiction map (read-only)."""
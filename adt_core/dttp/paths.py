@@ -0,0 +1,58 @@
+import os
+from typing import Dict, Iterable, List
+
+
+def path_components(path: str) -> List[str]:
+    """Normalized path split into components ("a/./b/" -> ["a", "b"])."""
+    return os.path.normpath(path).split(os.sep)
+
+
+class _Node:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.terminal = False
+
+
+class PathTrie:
+    """
+    Set of authorized path prefixes, compiled into a trie of path components.
+
+    covers(path) is true when path equals one of the prefixes or lies below
+    it on a component boundary ("data" covers "data/x" but not "database"),
+    the same rule as comparing normpath'ed strings with a trailing separator,
+    answered in O(depth of path) however many prefixes there are.
+    """
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self._root = _Node()
+        self.prefixes: List[str] = []
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str):
+        node = self._root
+        for part in path_components(prefix):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            node = child
+        node.terminal = True
+        self.prefixes.append(prefix)
+
+    def covers(self, path: str) -> bool:
+        node = self._root
+        for part in path_components(path):
+            node = node.children.get(part)
+            if node is None:
+                return False
+            if node.terminal:
+                return True
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(self.prefixes)
+
+    def __len__(self) -> int:
+        return len(self.prefixes)
@@ -1,19 +1,103 @@
+import hashlib
+import json
 import logging
-import os
-from typing import Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from adt_core.sdd.validator import SpecValidator
 from .jurisdictions import JurisdictionManager
 
 logger = logging.getLogger(__name__)
 
+# Verdicts remembered per (role, spec, action, path); hooks re-validate the
+# same files over and over during a refactor.
+VERDICT_CACHE_SIZE = 65536
+
+# Policy snapshots kept so /policy/delta can diff against recent revisions.
+POLICY_HISTORY = 16
+
+
+class PolicySnapshot:
+    """The specs and jurisdictions loaded at one policy revision."""
+
+    __slots__ = ("tag", "specs", "jurisdictions", "loaded_at")
+
+    def __init__(self, tag: str, specs: Dict[str, Any], jurisdictions: Dict[str, Any], loaded_at: float):
+        self.tag = tag  # content hash, see PolicyEngine.revision_tag
+        self.specs = specs
+        self.jurisdictions = jurisdictions
+        self.loaded_at = loaded_at
+
 
 class PolicyEngine:
     """Fail-closed policy engine for DTTP."""
 
-    def __init__(self, validator: SpecValidator, jurisdictions: JurisdictionManager):
+    def __init__(self, validator: SpecValidator, jurisdictions: JurisdictionManager,
+                 cache_size: int = VERDICT_CACHE_SIZE):
         self.validator = validator
         self.jurisdictions = jurisdictions
+        self.cache_size = cache_size
+        self._verdicts: "OrderedDict[Tuple, Tuple[bool, str]]" = OrderedDict()
+        self._verdicts_revision: Optional[Tuple[int, int]] = None
+        self._snapshot: Optional[Tuple[Tuple[int, int], PolicySnapshot]] = None
+        self._history: "OrderedDict[str, PolicySnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def revision(self) -> Tuple[int, int]:
+        """Changes whenever the specs or jurisdictions config is reloaded."""
+        return self.validator.version, self.jurisdictions.version
+
+    @property
+    def revision_tag(self) -> str:
+        """
+        Hash of the loaded specs and jurisdictions. Unlike `revision` it is
+        the same in every process and across restarts, so clients can key
+        cached policy and verdicts on it.
+        """
+        return self.snapshot().tag
+
+    def snapshot(self) -> PolicySnapshot:
+        """The current policy (recomputed only after a config reload)."""
+        revision = self.revision
+        cached = self._snapshot
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        specs = self.validator.get_all_specs()
+        jurisdictions = self.jurisdictions.get_jurisdictions()
+        canonical = json.dumps({"specs": specs, "jurisdictions": jurisdictions},
+                               sort_keys=True, separators=(",", ":"), default=str)
+        snapshot = PolicySnapshot(hashlib.sha256(canonical.encode()).hexdigest()[:16],
+                                  specs, jurisdictions, time.time())
+        with self._lock:
+            previous = self._history.get(snapshot.tag)
+            if previous is not None and cached is not None and cached[1] is previous:
+                snapshot = previous  # file rewritten with the same content
+            self._history[snapshot.tag] = snapshot
+            self._history.move_to_end(snapshot.tag)
+            while len(self._history) > POLICY_HISTORY:
+                self._history.popitem(last=False)
+            self._snapshot = (revision, snapshot)
+        return snapshot
+
+    def delta(self, since: str) -> Optional[Dict[str, Any]]:
+        """
+        Specs and roles added or changed since revision `since`, and the ids
+        of removed ones; None if that revision is not among the recent ones.
+        """
+        current = self.snapshot()
+        with self._lock:
+            base = self._history.get(since)
+        if base is None:
+            return None
+        return {
+            "specs": {k: v for k, v in current.specs.items() if base.specs.get(k) != v},
+            "removed_specs": sorted(set(base.specs) - set(current.specs)),
+            "jurisdictions": {k: v for k, v in current.jurisdictions.items() if base.jurisdictions.get(k) != v},
+            "removed_roles": sorted(set(base.jurisdictions) - set(current.jurisdictions)),
+        }
 
     def validate_request(self,
                          role: str,
@@ -24,6 +108,30 @@ class PolicyEngine:
         Validates an action request against specs and jurisdictions.
         Returns (is_allowed, reason).
         """
+        revision = self.revision
+        key = (role, spec_id, action_type, path)
+        with self._lock:
+            if revision != self._verdicts_revision:
+                self._verdicts.clear()
+                self._verdicts_revision = revision
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+                return verdict
+
+        verdict = self._evaluate(role, spec_id, action_type, path)
+
+        with self._lock:
+            # Another request may have seen a newer config meanwhile and
+            # cleared the cache; do not mix this verdict into it.
+            if self.cache_size > 0 and revision == self._verdicts_revision:
+                self._verdicts[key] = verdict
+                if len(self._verdicts) > self.cache_size:
+                    self._verdicts.popitem(last=False)
+        return verdict
+
+    def _evaluate(self, role: str, spec_id: str, action_type: str,
+                  path: Optional[str]) -> Tuple[bool, str]:
         # 1. Check spec authorization
         if not self.validator.is_authorized(spec_id, role, action_type):
             return False, f"Spec {spec_id} does not authorize role {role} for action {action_type}"
@@ -34,16 +142,7 @@ class PolicyEngine:
                 return False, f"Path {path} is outside the jurisdiction of role {role}"
 
             # 3. Check if path is authorized by the spec (with boundary matching)
-            authorized_paths = self.validator.get_authorized_paths(spec_id)
-            normalized = os.path.normpath(path)
-            path_authorized = False
-            for auth_path in authorized_paths:
-                auth_norm = os.path.normpath(auth_path)
-                if normalized == auth_norm or normalized.startswith(auth_norm + os.sep):
-                    path_authorized = True
-                    break
-
-            if not path_authorized:
+            if not self.validator.is_path_authorized(spec_id, path):
                 return False, f"Path {path} is not authorized by spec {spec_id}"
 
         return True, "Authorized"
@@ -0,0 +1,184 @@
+"""
+Serving modes for the DTTP service.
+
+    werkzeug  Flask's development server (debugger and reloader in
+              development mode). The default, as before.
+    threaded  In-process WSGI server with a fixed pool of request threads.
+              No extra dependencies; works on every platform.
+    gunicorn  Pre-forked worker processes, each with a thread pool
+              (pip install adt-framework[server]; Unix only).
+    uvicorn   The asyncio service from asgi.py on an event loop; requests
+              waiting on ADS or git hold no thread (pip install
+              adt-framework[server]).
+
+Every mode shuts down gracefully on SIGTERM/SIGINT: stop accepting
+connections, let in-flight requests finish, then flush and close the ADS
+logger (see create_dttp_app's dttp_shutdown).
+"""
+import logging
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from flask import Flask
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+from werkzeug.wsgi import ClosingIterator
+
+from adt_core.dttp.config import DTTPConfig
+
+logger = logging.getLogger(__name__)
+
+SERVERS = ("werkzeug", "threaded", "gunicorn", "uvicorn")
+
+
+class InFlightTracker:
+    """WSGI middleware counting requests whose response is not yet fully sent."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+        self._count = 0
+        self._idle = threading.Condition()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def __call__(self, environ, start_response):
+        with self._idle:
+            self._count += 1
+        try:
+            app_iter = self.wsgi_app(environ, start_response)
+        except BaseException:
+            self._done()
+            raise
+        return ClosingIterator(app_iter, self._done)
+
+    def _done(self):
+        with self._idle:
+            self._count -= 1
+            if self._count == 0:
+                self._idle.notify_all()
+
+    def wait_idle(self, timeout: float) -> bool:
+        """Blocks until no request is in flight; False if timeout ran out first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._count == 0, timeout)
+
+
+class _OneShotRequestHandler(WSGIRequestHandler):
+    # One request per connection: a pooled thread parked on an idle
+    # keep-alive connection would starve the other clients.
+    protocol_version = "HTTP/1.0"
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug WSGI server handing each connection to a fixed thread pool."""
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, app, threads: int = 16):
+        super().__init__(host, port, app, handler=_OneShotRequestHandler)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="dttp-request")
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def serve(config: DTTPConfig, app_factory: Callable[[DTTPConfig], Flask]):
+    """Runs the DTTP service with the server selected in config.server."""
+    server = config.server or "werkzeug"
+    if server not in SERVERS:
+        raise ValueError(f"Unknown DTTP server '{server}' (expected one of: {', '.join(SERVERS)})")
+    if server == "uvicorn":
+        _serve_uvicorn(config)
+    elif server == "gunicorn":
+        _serve_gunicorn(config, app_factory)
+    elif server == "threaded":
+        _serve_threaded(config, app_factory(config))
+    else:
+        _serve_werkzeug(config, app_factory(config))
+
+
+def _serve_werkzeug(config: DTTPConfig, app: Flask):
+    try:
+        app.run(host="::", port=config.port, debug=(config.mode == "development"))
+    finally:
+        app.dttp_shutdown()
+
+
+def _serve_threaded(config: DTTPConfig, app: Flask):
+    httpd = PooledWSGIServer("::", config.port, app, threads=config.server_threads)
+
+    def stop(signum, frame):
+        logger.info("Received signal %d, draining in-flight DTTP requests", signum)
+        # shutdown() waits for serve_forever to return, so not from its own thread.
+        threading.Thread(target=httpd.shutdown, name="dttp-shutdown", daemon=True).start()
+
+    previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+    logger.info("DTTP serving on :%d with %d request threads", config.port, config.server_threads)
+    try:
+        httpd.serve_forever()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        # Stop accepting and run every queued connection first: requests still
+        # waiting in the pool are not in flight yet and need the ADS logger.
+        httpd.server_close()
+        app.dttp_shutdown()
+
+
+def _serve_gunicorn(config: DTTPConfig, app_factory: Callable[[DTTPConfig], Flask]):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("The gunicorn server needs gunicorn: pip install adt-framework[server]") from None
+
+    def worker_exit(server, worker):
+        # Gunicorn has already drained the worker's requests (graceful_timeout).
+        worker.wsgi.dttp_shutdown(timeout=0)
+
+    options = {
+        "bind": f"[::]:{config.port}",
+        "workers": max(1, config.server_workers),
+        "threads": max(1, config.server_threads),
+        "worker_class": "gthread",
+        "graceful_timeout": max(1, int(config.shutdown_timeout)),
+        "worker_exit": worker_exit,
+    }
+
+    class DTTPApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            # Called in each worker, so every process gets its own ADS logger.
+            return app_factory(config)
+
+    DTTPApplication().run()
+
+
+def _serve_uvicorn(config: DTTPConfig):
+    try:
+        import uvicorn
+    except ImportError:
+        raise RuntimeError("The uvicorn server needs uvicorn: pip install adt-framework[server]") from None
+    from adt_core.dttp.asgi import create_dttp_asgi_app
+
+    # uvicorn drains connections on SIGTERM/SIGINT, then the lifespan
+    # shutdown closes the ADS logger.
+    uvicorn.run(create_dttp_asgi_app(config), host="::", port=config.port, lifespan="on",
+                timeout_graceful_shutdown=config.shutdown_timeout, log_level="info")
@@ -7,75 +7,306 @@ Usage:
     python -m adt_core.dttp.service                          # auto-detect from cwd
     python -m adt_core.dttp.service --project-root /path     # explicit project root
     python -m adt_core.dttp.service --port 5002              # custom port
+    python -m adt_core.dttp.service --server threaded        # production serving (see server.py)
 """
 import argparse
+import json
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timezone
 
 from flask import Flask, request, jsonify
 
 from adt_core.ads.logger import ADSLogger
+from adt_core.ads.schema import ADSEventSchema
 from adt_core.sdd.validator import SpecValidator
 from adt_core.dttp.config import DTTPConfig
 from adt_core.dttp.jurisdictions import JurisdictionManager
 from adt_core.dttp.policy import PolicyEngine
 from adt_core.dttp.actions import ActionHandler
-from adt_core.dttp.gateway import DTTPGateway
+from adt_core.dttp.commit_queue import CommitQueue
+from adt_core.dttp.gateway import BATCH_MODES, DTTPGateway
+from adt_core.dttp.server import SERVERS, InFlightTracker, serve
+from adt_core.dttp.sync import GitSync
 
 logger = logging.getLogger(__name__)
 
-
-def create_dttp_app(config: DTTPConfig) -> Flask:
-    """Create the standalone DTTP Flask application."""
-    app = Flask(__name__)
-    app.config["DTTP"] = config
-
-    # Initialize engines
-    ads_logger = ADSLogger(config.ads_path)
+# Upper bound on items in one /request/batch call.
+MAX_BATCH_REQUESTS = 1000
+
+REQUEST_FIELDS = ["agent", "role", "spec_id", "action", "params", "rationale"]
+
+
+def _request_error(data):
+    """Returns an error response body if a request object is malformed, else None."""
+    for field in REQUEST_FIELDS:
+        if field not in data:
+            return {"status": "error", "code": "MISSING_FIELD", "message": f"Missing required field: {field}"}
+    if not isinstance(data["params"], dict):
+        return {"status": "error", "code": "INVALID_TYPE", "message": "params must be an object"}
+    if not isinstance(data["rationale"], str) or not data["rationale"].strip():
+        return {"status": "error", "code": "INVALID_TYPE", "message": "rationale must be a non-empty string"}
+    cache_hits = data.get("cache_hits")
+    if cache_hits is not None and (type(cache_hits) is not int or cache_hits < 0):
+        return {"status": "error", "code": "INVALID_TYPE", "message": "cache_hits must be a non-negative integer"}
+    return None
+
+
+def parse_batch(data):
+    """
+    Validates a /request/batch body. Returns (error, items, mode, dry_run)
+    where error is an error response body or None, and items are complete
+    request dicts with the top-level defaults applied.
+    """
+    if not isinstance(data, dict):
+        return {"status": "error", "code": "INVALID_BODY", "message": "Request body must be JSON"}, None, None, False
+
+    items = data.get("requests")
+    if not isinstance(items, list) or not items:
+        return {"status": "error", "code": "INVALID_TYPE", "message": "requests must be a non-empty array"}, None, None, False
+    if len(items) > MAX_BATCH_REQUESTS:
+        return {"status": "error", "code": "BATCH_TOO_LARGE",
+                "message": f"At most {MAX_BATCH_REQUESTS} requests per batch"}, None, None, False
+    mode = data.get("mode", "best_effort")
+    if mode not in BATCH_MODES:
+        return {"status": "error", "code": "INVALID_MODE",
+                "message": f"mode must be one of: {', '.join(BATCH_MODES)}"}, None, None, False
+
+    defaults = {k: data[k] for k in ("agent", "role", "spec_id", "rationale") if k in data}
+    merged = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return {"status": "error", "code": "INVALID_TYPE", "index": index,
+                    "message": "each request must be an object"}, None, None, False
+        item = {**defaults, **item}
+        error = _request_error(item)
+        if error:
+            error["index"] = index
+            return error, None, None, False
+        merged.append({k: item[k] for k in REQUEST_FIELDS})
+    return None, merged, mode, bool(data.get("dry_run", False))
+
+
+def normalize_log_event(data):
+    # SPEC-020 Amendment B: Normalize role and agent before logging
+    if "agent" in data:
+        data["agent"] = ADSEventSchema.normalize_agent(data["agent"])
+    if "role" in data:
+        data["role"] = ADSEventSchema.normalize_role(data["role"])
+    return data
+
+
+class ServiceStats:
+    """Request counters shared by every request thread (per process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.total_denials = 0
+        self.hook_cache_hits = 0
+        self.hook_cache_misses = 0
+
+    def record(self, requests: int = 1, denials: int = 0):
+        with self._lock:
+            self.total_requests += requests
+            self.total_denials += denials
+
+    def record_hook_cache(self, hits: int):
+        """A hook verdict cache missed (this request), after `hits` hits since its last report."""
+        with self._lock:
+            self.hook_cache_hits += hits
+            self.hook_cache_misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"total_requests": self.total_requests, "total_denials": self.total_denials,
+                    "hook_cache_hits": self.hook_cache_hits, "hook_cache_misses": self.hook_cache_misses}
+
+
+def finish_request(gateway: DTTPGateway, stats: ServiceStats, data: dict, result: dict) -> int:
+    """
+    Records a /request call and stamps the result with the policy revision
+    (hooks key their verdict caches on it). Returns the HTTP status.
+    """
+    result["policy_revision"] = gateway.policy_engine.revision_tag
+    denied = result["status"] == "denied"
+    stats.record(denials=1 if denied else 0)
+    if data.get("cache_hits") is not None:
+        stats.record_hook_cache(data["cache_hits"])
+    return 403 if denied else 200
+
+
+def create_gateway(config: DTTPConfig) -> DTTPGateway:
+    """Builds the gateway and its engines from the service config."""
+    ads_logger = ADSLogger(
+        config.ads_path,
+        group_commit=config.ads_group_commit,
+        max_batch_size=config.ads_max_batch_size,
+        max_wait_ms=config.ads_max_wait_ms,
+        max_segment_bytes=config.ads_segment_max_bytes,
+        max_segment_events=config.ads_segment_max_events,
+        segment_codec=config.ads_segment_codec,
+    )
     validator = SpecValidator(config.specs_config)
     jurisdictions = JurisdictionManager(config.jurisdictions_config)
     policy_engine = PolicyEngine(validator, jurisdictions)
-    action_handler = ActionHandler(config.project_root)
+    commit_queue = None
+    if config.git_commit_queue:
+        commit_queue = CommitQueue(
+            GitSync(config.project_root),
+            ads_logger,
+            window_s=config.git_commit_window_ms / 1000.0,
+            group_by=config.git_commit_group_by,
+            push_retries=config.git_push_retries,
+        )
+    action_handler = ActionHandler(config.project_root, commit_queue=commit_queue)
     gateway = DTTPGateway(policy_engine, action_handler, ads_logger, is_framework=config.is_framework_project)
 
-    # Store on app for access in routes
-    app.dttp_gateway = gateway
-    app.dttp_validator = validator
-    app.dttp_jurisdictions = jurisdictions
-    app.dttp_start_time = time.time()
-    app.dttp_stats = {"total_requests": 0, "total_denials": 0}
-
     # SPEC-020 Amendment B: Load canonical roles for normalization
     try:
-        from adt_core.ads.schema import ADSEventSchema
-        import json
         with open(config.jurisdictions_config) as f:
             jur_data = json.load(f)
             ADSEventSchema.CANONICAL_ROLES = list(jur_data.get("jurisdictions", {}).keys())
     except Exception as e:
         pass
 
+    return gateway
+
+
+def status_body(config: DTTPConfig, gateway: DTTPGateway, stats: ServiceStats, start_time: float) -> dict:
+    validator = gateway.policy_engine.validator
+    counters = stats.snapshot()
+    cache_lookups = counters["hook_cache_hits"] + counters["hook_cache_misses"]
+    return {
+        "service": "dttp",
+        "version": "0.1.0",
+        "mode": config.mode,
+        "enforcement_mode": config.enforcement_mode,
+        "project": config.project_name,
+        "uptime_seconds": int(time.time() - start_time),
+        "policy_loaded": bool(validator.get_all_specs()),
+        "specs_count": len(validator.get_all_specs()),
+        "jurisdictions_count": len(gateway.policy_engine.jurisdictions.get_jurisdictions()),
+        "total_requests": counters["total_requests"],
+        "total_denials": counters["total_denials"],
+        "policy_revision": gateway.policy_engine.revision_tag,
+        "hook_cache": {
+            "hits": counters["hook_cache_hits"],
+            "misses": counters["hook_cache_misses"],
+            "hit_rate": round(counters["hook_cache_hits"] / cache_lookups, 4) if cache_lookups else None,
+        },
+        "server": config.server,
+    }
+
+
+def sync_status_body(gateway: DTTPGateway) -> dict:
+    commit_queue = gateway.action_handler.commit_queue
+    if commit_queue is None:
+        return {"enabled": False}
+    return commit_queue.status()
+
+
+def close_gateway(gateway: DTTPGateway, timeout: float):
+    """Commits queued changes, then flushes and closes the ADS logger."""
+    commit_queue = gateway.action_handler.commit_queue
+    if commit_queue is not None:
+        commit_queue.close(timeout)
+    gateway.logger.close()
+
+
+def etag_matches(if_none_match, tag: str) -> bool:
+    """True if an If-None-Match header value names entity tag `tag` (or is *)."""
+    for candidate in (if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate.strip('"') == tag:
+            return True
+    return False
+
+
+def policy_body(gateway: DTTPGateway) -> dict:
+    snapshot = gateway.policy_engine.snapshot()
+    return {
+        "specs": snapshot.specs,
+        "jurisdictions": snapshot.jurisdictions,
+        "rules": gateway.rules(),
+        "policy_revision": snapshot.tag,
+        "last_reload": datetime.fromtimestamp(snapshot.loaded_at, timezone.utc).isoformat(),
+    }
+
+
+def policy_delta_body(gateway: DTTPGateway, since: str) -> dict:
+    """
+    Specs and roles changed since revision `since`. If the service no
+    longer knows that revision (restart, another worker, too old), the
+    full policy is returned with "full": true.
+    """
+    engine = gateway.policy_engine
+    snapshot = engine.snapshot()
+    delta = engine.delta(since)
+    body = {"policy_revision": snapshot.tag, "since": since, "full": delta is None, "rules": gateway.rules(),
+            "last_reload": datetime.fromtimestamp(snapshot.loaded_at, timezone.utc).isoformat()}
+    if delta is None:
+        delta = {"specs": snapshot.specs, "removed_specs": [],
+                 "jurisdictions": snapshot.jurisdictions, "removed_roles": []}
+    body.update(delta)
+    return body
+
+
+def policy_response(gateway: DTTPGateway, if_none_match, since=None):
+    """
+    (status, body, etag) for GET /policy, or /policy/delta when `since` is
+    given. The ETag is the policy revision; a client that already holds it
+    gets 304 and no body.
+    """
+    tag = gateway.policy_engine.revision_tag
+    if etag_matches(if_none_match, tag):
+        return 304, None, tag
+    if since is None:
+        return 200, policy_body(gateway), tag
+    if not since:
+        return 400, {"status": "error", "code": "MISSING_FIELD",
+                     "message": "Missing required query parameter: since"}, tag
+    return 200, policy_delta_body(gateway, since), tag
+
+
+def create_dttp_app(config: DTTPConfig) -> Flask:
+    """Create the standalone DTTP Flask application."""
+    app = Flask(__name__)
+    app.config["DTTP"] = config
+
+    gateway = create_gateway(config)
+
+    # Store on app for access in routes
+    app.dttp_gateway = gateway
+    app.dttp_validator = gateway.policy_engine.validator
+    app.dttp_jurisdictions = gateway.policy_engine.jurisdictions
+    app.dttp_start_time = time.time()
+    app.dttp_stats = ServiceStats()
+    app.dttp_in_flight = InFlightTracker(app.wsgi_app)
+    app.wsgi_app = app.dttp_in_flight
+
+    def dttp_shutdown(timeout: float = config.shutdown_timeout):
+        """Waits for in-flight requests, then commits queued changes and closes the ADS logger."""
+        if not app.dttp_in_flight.wait_idle(timeout):
+            logger.warning("Shutting down with %d DTTP requests still in flight", app.dttp_in_flight.count)
+        close_gateway(gateway, config.shutdown_timeout)
+
+    app.dttp_shutdown = dttp_shutdown
+
     @app.route("/request", methods=["POST"])
     def dttp_request():
         data = request.get_json()
         if not data:
             return jsonify({"status": "error", "code": "INVALID_BODY", "message": "Request body must be JSON"}), 400
 
-        # Validate required fields
-        required = ["agent", "role", "spec_id", "action", "params", "rationale"]
-        for field in required:
-            if field not in data:
-                return jsonify({"status": "error", "code": "MISSING_FIELD", "message": f"Missing required field: {field}"}), 400
-
-        # Type validation
-        if not isinstance(data["params"], dict):
-            return jsonify({"status": "error", "code": "INVALID_TYPE", "message": "params must be an object"}), 400
-        if not isinstance(data["rationale"], str) or not data["rationale"].strip():
-            return jsonify({"status": "error", "code": "INVALID_TYPE", "message": "rationale must be a non-empty string"}), 400
-
-        app.dttp_stats["total_requests"] += 1
+        # Validate required fields and types
+        error = _request_error(data)
+        if error:
+            return jsonify(error), 400
 
         dry_run = bool(data.get("dry_run", False))
 
@@ -89,10 +320,25 @@ def create_dttp_app(config: DTTPConfig) -> Flask:
             dry_run=dry_run,
         )
 
-        if result["status"] == "denied":
-            app.dttp_stats["total_denials"] += 1
-            return jsonify(result), 403
-
+        status = finish_request(app.dttp_gateway, app.dttp_stats, data, result)
+        return jsonify(result), status
+
+    @app.route("/request/batch", methods=["POST"])
+    def dttp_request_batch():
+        """
+        Validates (and unless dry_run, executes) several requests in one call.
+        Body: {"requests": [...], "mode": "best_effort"|"all_or_nothing",
+        "dry_run": bool}; top-level agent/role/spec_id/rationale apply to
+        items that omit them. Results are reported per item, in order.
+        """
+        error, merged, mode, dry_run = parse_batch(request.get_json(silent=True))
+        if error:
+            return jsonify(error), 400
+
+        result = app.dttp_gateway.request_batch(merged, mode=mode, dry_run=dry_run)
+        result["policy_revision"] = app.dttp_gateway.policy_engine.revision_tag
+
+        app.dttp_stats.record(requests=len(merged), denials=result["denied"])
         return jsonify(result), 200
 
     @app.route("/log", methods=["POST"])
@@ -103,41 +349,37 @@ def create_dttp_app(config: DTTPConfig) -> Flask:
             return jsonify({"status": "error", "code": "INVALID_BODY", "message": "Request body must be JSON"}), 400
 
         try:
-            # SPEC-020 Amendment B: Normalize role and agent before logging
-            from adt_core.ads.schema import ADSEventSchema
-            if "agent" in data:
-                data["agent"] = ADSEventSchema.normalize_agent(data["agent"])
-            if "role" in data:
-                data["role"] = ADSEventSchema.normalize_role(data["role"])
-
-            event_id = app.dttp_gateway.logger.log(data)
+            event_id = app.dttp_gateway.logger.log(normalize_log_event(data))
             return jsonify({"status": "success", "event_id": event_id}), 200
         except ValueError as e:
             return jsonify({"status": "error", "code": "INVALID_EVENT", "message": str(e)}), 400
 
     @app.route("/status", methods=["GET"])
     def dttp_status():
-        return jsonify({
-            "service": "dttp",
-            "version": "0.1.0",
-            "mode": config.mode,
-            "enforcement_mode": config.enforcement_mode,
-            "project": config.project_name,
-            "uptime_seconds": int(time.time() - app.dttp_start_time),
-            "policy_loaded": bool(app.dttp_validator.get_all_specs()),
-            "specs_count": len(app.dttp_validator.get_all_specs()),
-            "jurisdictions_count": len(app.dttp_jurisdictions.get_jurisdictions()),
-            "total_requests": app.dttp_stats["total_requests"],
-            "total_denials": app.dttp_stats["total_denials"],
-        })
+        return jsonify(status_body(config, app.dttp_gateway, app.dttp_stats, app.dttp_start_time))
+
+    def _policy_reply(response):
+        status, body, tag = response
+        reply = app.response_class(status=304) if body is None else jsonify(body)
+        reply.status_code = status
+        reply.headers["ETag"] = f'"{tag}"'
+        return reply
 
     @app.route("/policy", methods=["GET"])
     def dttp_policy():
-        return jsonify({
-            "specs": app.dttp_validator.get_all_specs(),
-            "jurisdictions": app.dttp_jurisdictions.get_jurisdictions(),
-            "last_reload": datetime.now(timezone.utc).isoformat(),
-        })
+        """Full policy; ETag / If-None-Match let clients revalidate a cached copy."""
+        return _policy_reply(policy_response(app.dttp_gateway, request.headers.get("If-None-Match")))
+
+    @app.route("/policy/delta", methods=["GET"])
+    def dttp_policy_delta():
+        """Specs and roles changed since ?since=<policy_revision>."""
+        return _policy_reply(policy_response(app.dttp_gateway, request.headers.get("If-None-Match"),
+                                             since=request.args.get("since", "")))
+
+    @app.route("/sync/status", methods=["GET"])
+    def dttp_sync_status():
+        """Background git commit queue: depth, lag and push state."""
+        return jsonify(sync_status_body(app.dttp_gateway))
 
     return app
 
@@ -148,6 +390,9 @@ def main():
     parser.add_argument("--project-root", type=str, default=None, help="Project root directory")
     parser.add_argument("--mode", type=str, default=None, choices=["development", "production"], help="Operating mode")
     parser.add_argument("--enforcement-mode", type=str, default=None, choices=["development", "production"], help="Enforcement mode")
+    parser.add_argument("--server", type=str, default=None, choices=SERVERS, help="HTTP server (default: werkzeug)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (gunicorn)")
+    parser.add_argument("--threads", type=int, default=None, help="Request threads per process (threaded, gunicorn)")
     args = parser.parse_args()
 
     # Build config: env vars first, then CLI args override
@@ -170,15 +415,20 @@ def main():
         config.mode = args.mode
     if args.enforcement_mode is not None:
         config.enforcement_mode = args.enforcement_mode
+    if args.server is not None:
+        config.server = args.server
+    if args.workers is not None:
+        config.server_workers = args.workers
+    if args.threads is not None:
+        config.server_threads = args.threads
 
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [DTTP] %(levelname)s %(name)s: %(message)s",
     )
 
-    logger.info("Starting DTTP service on :%d (mode=%s, enforcement=%s, project=%s)", config.port, config.mode, config.enforcement_mode, config.project_name)
-    app = create_dttp_app(config)
-    app.run(host="::", port=config.port, debug=(config.mode == "development"))
+    logger.info("Starting DTTP service on :%d (mode=%s, enforcement=%s, project=%s, server=%s)", config.port, config.mode, config.enforcement_mode, config.project_name, config.server)
+    serve(config, create_dttp_app)
 
 
 if __name__ == "__main__":
@@ -1,23 +1,59 @@
+import asyncio
 import logging
 import subprocess
 import os
+from typing import List, Optional
+
+from adt_core import gitstate
 
 logger = logging.getLogger(__name__)
 
 class GitSync:
     def __init__(self, project_root: str):
         self.project_root = os.path.realpath(project_root)
+        self._env = gitstate.git_env()
 
     def _run_git(self, args: list) -> bool:
+        return self._git_output(args) is not None
+
+    def _git_output(self, args: list) -> Optional[str]:
+        """Runs git; returns its stripped stdout, or None if it failed."""
         try:
-            env = os.environ.copy()
-            env["GIT_PAGER"] = "cat"
-            env["GIT_TERMINAL_PROMPT"] = "0"
-            subprocess.run(["git"] + args, cwd=self.project_root, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
-            return True
+            proc = subprocess.run(["git"] + args, cwd=self.project_root, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=self._env)
+            return proc.stdout.strip()
         except Exception as e:
             logger.error(f"Git error: {e}")
-            return False
+            return None
+        finally:
+            gitstate.invalidate(self.project_root)
+
+    def head(self) -> Optional[str]:
+        """Current commit hash, read from .git without running git."""
+        try:
+            return gitstate.get_git_state(self.project_root).head()
+        except (OSError, ValueError) as e:
+            logger.error(f"Git error: {e}")
+            return None
+
+    def commit(self, paths: List[str], message: str) -> Optional[str]:
+        """
+        Stages paths (new, changed or deleted; relative to the project root
+        or absolute) and commits them. Returns the new commit hash, or None
+        if nothing was committed.
+        """
+        rel_paths = [os.path.relpath(os.path.join(self.project_root, p), self.project_root) for p in paths]
+        if not self._run_git(["add", "-A", "--"] + rel_paths): return None
+        if not self._run_git(["commit", "-m", message]): return None
+        return self.head()
+
+    def has_changes(self, paths: List[str]) -> Optional[bool]:
+        """Whether paths have uncommitted changes; None if git failed."""
+        rel_paths = [os.path.relpath(os.path.join(self.project_root, p), self.project_root) for p in paths]
+        output = self._git_output(["status", "--porcelain", "--"] + rel_paths)
+        return None if output is None else bool(output)
+
+    def push(self) -> bool:
+        return self._run_git(["push"])
 
     def commit_and_push(self, file_path: str, message: str, agent: str = None, role: str = None) -> bool:
         rel_path = os.path.relpath(file_path, self.project_root)
@@ -32,3 +68,63 @@ class GitSync:
             logger.warning("Push failed")
             return False
         return True
+
+
+class AsyncGitSync:
+    """
+    GitSync for asyncio callers: git runs as an awaited subprocess, not in a
+    thread. Not a GitSync subclass, so no synchronous method can end up
+    calling the coroutine _run_git.
+    """
+
+    def __init__(self, project_root: str):
+        self.project_root = os.path.realpath(project_root)
+        self._env = gitstate.git_env()
+
+    def head(self) -> Optional[str]:
+        """Current commit hash, read from .git without running git."""
+        try:
+            return gitstate.get_git_state(self.project_root).head()
+        except (OSError, ValueError) as e:
+            logger.error(f"Git error: {e}")
+            return None
+
+    async def commit(self, paths: List[str], message: str) -> Optional[str]:
+        """Same as GitSync.commit()."""
+        rel_paths = [os.path.relpath(os.path.join(self.project_root, p), self.project_root) for p in paths]
+        if not await self._run_git(["add", "-A", "--"] + rel_paths): return None
+        if not await self._run_git(["commit", "-m", message]): return None
+        return self.head()
+
+    async def push(self) -> bool:
+        return await self._run_git(["push"])
+
+    async def _run_git(self, args: list) -> bool:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git", *args, cwd=self.project_root, env=self._env,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, ["git"] + args, stderr=stderr)
+            return True
+        except Exception as e:
+            logger.error(f"Git error: {e}")
+            return False
+        finally:
+            gitstate.invalidate(self.project_root)
+
+    async def commit_and_push(self, file_path: str, message: str, agent: str = None, role: str = None) -> bool:
+        rel_path = os.path.relpath(file_path, self.project_root)
+        if not await self._run_git(["add", rel_path]): return False
+
+        full_message = f"[ADT] {message}"
+        if agent and role:
+            full_message += f" - {agent} ({role})"
+
+        await self._run_git(["commit", "-m", full_message])
+        if not await self._run_git(["push"]):
+            logger.warning("Push failed")
+            return False
+        return True
@@ -0,0 +1,201 @@
+"""
+Warm, cached view of a git repository's HEAD and working-tree status.
+
+HEAD and branch are read straight from .git (HEAD, loose refs,
+packed-refs) without running git, and re-read only when the shared
+FileWatcher reports one of those files changed. `git status` output is
+cached until the index, HEAD or anything in the working tree changes
+(TreeWatcher), so polling it is a handful of dict lookups; git itself runs
+only after a change.
+"""
+import logging
+import os
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from adt_core import watch
+
+logger = logging.getLogger(__name__)
+
+GIT_ENV = {"GIT_PAGER": "cat", "GIT_TERMINAL_PROMPT": "0"}
+
+
+def git_env() -> Dict[str, str]:
+    """Environment for non-interactive git subprocesses."""
+    env = os.environ.copy()
+    env.update(GIT_ENV)
+    return env
+
+
+def find_git_dirs(root: str) -> Optional[Tuple[str, str]]:
+    """(git_dir, common_dir) of the repository whose work tree is root, or None."""
+    dot_git = os.path.join(root, ".git")
+    if os.path.isfile(dot_git):
+        # Linked worktree or submodule: ".git" is a "gitdir: <path>" pointer.
+        try:
+            with open(dot_git) as f:
+                content = f.read().strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = os.path.normpath(os.path.join(root, content[len("gitdir:"):].strip()))
+    elif os.path.isdir(dot_git):
+        git_dir = dot_git
+    else:
+        return None
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, "commondir")) as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        pass
+    return git_dir, common_dir
+
+
+class GitState:
+    """HEAD, branch and `git status --porcelain` of one work tree, cached."""
+
+    def __init__(self, root: str, watcher: Optional[watch.FileWatcher] = None, tree_backend: Optional[str] = None):
+        self.root = os.path.realpath(root)
+        dirs = find_git_dirs(self.root)
+        if dirs is None:
+            raise ValueError(f"Not a git repository: {self.root}")
+        self.git_dir, self.common_dir = dirs
+        self._watcher = watcher or watch.get_watcher()
+        self._tree_backend = tree_backend
+        self._tree: Optional[watch.TreeWatcher] = None
+        self._env = git_env()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._head: Optional[Tuple[Tuple, Optional[str], Optional[str]]] = None
+        self._status: Optional[Tuple[Tuple, List[str]]] = None
+
+    def invalidate(self):
+        """Forget cached state, e.g. right after this process ran git."""
+        self._generation += 1
+
+    # --- HEAD ---
+
+    def head(self) -> Optional[str]:
+        """Commit hash HEAD points to (None on an unborn branch)."""
+        return self._read_head()[2]
+
+    def branch(self) -> str:
+        """Current branch name, or "HEAD" when detached (like rev-parse --abbrev-ref)."""
+        ref = self._read_head()[1]
+        if ref is None:
+            return "HEAD"
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+
+    def _read_head(self) -> Tuple[Tuple, Optional[str], Optional[str]]:
+        version = self._watcher.version
+        key = (self._generation, version(os.path.join(self.git_dir, "HEAD")),
+               version(os.path.join(self.common_dir, "packed-refs")))
+        cached = self._head
+        if cached is not None:
+            cached_key, ref, _ = cached
+            if cached_key == key + ((version(self._ref_path(ref)),) if ref else ()):
+                return cached
+
+        # Versions are taken before reading, so a concurrent change is seen next time.
+        with open(os.path.join(self.git_dir, "HEAD")) as f:
+            content = f.read().strip()
+        if content.startswith("ref:"):
+            ref = content[len("ref:"):].strip()
+            key += (version(self._ref_path(ref)),)
+            sha = self._resolve(ref)
+        else:
+            ref, sha = None, content
+        self._head = (key, ref, sha)
+        return self._head
+
+    def _ref_path(self, ref: str) -> str:
+        # Per-worktree refs (HEAD and friends) live in git_dir, the rest in common_dir.
+        base = self.common_dir if ref.startswith("refs/") else self.git_dir
+        return os.path.join(base, *ref.split("/"))
+
+    def _resolve(self, ref: str, depth: int = 0) -> Optional[str]:
+        try:
+            with open(self._ref_path(ref)) as f:
+                value = f.read().strip()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return self._packed_refs().get(ref)
+        if value.startswith("ref:") and depth < 5:
+            return self._resolve(value[len("ref:"):].strip(), depth + 1)
+        return value or None
+
+    def _packed_refs(self) -> Dict[str, str]:
+        refs = {}
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs")) as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    parts = line.split()
+                    if len(parts) == 2:
+                        refs[parts[1]] = parts[0]
+        except FileNotFoundError:
+            pass
+        return refs
+
+    # --- Status ---
+
+    def status(self) -> List[str]:
+        """Lines of `git status --porcelain` (cached until something changes)."""
+        if self._tree is None:
+            with self._lock:
+                if self._tree is None:
+                    self._tree = watch.TreeWatcher(self.root, exclude=(".git",), backend=self._tree_backend)
+        version = self._watcher.version
+        key = (self._tree.version(), version(os.path.join(self.git_dir, "index")),
+               version(os.path.join(self.git_dir, "info", "exclude")), self._read_head()[0])
+        cached = self._status
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
+        # --no-optional-locks: do not refresh the index, which would itself
+        # look like a change and defeat the cache.
+        proc = subprocess.run(["git", "--no-optional-locks", "status", "--porcelain"], cwd=self.root,
+                              check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                              env=self._env)
+        lines = proc.stdout.splitlines()
+        self._status = (key, lines)
+        return list(lines)
+
+    def close(self):
+        if self._tree is not None:
+            self._tree.close()
+
+
+_states: Dict[str, GitState] = {}
+_states_lock = threading.Lock()
+
+
+def get_git_state(root: str) -> GitState:
+    """The process-wide GitState of the work tree at root (ValueError if not a repository)."""
+    key = os.path.realpath(root)
+    state = _states.get(key)
+    if state is None:
+        with _states_lock:
+            state = _states.get(key)
+            if state is None:
+                state = _states[key] = GitState(key)
+    return state
+
+
+def invalidate(root: str):
+    """Marks the cached state of root stale, if there is any."""
+    state = _states.get(os.path.realpath(root))
+    if state is not None:
+        state.invalidate()
+
+
+def _forget_after_fork():
+    # Tree watchers hold inotify descriptors shared with the parent.
+    _states.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
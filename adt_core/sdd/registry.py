@@ -1,18 +1,45 @@
 import os
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from adt_core import watch
 
 logger = logging.getLogger(__name__)
 
 class SpecRegistry:
     """Manages discovery and lifecycle of specifications."""
 
+    # Parsed specs per directory, shared by all instances (the center builds
+    # a registry per request) and dropped when the directory changes.
+    _cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
     def __init__(self, specs_dir: str):
         self.specs_dir = specs_dir
 
     def list_specs(self) -> List[Dict[str, str]]:
         """Lists all specs found in the specs directory with their status."""
+        cached = self._cached()
+        if "list" not in cached:
+            cached["list"] = self._list_specs()
+        return [dict(spec) for spec in cached["list"]]
+
+    def get_spec_detail(self, spec_id: str) -> Optional[Dict[str, Any]]:
+        """Returns detailed metadata for a specific spec."""
+        details = self._cached().setdefault("details", {})
+        if spec_id not in details:
+            details[spec_id] = self._get_spec_detail(spec_id)
+        detail = details[spec_id]
+        return dict(detail) if detail is not None else None
+
+    def _cached(self) -> Dict[str, Any]:
+        version = watch.version(self.specs_dir)
+        cached = self._cache.get(self.specs_dir)
+        if cached is None or cached[0] != version:
+            cached = self._cache[self.specs_dir] = (version, {})
+        return cached[1]
+
+    def _list_specs(self) -> List[Dict[str, str]]:
         specs = []
         if not os.path.exists(self.specs_dir):
             return specs
@@ -28,8 +55,7 @@ class SpecRegistry:
                 })
         return sorted(specs, key=lambda x: x["id"])
 
-    def get_spec_detail(self, spec_id: str) -> Optional[Dict[str, Any]]:
-        """Returns detailed metadata for a specific spec."""
+    def _get_spec_detail(self, spec_id: str) -> Optional[Dict[str, Any]]:
         for filename in os.listdir(self.specs_dir):
             if filename.startswith(spec_id):
                 path = os.path.join(self.specs_dir, filename)
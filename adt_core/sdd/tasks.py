@@ -1,7 +1,9 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from adt_core import watch
 
 # Cross-platform file locking
 try:
@@ -17,6 +19,10 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 class TaskManager:
+    # Parsed task lists per file, shared by all instances and dropped when
+    # the file watcher reports a change.
+    _cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
     def __init__(self, file_path: str, project_name: str = 'unknown'):
         self.file_path = file_path
         self.project_name = project_name
@@ -27,23 +33,32 @@ class TaskManager:
         if not os.path.exists(self.file_path):
             with open(self.file_path, 'w') as f:
                 json.dump({'project': self.project_name, 'tasks': []}, f, indent=2)
+            watch.invalidate(self.file_path)
 
     def list_tasks(self, status: Optional[str] = None, assigned_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        tasks = self._load_tasks()
+        if status:
+            tasks = [t for t in tasks if t.get('status') == status]
+        if assigned_to:
+            tasks = [t for t in tasks if assigned_to in (t.get('assigned_to') or '')]
+        return [dict(t) for t in tasks]
+
+    def _load_tasks(self) -> List[Dict[str, Any]]:
+        version = watch.version(self.file_path)
+        cached = self._cache.get(self.file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         with open(self.file_path, 'r') as f:
             self._lock(f)
             try:
-                data = json.load(f)
-                tasks = data.get('tasks', [])
-                if status:
-                    tasks = [t for t in tasks if t.get('status') == status]
-                if assigned_to:
-                    tasks = [t for t in tasks if assigned_to in (t.get('assigned_to') or '')]
-                return tasks
+                tasks = json.load(f).get('tasks', [])
             except (json.JSONDecodeError, OSError) as e:
                 logger.error(f"Error reading tasks from {self.file_path}: {e}")
-                return []
+                tasks = []
             finally:
                 self._unlock(f)
+        self._cache[self.file_path] = (version, tasks)
+        return tasks
 
     def update_task(self, task_id: str, updates: Dict[str, Any]) -> bool:
         with open(self.file_path, 'r+') as f:
@@ -61,6 +76,7 @@ class TaskManager:
                     f.seek(0)
                     json.dump(data, f, indent=2)
                     f.truncate()
+                    watch.invalidate(self.file_path)
                 return found
             except (json.JSONDecodeError, OSError) as e:
                 logger.error(f"Error updating task {task_id} in {self.file_path}: {e}")
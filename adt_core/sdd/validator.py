@@ -1,7 +1,11 @@
 import json
 import logging
 import os
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
+
+from adt_core import watch
+from adt_core.dttp.paths import PathTrie
 
 logger = logging.getLogger(__name__)
 
@@ -12,23 +16,38 @@ class SpecValidator:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
-        self._last_mtime: float = 0.0
+        self._path_tries: Dict[str, PathTrie] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
         self._reload_config()
 
     def _reload_config(self):
-        """Load config from file, tracking mtime to detect changes."""
-        if not os.path.exists(self.config_path):
-            self._config = {}
+        """Load config from file when the file watcher reports a change."""
+        version = watch.version(self.config_path)
+        if version == self._version:
             return
-        try:
-            mtime = os.path.getmtime(self.config_path)
-            if mtime != self._last_mtime:
+        config: Dict[str, Any] = {}
+        if os.path.exists(self.config_path):
+            try:
                 with open(self.config_path, "r") as f:
-                    self._config = json.load(f)
-                self._last_mtime = mtime
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to load spec config %s: %s", self.config_path, e)
-            self._config = {}
+                    config = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Failed to load spec config %s: %s", self.config_path, e)
+        path_tries = {
+            spec_id: PathTrie(spec_info.get("paths", []))
+            for spec_id, spec_info in config.get("specs", {}).items()
+            if isinstance(spec_info, dict)
+        }
+        # Readers must never see the new version with the old (or a partial)
+        # config, or verdicts would be cached under the wrong revision.
+        with self._lock:
+            self._config, self._path_tries, self._version = config, path_tries, version
+
+    @property
+    def version(self) -> int:
+        """Change version of the loaded config (reloads first if the file changed)."""
+        self._reload_config()
+        return self._version
 
     def is_authorized(self, spec_id: str, role: str, action_type: str) -> bool:
         """Checks if the role is authorized to perform the action under the spec."""
@@ -56,6 +75,12 @@ class SpecValidator:
             return []
         return spec_info.get("paths", [])
 
+    def is_path_authorized(self, spec_id: str, path: str) -> bool:
+        """Checks if path equals or lies below one of the spec's authorized paths."""
+        self._reload_config()
+        trie = self._path_tries.get(spec_id)
+        return trie is not None and trie.covers(path)
+
     def get_all_specs(self) -> Dict[str, Any]:
         """Returns all loaded specs (read-only)."""
         self._reload_config()
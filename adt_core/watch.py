@@ -0,0 +1,387 @@
+import ctypes
+import ctypes.util
+import errno
+import itertools
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+               | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct("iIII")
+
+POLL_INTERVAL = 1.0
+
+# Versions come from one process-wide counter so that a value handed out by
+# one watcher is never reused by another (e.g. after a fork).
+_versions = itertools.count(1)
+
+_UNSET = object()
+
+
+class _Entry:
+    __slots__ = ("path", "target", "version", "polled", "signature", "checked_at")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.target = os.path.abspath(path)
+        self.version = next(_versions)
+        self.polled = True
+        self.signature: Any = _UNSET
+        self.checked_at = 0.0
+
+
+class FileWatcher:
+    """
+    Change notification for governance files and directories.
+
+    version(path) returns a number that changes whenever the file (or, for a
+    directory, any entry directly inside it) is created, written, replaced or
+    removed; callers keep the version they loaded and reload only when it
+    differs. On Linux the watcher uses inotify on the parent directories:
+    a lookup is a zero-timeout poll of the inotify descriptor plus a dict
+    lookup, draining notifications only when some are pending, so writes
+    made just before are always seen.
+    Elsewhere, or when inotify is unavailable, paths are re-stat'ed at most
+    every poll_interval seconds.
+    """
+
+    def __init__(self, backend: Optional[str] = None, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        self._inotify: Optional[_Inotify] = None
+        if backend in (None, "inotify"):
+            try:
+                self._inotify = _Inotify()
+            except OSError as e:
+                if backend == "inotify":
+                    raise
+                logger.debug(f"inotify unavailable, polling governance files instead: {e}")
+        self.backend = "inotify" if self._inotify else "poll"
+
+    def version(self, path: str) -> int:
+        """Current change version of path (watching starts on first use)."""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._register(path)
+        if self._inotify is not None and self._inotify.pending():
+            with self._lock:
+                self._drain()
+        if entry.polled:
+            self._poll(entry)
+        return entry.version
+
+    def invalidate(self, path: str):
+        """Marks path as changed, e.g. right after this process rewrote it."""
+        entry = self._entries.get(path)
+        if entry is not None:
+            entry.version = next(_versions)
+
+    def load(self, path: str, loader: Callable[[str], Any], cache: Dict[str, Tuple[int, Any]]) -> Any:
+        """
+        Returns loader(path), served from `cache` until path changes. Loader
+        errors propagate and are not cached.
+        """
+        version = self.version(path)
+        cached = cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = loader(path)
+        cache[path] = (version, value)
+        return value
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for entry in self._entries.values():
+            entry.polled = True
+
+    # --- Registration ---
+
+    def _register(self, path: str) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                entry = _Entry(path)
+                self._watch(entry)
+                self._entries[path] = entry
+            return entry
+
+    def _watch(self, entry: _Entry):
+        """Sets up inotify for the entry; leaves it polled if that is not possible."""
+        if self._inotify is None:
+            return
+        try:
+            self._inotify.add(os.path.dirname(entry.target))
+            if os.path.isdir(entry.target):
+                self._inotify.add(entry.target)
+        except OSError as e:
+            # Parent missing (it is retried on the next poll) or out of watches.
+            if e.errno != errno.ENOENT:
+                logger.warning(f"Cannot watch {entry.path}, polling it instead: {e}")
+            return
+        entry.polled = False
+
+    # --- inotify ---
+
+    def _drain(self):
+        for directory, name, mask in self._inotify.read():
+            if mask & IN_Q_OVERFLOW:
+                for entry in self._entries.values():
+                    entry.version = next(_versions)
+                continue
+            changed = os.path.join(directory, name) if name else directory
+            lost = mask & IN_IGNORED
+            for entry in self._entries.values():
+                target = entry.target
+                if target == changed or (not name and os.path.dirname(target) == directory):
+                    entry.version = next(_versions)
+                    if lost:
+                        entry.polled = True  # re-watched once the directory is back
+                elif name and target == directory:
+                    entry.version = next(_versions)
+
+    # --- Polling ---
+
+    def _poll(self, entry: _Entry):
+        now = time.monotonic()
+        if entry.checked_at and now - entry.checked_at < self.poll_interval:
+            return
+        entry.checked_at = now
+        signature = _signature(entry.path)
+        if entry.signature is not _UNSET and signature != entry.signature:
+            entry.version = next(_versions)
+        entry.signature = signature
+        if self._inotify is not None:
+            with self._lock:
+                self._watch(entry)
+
+
+class TreeWatcher:
+    """
+    Change version for a whole directory tree, such as a git working tree.
+
+    With inotify every directory below root is watched (new ones as they
+    appear) and version() changes on any create, write, delete or rename
+    in the tree. Directories named in exclude are not descended into.
+    Without inotify, or once the kernel's watch limit is hit, a tree cannot
+    be tracked cheaply, so version() returns a new value on every call and
+    callers simply recompute.
+    """
+
+    def __init__(self, root: str, exclude: Iterable[str] = (), backend: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.exclude = frozenset(exclude)
+        self._version = next(_versions)
+        self._lock = threading.Lock()
+        self._inotify: Optional[_Inotify] = None
+        if backend in (None, "inotify"):
+            try:
+                self._inotify = _Inotify()
+                self._add_tree(self.root)
+            except OSError as e:
+                self._stop_watching()
+                if backend == "inotify":
+                    raise
+                logger.warning(f"Cannot watch {self.root} with inotify, rescanning it on every lookup: {e}")
+        self.backend = "inotify" if self._inotify else "poll"
+
+    def version(self) -> int:
+        inotify = self._inotify
+        if inotify is None:
+            return next(_versions)
+        if inotify.pending():
+            with self._lock:
+                if self._inotify is not None:
+                    self._drain()
+        return self._version
+
+    def close(self):
+        with self._lock:
+            self._stop_watching()
+        self.backend = "poll"
+
+    def _add_tree(self, top: str):
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in self.exclude]
+            try:
+                self._inotify.add(dirpath)
+            except OSError as e:
+                if e.errno != errno.ENOENT:  # ENOENT: removed again meanwhile
+                    raise
+
+    def _drain(self):
+        changed = False
+        for directory, name, mask in self._inotify.read():
+            if name in self.exclude:
+                continue
+            changed = True
+            if mask & IN_Q_OVERFLOW:
+                new_dir = self.root  # lost events; pick up any directories we missed
+            elif name and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                new_dir = os.path.join(directory, name)
+            else:
+                continue
+            try:
+                self._add_tree(new_dir)
+            except OSError as e:
+                logger.warning(f"Stopped watching {self.root}, rescanning it on every lookup: {e}")
+                self._stop_watching()
+                break
+        if changed:
+            self._version = next(_versions)
+
+    def _stop_watching(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+def _signature(path: str) -> Any:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    signature: Tuple[Any, ...] = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if os.path.isdir(path):
+        entries = []
+        try:
+            with os.scandir(path) as it:
+                for child in it:
+                    try:
+                        cst = child.stat()
+                    except OSError:
+                        continue
+                    entries.append((child.name, cst.st_ino, cst.st_mtime_ns, cst.st_size))
+        except OSError:
+            pass
+        signature += (tuple(sorted(entries)),)
+    return signature
+
+
+class _Inotify:
+    """Minimal ctypes binding: one non-blocking inotify descriptor."""
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is Linux-only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        # A poll object must not be polled from two threads at once.
+        self._local = threading.local()
+        self._dirs: Dict[int, str] = {}
+        self._wds: Dict[str, int] = {}
+
+    def add(self, directory: str):
+        if directory in self._wds:
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), directory)
+        self._dirs[wd] = directory
+        self._wds[directory] = wd
+
+    def pending(self) -> bool:
+        """True if notifications are waiting (cheaper than a failing read)."""
+        poller = getattr(self._local, "poller", None)
+        if poller is None:
+            poller = self._local.poller = select.poll()
+            poller.register(self.fd, select.POLLIN)
+        return bool(poller.poll(0))
+
+    def read(self):
+        """Yields (directory, name, mask) for every pending notification."""
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return
+            pos = 0
+            while pos < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, pos)
+                pos += _EVENT_HEADER.size
+                name = os.fsdecode(data[pos:pos + length].rstrip(b"\0"))
+                pos += length
+                if mask & IN_Q_OVERFLOW:
+                    yield "", "", mask
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._dirs[wd]
+                    self._wds.pop(directory, None)
+                yield directory, name, mask
+
+    def close(self):
+        os.close(self.fd)
+
+
+_shared: Optional[FileWatcher] = None
+_shared_lock = threading.Lock()
+
+
+def get_watcher() -> FileWatcher:
+    """The process-wide watcher shared by every cache in adt_core."""
+    global _shared
+    watcher = _shared
+    if watcher is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = FileWatcher()
+            watcher = _shared
+    return watcher
+
+
+def version(path: str) -> int:
+    """Shortcut for get_watcher().version(path)."""
+    return get_watcher().version(path)
+
+
+def invalidate(path: str):
+    """Shortcut for get_watcher().invalidate(path)."""
+    get_watcher().invalidate(path)
+
+
+def _forget_after_fork():
+    # The inotify descriptor is shared with the parent; reading it here
+    # would steal the parent's notifications.
+    global _shared
+    _shared = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
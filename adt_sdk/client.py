@@ -1,8 +1,10 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 import requests
 
+from adt_sdk.local_policy import LocalPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +19,8 @@ class ADTClient:
         self.agent_name = agent_name
         self.role = role
         self.session_id: Optional[str] = None
+        self._policy: Optional[Dict[str, Any]] = None  # last policy, revalidated by revision
+        self._local_policy: Optional[LocalPolicy] = None
 
     def set_session(self, session_id: str):
         self.session_id = session_id
@@ -48,6 +52,37 @@ class ADTClient:
             logger.error("DTTP request failed: %s", e)
             return {"status": "error", "message": str(e)}
 
+    def request_batch(self,
+                      requests_list: List[Dict[str, Any]],
+                      mode: str = "best_effort",
+                      dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Submit several DTTP requests in one round trip. Each item is a dict
+        with spec_id, action, params and rationale. mode is "best_effort"
+        (authorized items run, denials reported per item) or
+        "all_or_nothing" (nothing runs unless every item is an authorized
+        file change, and a failed change rolls back the others).
+        """
+        payload = {
+            "agent": self.agent_name,
+            "role": self.role,
+            "mode": mode,
+            "dry_run": dry_run,
+            "requests": requests_list,
+        }
+        if self.session_id:
+            payload["session_id"] = self.session_id
+
+        try:
+            response = requests.post(f"{self.dttp_url}/request/batch", json=payload, timeout=60)
+            return response.json()
+        except requests.ConnectionError:
+            logger.error("DTTP service unreachable at %s", self.dttp_url)
+            return {"status": "error", "message": f"DTTP service unreachable at {self.dttp_url}"}
+        except requests.RequestException as e:
+            logger.error("DTTP batch request failed: %s", e)
+            return {"status": "error", "message": str(e)}
+
     def get_status(self) -> Dict[str, Any]:
         """Get the DTTP service status."""
         try:
@@ -57,12 +92,61 @@ class ADTClient:
             return {"status": "error", "message": str(e)}
 
     def get_policy(self) -> Dict[str, Any]:
-        """Get the current loaded policy from DTTP."""
+        """
+        Get the current loaded policy from DTTP. The last policy is kept:
+        later calls send its revision and get back only the specs and roles
+        that changed, or 304 Not Modified if none did.
+        """
         try:
+            cached = self._policy
+            if cached is not None:
+                revision = cached["policy_revision"]
+                response = requests.get(f"{self.dttp_url}/policy/delta", params={"since": revision},
+                                        headers={"If-None-Match": f'"{revision}"'}, timeout=5)
+                if response.status_code == 304:
+                    return dict(cached)
+                if response.status_code == 200:
+                    self._policy = _apply_policy_delta(cached, response.json())
+                    return dict(self._policy)
+            # First call, or a DTTP service without /policy/delta
             response = requests.get(f"{self.dttp_url}/policy", timeout=5)
-            return response.json()
+            policy = response.json()
         except requests.RequestException as e:
             return {"status": "error", "message": str(e)}
+        if response.status_code == 200 and "policy_revision" in policy:
+            self._policy = policy
+            return dict(policy)
+        return policy
+
+    def validate_write_local(self, spec_id: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ADVISORY dry run evaluated locally against the cached DTTP policy
+        (see adt_sdk.local_policy). DTTP still decides when the write is made.
+        """
+        result = self.validate_writes_local([{"spec_id": spec_id, "action": action, "params": params}])
+        return result["results"][0] if result["status"] == "ok" else result
+
+    def validate_writes_local(self, requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        ADVISORY: evaluates many requests (dicts with spec_id, action, params
+        and optionally role, like request_batch items) against the cached DTTP
+        policy, with one revalidation round trip in total. Use it to plan a
+        change set; DTTP still decides when the writes are made.
+        """
+        policy = self.get_policy()
+        if "policy_revision" not in policy:
+            return {"status": "error", "message": policy.get("message", "DTTP policy unavailable")}
+        local = self._local_policy
+        if local is None or local.revision != policy["policy_revision"]:
+            try:
+                local = self._local_policy = LocalPolicy(policy)
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
+        results = [local.evaluate(item.get("role", self.role), item["spec_id"], item["action"], item.get("params", {}))
+                   for item in requests_list]
+        denied = sum(1 for r in results if r["status"] == "denied")
+        return {"status": "ok", "advisory": True, "policy_revision": local.revision,
+                "allowed": len(results) - denied, "denied": denied, "results": results}
 
     def validate_write(self,
                        spec_id: str,
@@ -212,3 +296,18 @@ class ADTClient:
             params=params,
             rationale=f"Governed push to {remote}/{branch}"
         )
+
+
+def _apply_policy_delta(policy: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """The policy a /policy/delta response describes, given the one it was asked against."""
+    if delta.get("full"):
+        specs, jurisdictions = dict(delta["specs"]), dict(delta["jurisdictions"])
+    else:
+        specs = {**policy["specs"], **delta["specs"]}
+        jurisdictions = {**policy["jurisdictions"], **delta["jurisdictions"]}
+    for spec_id in delta.get("removed_specs", []):
+        specs.pop(spec_id, None)
+    for role in delta.get("removed_roles", []):
+        jurisdictions.pop(role, None)
+    return {"specs": specs, "jurisdictions": jurisdictions, "rules": delta.get("rules", policy.get("rules")),
+            "policy_revision": delta["policy_revision"], "last_reload": delta.get("last_reload")}
@@ -26,15 +26,18 @@ import os
 import sys
 import re
 
-import requests
+# requests is imported only when a DTTP call is made: the sandbox checks
+# and read tools decide with the standard library alone.
 
 # Gemini CLI tool names for file modification
 INTERCEPTED_TOOLS = {"write_file", "replace"}
 READ_TOOLS = {"read_file", "list_files", "search_files", "list_directory", "grep_search", "glob"}
 BASH_TOOLS = {"run_shell", "shell", "run_shell_command"}
 
-# Patterns that indicate file write operations in shell commands
-BASH_WRITE_OPERATORS = re.compile(
+# Patterns that indicate file write operations in shell commands.
+# Kept as strings: re compiles and caches them on first use, so hook calls
+# that never inspect a shell command do not pay for compiling them.
+BASH_WRITE_OPERATORS = (
     r'(?:'
     r'>\s*\S'           # > redirect (overwrite)
     r'|>>\s*\S'         # >> redirect (append)
@@ -59,7 +62,7 @@ BASH_WRITE_OPERATORS = re.compile(
 )
 
 # Regex to extract paths from shell commands
-BASH_PATH_RE = re.compile(
+BASH_PATH_RE = (
     r'(?:'
     r'(?<![a-zA-Z0-9_])(/[a-zA-Z0-9_./-]{2,})'
     r'|(?<![a-zA-Z0-9_])(~/[a-zA-Z0-9_./-]*)'
@@ -90,7 +93,7 @@ def check_bash_sandbox(command: str, project_dir: str) -> str:
         return "SANDBOX: 'su' is not permitted in sandbox mode."
 
     paths_found = []
-    for match in BASH_PATH_RE.finditer(command):
+    for match in re.finditer(BASH_PATH_RE, command):
         abs_path = match.group(1)
         home_path = match.group(2)
         if abs_path:
@@ -116,7 +119,7 @@ def check_bash_sandbox(command: str, project_dir: str) -> str:
                     f"Agents cannot access credentials/keys in sandbox mode."
                 )
 
-        if BASH_WRITE_OPERATORS.search(command):
+        if re.search(BASH_WRITE_OPERATORS, command):
             is_contained = (
                 resolved == full_project_dir
                 or resolved.startswith(full_project_dir + os.sep)
@@ -215,6 +218,16 @@ def get_canonical_role(role: str, project_dir: str) -> str:
     return role
 
 
+class ProjectConfig:
+    """Project config lookups, read from disk on every call."""
+
+    def dttp_url(self, project_dir: str) -> str:
+        return read_project_dttp_url(project_dir)
+
+    def canonical_role(self, role: str, project_dir: str) -> str:
+        return get_canonical_role(role, project_dir)
+
+
 def build_dttp_params(tool_name: str, tool_input: dict, rel_path: str) -> tuple:
     """Build DTTP action and params from Gemini CLI tool input.
 
@@ -236,8 +249,12 @@ def build_dttp_params(tool_name: str, tool_input: dict, rel_path: str) -> tuple:
 
 def query_dttp(dttp_url: str, agent: str, role: str, spec_id: str,
                action: str, params: dict, rationale: str,
-               dry_run: bool = False) -> dict:
-    """Send a request to the DTTP service. Returns the response dict."""
+               dry_run: bool = False, session=None, cache_hits: int = None) -> dict:
+    """Send a request to the DTTP service. Returns the response dict.
+
+    cache_hits reports the verdict cache hits since the last request, for
+    DTTP's /status; None when the caller has no cache.
+    """
     payload = {
         "agent": agent,
         "role": role,
@@ -247,12 +264,16 @@ def query_dttp(dttp_url: str, agent: str, role: str, spec_id: str,
         "rationale": rationale,
         "dry_run": dry_run,
     }
-    response = requests.post(f"{dttp_url}/request", json=payload, timeout=10)
+    if cache_hits is not None:
+        payload["cache_hits"] = cache_hits
+    if session is None:
+        import requests as session
+    response = session.post(f"{dttp_url}/request", json=payload, timeout=10)
     return response.json()
 
 
 def submit_scr(dttp_url: str, agent: str, role: str, spec_id: str,
-               target_path: str, action: str, params: dict) -> dict:
+               target_path: str, action: str, params: dict, session=None) -> dict:
     """Submit a Sovereign Change Request to the ADT Panel."""
     # Derive Panel URL (usually port 5001 on the same host)
     from urllib.parse import urlparse
@@ -278,7 +299,9 @@ def submit_scr(dttp_url: str, agent: str, role: str, spec_id: str,
         }
     
     try:
-        resp = requests.post(f"{panel_url}/api/governance/sovereign-requests", 
+        if session is None:
+            import requests as session
+        resp = session.post(f"{panel_url}/api/governance/sovereign-requests",
                              json=scr_payload, timeout=5)
         return resp.json()
     except Exception as e:
@@ -294,28 +317,44 @@ def main():
         print(json.dumps(make_deny("DTTP hook: failed to parse hook input")))
         sys.exit(0)
 
+    decision = decide(hook_input)
+    if decision is not None:
+        print(json.dumps(decision))
+    sys.exit(0)
+
+
+def decide(hook_input: dict, environ=None, cwd: str = None, session=None, config=None, cache=None):
+    """Decision JSON for one tool call, or None to let it through without one.
+
+    main() runs it once per process. The resident hook daemon (hookd.py)
+    runs it per request with the environment forwarded by the shim, a
+    pooled HTTP session, cached project config and a verdict cache for
+    development-mode dry runs.
+    """
+    environ = os.environ if environ is None else environ
+    config = config or ProjectConfig()
     tool_name = hook_input.get("tool_name", "")
 
     # Intercept write tools OR read tools (if sandboxed) OR shell (if sandboxed)
     is_write = tool_name in INTERCEPTED_TOOLS
     is_read = tool_name in READ_TOOLS
     is_bash = tool_name in BASH_TOOLS
-    adt_sandbox = os.environ.get("ADT_SANDBOX") == "1"
+    adt_sandbox = environ.get("ADT_SANDBOX") == "1"
 
     if not is_write and not (is_read and adt_sandbox) and not (is_bash and adt_sandbox):
-        sys.exit(0)
+        return None
 
     tool_input = hook_input.get("tool_input", {})
 
     # Configuration from environment
-    project_dir = os.environ.get("GEMINI_PROJECT_DIR",
-                                 hook_input.get("cwd", os.getcwd()))
-    dttp_url = os.environ.get("DTTP_URL", read_project_dttp_url(project_dir))
-    agent = os.environ.get("ADT_AGENT", "GEMINI")
-    enforcement_mode = os.environ.get("ADT_ENFORCEMENT_MODE", "development")
+    project_dir = environ.get("GEMINI_PROJECT_DIR",
+                              hook_input.get("cwd", cwd or os.getcwd()))
+    dttp_url = environ.get("DTTP_URL", config.dttp_url(project_dir))
+    agent = environ.get("ADT_AGENT", "GEMINI")
+    enforcement_mode = environ.get("ADT_ENFORCEMENT_MODE", "development")
 
     # SPEC-037: Fix role priority (env var first, then file fallback)
-    role = os.environ.get("ADT_ROLE")
+    role = environ.get("ADT_ROLE")
     if not role:
         role_file = os.path.join(project_dir, "_cortex", "ops", "active_role.txt")
         if os.path.exists(role_file):
@@ -328,7 +367,7 @@ def main():
                 pass  # Fall back to default
     
     # SPEC-037: Fix spec priority (env var first, then file fallback)
-    spec_id = os.environ.get("ADT_SPEC_ID")
+    spec_id = environ.get("ADT_SPEC_ID")
     if not spec_id:
         spec_file = os.path.join(project_dir, '_cortex', 'ops', 'active_spec.txt')
         if os.path.exists(spec_file):
@@ -344,7 +383,7 @@ def main():
         role = "Backend_Engineer"
     
     # SPEC-020 Amendment B: Normalize role name
-    role = get_canonical_role(role, project_dir)
+    role = config.canonical_role(role, project_dir)
 
     if not spec_id:
         spec_id = "SPEC-017"
@@ -354,15 +393,13 @@ def main():
         bash_command = tool_input.get("command", "")
         denial = check_bash_sandbox(bash_command, project_dir)
         if denial:
-            print(json.dumps(make_deny(denial)))
-            sys.exit(0)
-        print(json.dumps(make_allow("SANDBOX: Shell command passed containment check")))
-        sys.exit(0)
+            return make_deny(denial)
+        return make_allow("SANDBOX: Shell command passed containment check")
 
     # Extract and convert file path
     abs_path = extract_file_path(tool_name, hook_input.get("tool_input", {}))
     if not abs_path:
-        sys.exit(0)
+        return None
 
     # SPEC-036: Resolution and containment check
     full_abs_path = os.path.realpath(abs_path)
@@ -372,15 +409,13 @@ def main():
                     full_abs_path.startswith(full_project_dir + os.sep))
 
     if adt_sandbox and not is_contained:
-        print(json.dumps(make_deny(f"SANDBOX VIOLATION: Path {abs_path} is outside project root.")))
-        sys.exit(0)
+        return make_deny(f"SANDBOX VIOLATION: Path {abs_path} is outside project root.")
 
     rel_path = to_project_relative(abs_path, project_dir)
 
     # If it's a read tool and we reached here, it passed containment (if sandboxed)
     if is_read:
-        print(json.dumps(make_allow(f"DTTP allowed {tool_name} on {rel_path}")))
-        sys.exit(0)
+        return make_allow(f"DTTP allowed {tool_name} on {rel_path}")
 
     # SPEC-037: Redirect requests.md append to API
     if rel_path == "_cortex/requests.md" and tool_name == "write_file":
@@ -401,83 +436,100 @@ def main():
             
             result = client.file_request(to_role=to_role, title=title, description=description)
             if result.get("status") == "success":
-                print(json.dumps(make_allow(f"Request transparently filed via governed API: {result.get('req_id')}")))
-                sys.exit(0)
+                return make_allow(f"Request transparently filed via governed API: {result.get('req_id')}")
 
     # Build DTTP action and params
     action, params = build_dttp_params(tool_name, tool_input, rel_path)
     
     # Add tier2_justification if provided in environment
-    tier2_justification = os.environ.get("ADT_TIER2_JUSTIFICATION")
+    tier2_justification = environ.get("ADT_TIER2_JUSTIFICATION")
     if tier2_justification:
         params["tier2_justification"] = tier2_justification
         
     rationale = f"Gemini CLI {tool_name} tool: {rel_path}"
 
+    import requests
+
     try:
         if enforcement_mode == "production":
             # Production: DTTP executes the write, always deny Gemini's tool
             result = query_dttp(dttp_url, agent, role, spec_id,
-                                action, params, rationale, dry_run=False)
+                                action, params, rationale, dry_run=False, session=session)
+            if cache is not None:
+                cache.observe(dttp_url, result)
             if result.get("status") == "allowed":
                 # DTTP wrote the file -- deny Gemini's write (already done)
-                print(json.dumps(make_deny(
+                decision = make_deny(
                     f"DTTP executed {action} on {rel_path} (production mode). "
                     f"File written by DTTP service."
-                )))
+                )
             else:
                 # DTTP denied
                 reason = result.get("reason", "unknown")
-                print(json.dumps(make_deny(
+                decision = make_deny(
                     f"DTTP denied {action} on {rel_path}: {reason}"
-                )))
+                )
         else:
-            # Development: dry-run validation only
-            result = query_dttp(dttp_url, agent, role, spec_id,
-                                action, params, rationale, dry_run=True)
+            # Development: dry-run validation only. The daemon remembers
+            # allowed verdicts until the TTL ends or the policy changes.
+            result = cache_key = None
+            if cache is not None:
+                import hashlib
+                # A verdict is reused only for the same agent, rationale and justification.
+                texts = hashlib.sha256(f"{rationale}\0{tier2_justification or ''}".encode()).hexdigest()
+                cache_key = (dttp_url, agent, role, spec_id, action, rel_path, texts)
+                # A hit skips DTTP's dry-run event; the daemon replays it later.
+                result = cache.get(cache_key, audit={"agent": agent, "role": role, "spec_id": spec_id,
+                                                     "action": action, "params": params, "rationale": rationale})
+            if result is None:
+                result = query_dttp(dttp_url, agent, role, spec_id, action, params, rationale, dry_run=True,
+                                    session=session, cache_hits=cache.take_hits() if cache is not None else None)
+                if cache is not None:
+                    cache.store(cache_key, dttp_url, result)
             if result.get("status") == "allowed":
                 # Validation passed -- allow Gemini to write directly
-                print(json.dumps(make_allow(
+                decision = make_allow(
                     f"DTTP validated {action} on {rel_path} (development mode)"
-                )))
+                )
             else:
                 # Validation failed -- deny
                 reason = result.get("reason", "unknown")
                 
                 # SPEC-033: Auto-submit SCR on sovereign path violation
                 if reason == "sovereign_path_violation":
-                    scr_result = submit_scr(dttp_url, agent, role, spec_id, rel_path, action, params)
+                    scr_result = submit_scr(dttp_url, agent, role, spec_id, rel_path, action, params,
+                                            session=session)
                     if "scr_id" in scr_result:
-                        print(json.dumps(make_deny(
+                        decision = make_deny(
                             f"SOVEREIGN PATH VIOLATION: {rel_path} is protected. "
                             f"Change request {scr_result['scr_id']} has been submitted for human authorization in the ADT Panel."
-                        )))
+                        )
                     else:
-                        print(json.dumps(make_deny(
+                        decision = make_deny(
                             f"SOVEREIGN PATH VIOLATION: {rel_path} is protected. "
                             f"Failed to auto-submit change request: {scr_result.get('error', 'unknown error')}"
-                        )))
+                        )
                 else:
-                    print(json.dumps(make_deny(
+                    decision = make_deny(
                         f"DTTP denied {action} on {rel_path}: {reason}"
-                    )))
+                    )
     except requests.ConnectionError:
         # Fail-closed: DTTP unreachable
-        print(json.dumps(make_deny(
+        decision = make_deny(
             f"DTTP service unreachable at {dttp_url}. "
             f"Fail-closed: all writes blocked until DTTP is available."
-        )))
+        )
     except requests.Timeout:
-        print(json.dumps(make_deny(
+        decision = make_deny(
             f"DTTP service timeout at {dttp_url}. "
             f"Fail-closed: write blocked."
-        )))
+        )
     except Exception as e:
-        print(json.dumps(make_deny(
+        decision = make_deny(
             f"DTTP hook error: {e}. Fail-closed: write blocked."
-        )))
+        )
 
-    sys.exit(0)
+    return decision
 
 
 if __name__ == "__main__":
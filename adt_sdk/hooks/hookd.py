@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Resident pre-tool hook daemon.
+
+One long-lived process per project answers the pre-tool hook for every
+agent tool call, so the per-call work shrinks to what pretool_shim.py does.
+The daemon keeps:
+
+- the Claude and Gemini hook modules, imported once;
+- a pooled requests.Session, so DTTP connections are reused;
+- config/dttp.json and config/jurisdictions.json, re-read only when their
+  mtime or size changes;
+- allowed development-mode dry-run verdicts, for a few seconds and only
+  while DTTP reports the same policy revision (VerdictCache). Requests
+  answered from the cache are replayed to DTTP's /request/batch as dry
+  runs every AUDIT_INTERVAL seconds, so each one still gets its ADS event
+  and a changed policy or a denial drops the cached verdicts.
+
+It listens on the socket pretool_shim.socket_path() gives for the project,
+inside a directory only the current user can access. Each connection
+carries one JSON request line and gets one JSON reply:
+
+    {"hook": "claude", "input": {...}, "env": {...}, "cwd": "..."}
+    {"decision": {...} | null}   or   {"error": "..."}
+
+Usage:
+    python3 adt_sdk/hooks/hookd.py --project-dir /path/to/project
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("adt.hookd")
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# Seconds an allowed dry-run verdict is reused without asking DTTP.
+VERDICT_TTL = 5.0
+VERDICT_CACHE_SIZE = 4096
+
+# Seconds between replays of cache hits to DTTP, and the batch size limit
+# of /request/batch.
+AUDIT_INTERVAL = 1.0
+AUDIT_BATCH_SIZE = 1000
+# Request params sent with a replayed hit; file bodies are left out.
+AUDIT_PARAMS = ("file", "path", "tier2_justification")
+
+
+def _load(module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(HOOKS_DIR, f"{module_name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+shim = _load("pretool_shim")
+
+
+class CachedProjectConfig:
+    """ProjectConfig of the hook modules, cached per file until it changes on disk."""
+
+    def __init__(self, hook_module):
+        self._hook = hook_module
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def dttp_url(self, project_dir: str) -> str:
+        path = os.path.join(project_dir, "config", "dttp.json")
+        return self._cached(("dttp_url", project_dir), path, lambda: self._hook.read_project_dttp_url(project_dir))
+
+    def canonical_role(self, role: str, project_dir: str) -> str:
+        path = os.path.join(project_dir, "config", "jurisdictions.json")
+        return self._cached(("role", role, project_dir), path,
+                            lambda: self._hook.get_canonical_role(role, project_dir))
+
+    def _cached(self, key, path, load):
+        try:
+            st = os.stat(path)
+            signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        value = load()
+        with self._lock:
+            self._cache[key] = (signature, value)
+        return value
+
+
+class VerdictCache:
+    """
+    Allowed dry-run verdicts per (dttp_url, agent, role, spec, action, path,
+    ...), reused for `ttl` seconds. Every DTTP response carries the policy
+    revision; when it differs from the one a verdict was stored under, all
+    verdicts of that DTTP service are dropped. Denials are never cached.
+
+    Each hit queues its request (the `audit` argument of get) until
+    take_audit() hands it to the daemon for replay.
+    """
+
+    def __init__(self, ttl: float = VERDICT_TTL, max_entries: int = VERDICT_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires, result)
+        self._revisions = {}  # dttp_url -> last policy revision seen
+        self._audit = {}  # dttp_url -> requests answered from the cache
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._unreported_hits = 0
+
+    def get(self, key, audit: dict = None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                self._unreported_hits += 1
+                if audit is not None:
+                    params = {k: v for k, v in audit.get("params", {}).items() if k in AUDIT_PARAMS}
+                    self._audit.setdefault(key[0], []).append(dict(audit, params=params))
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def store(self, key, dttp_url: str, result: dict):
+        self.observe(dttp_url, result)
+        if self.ttl <= 0 or result.get("status") != "allowed" or not result.get("policy_revision"):
+            return
+        with self._lock:
+            if self._revisions.get(dttp_url) != result["policy_revision"]:
+                return  # a newer revision was seen meanwhile
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def observe(self, dttp_url: str, result: dict):
+        """Drops the verdicts of dttp_url if result reports a new policy revision."""
+        revision = result.get("policy_revision") if isinstance(result, dict) else None
+        if revision is None:
+            return
+        with self._lock:
+            if self._revisions.get(dttp_url) == revision:
+                return
+            self._revisions[dttp_url] = revision
+            self._drop(dttp_url)
+
+    def drop(self, dttp_url: str):
+        """Drops all verdicts of dttp_url."""
+        with self._lock:
+            self._drop(dttp_url)
+
+    def _drop(self, dttp_url: str):
+        for key in [key for key in self._entries if key[0] == dttp_url]:
+            del self._entries[key]
+
+    def take_hits(self) -> int:
+        """Hits since the last call, reported to DTTP with the next request."""
+        with self._lock:
+            hits, self._unreported_hits = self._unreported_hits, 0
+            return hits
+
+    def take_audit(self) -> dict:
+        """Requests answered from the cache since the last call, per dttp_url."""
+        with self._lock:
+            audit, self._audit = self._audit, {}
+            return audit
+
+    def requeue_audit(self, dttp_url: str, items: list):
+        """Puts back requests whose replay failed, ahead of newer ones."""
+        with self._lock:
+            self._audit[dttp_url] = items + self._audit.get(dttp_url, [])
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server: "HookDaemon" = self.server
+        try:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                return  # liveness probe of a starting daemon
+            request = json.loads(line)
+            hook = server.hooks[request["hook"]]
+            decision = hook.decide(request["input"], environ=request.get("env", {}), cwd=request.get("cwd"),
+                                   session=server.session, config=server.configs[request["hook"]],
+                                   cache=server.verdicts)
+            reply = {"decision": decision}
+        except Exception as e:
+            logger.exception("Hook request failed")
+            reply = {"error": f"{type(e).__name__}: {e}"}
+        try:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+        except BrokenPipeError:
+            logger.warning("Shim disconnected before the decision was sent")
+
+
+class HookDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves pre-tool hook decisions for one project over a Unix domain socket."""
+
+    daemon_threads = True
+
+    def __init__(self, project_dir: str, path: str = None, pool_size: int = 16,
+                 verdict_ttl: float = VERDICT_TTL, audit_interval: float = AUDIT_INTERVAL):
+        self.project_dir = os.path.realpath(project_dir)
+        self.path = path or shim.socket_path(self.project_dir)
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not shim.is_private_dir(directory):
+            raise RuntimeError(f"{directory} must be a directory only this user can access")
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)  # stale socket of a daemon that did not shut down cleanly
+            else:
+                raise RuntimeError(f"A hook daemon is already serving {self.project_dir} on {self.path}")
+            finally:
+                probe.close()
+
+        self.hooks = {name: _load(module_name) for name, (module_name, _) in shim.HOOKS.items()}
+        self.configs = {name: CachedProjectConfig(module) for name, module in self.hooks.items()}
+        self.verdicts = VerdictCache(ttl=verdict_ttl)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        super().__init__(self.path, _Handler)
+        self._audit_stop = threading.Event()
+        self._audit_thread = threading.Thread(target=self._audit_loop, args=(audit_interval,),
+                                              name="hookd-audit", daemon=True)
+        self._audit_thread.start()
+
+    def _audit_loop(self, interval: float):
+        while not self._audit_stop.wait(interval):
+            try:
+                self.flush_audit()
+            except Exception:
+                logger.exception("Replaying cached verdicts failed")
+
+    def flush_audit(self):
+        """
+        Replays the requests answered from the verdict cache to DTTP as one
+        dry-run batch per service. The reply's policy revision is observed
+        like any other response; a denied item drops that service's verdicts.
+        Requests that could not be sent are kept for the next flush.
+        """
+        for dttp_url, items in self.verdicts.take_audit().items():
+            for start in range(0, len(items), AUDIT_BATCH_SIZE):
+                chunk = items[start:start + AUDIT_BATCH_SIZE]
+                try:
+                    response = self.session.post(f"{dttp_url}/request/batch", timeout=10,
+                                                 json={"requests": chunk, "dry_run": True, "mode": "best_effort"})
+                    response.raise_for_status()
+                    body = response.json()
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning("Could not replay %d cached verdicts to %s: %s", len(items) - start, dttp_url, e)
+                    self.verdicts.requeue_audit(dttp_url, items[start:])
+                    break
+                self.verdicts.observe(dttp_url, body)
+                if any(item.get("status") != "allowed" for item in body.get("results", [])):
+                    self.verdicts.drop(dttp_url)
+
+    def server_close(self):
+        self._audit_stop.set()
+        self._audit_thread.join()
+        self.flush_audit()
+        super().server_close()
+        self.session.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident ADT pre-tool hook daemon")
+    parser.add_argument("--project-dir", default=os.getcwd(), help="Project root (default: cwd)")
+    parser.add_argument("--socket", default=None, help="Socket path (default: per-user runtime dir)")
+    parser.add_argument("--verdict-ttl", type=float, default=VERDICT_TTL,
+                        help=f"Seconds to reuse allowed dry-run verdicts, 0 to disable (default: {VERDICT_TTL})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    server = HookDaemon(args.project_dir, args.socket, verdict_ttl=args.verdict_ttl)
+
+    def stop(signum, frame):
+        # shutdown() waits for serve_forever to return, so not from its own thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info("Serving pre-tool hooks for %s on %s", server.project_dir, server.path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
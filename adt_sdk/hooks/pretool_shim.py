@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Pre-tool hook shim.
+
+Forwards the hook JSON to the project's resident hook daemon (hookd.py)
+over a Unix domain socket and prints its decision. A tool call then costs
+a bare interpreter start and one local round trip instead of importing
+requests, re-reading config and opening a new DTTP connection.
+
+When no daemon is listening, the full hook (claude_pretool.py or
+gemini_pretool.py) runs in-process, exactly as before. If a daemon accepts
+the request but fails to answer, the tool call is denied (fail-closed):
+the request may already have reached DTTP, so it is not re-sent.
+
+Usage (hook command):
+    python3 -S /path/to/adt_sdk/hooks/pretool_shim.py claude
+    python3 -S /path/to/adt_sdk/hooks/pretool_shim.py gemini
+
+Only the standard library is imported here; keep it that way. -S skips
+site-packages setup (.pth files), which otherwise dominates start-up; it
+is done on demand before falling back to the full hook.
+"""
+import hashlib
+import json
+import os
+import socket
+import stat
+import sys
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# hook name -> (module file, project dir variable)
+HOOKS = {
+    "claude": ("claude_pretool", "CLAUDE_PROJECT_DIR"),
+    "gemini": ("gemini_pretool", "GEMINI_PROJECT_DIR"),
+}
+
+# Environment the hook reads, forwarded to the daemon with each request.
+FORWARDED_ENV_PREFIXES = ("ADT_", "DTTP_")
+
+# Covers a production-mode DTTP request (10 s) plus an SCR submission (5 s).
+REQUEST_TIMEOUT = 30.0
+
+MAX_RESPONSE_BYTES = 1 << 20
+
+
+class DaemonAbsent(Exception):
+    """No hook daemon is listening for this project."""
+
+
+def socket_dir() -> str:
+    """Per-user directory holding the daemon sockets (must be private)."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, f"adt-hookd-{os.getuid()}")
+
+
+def socket_path(project_dir: str) -> str:
+    """Socket of the daemon serving project_dir."""
+    digest = hashlib.sha1(os.path.realpath(project_dir).encode()).hexdigest()[:16]
+    return os.path.join(socket_dir(), f"{digest}.sock")
+
+
+def is_private_dir(path: str) -> bool:
+    """True if path is a directory owned by this user that nobody else can write to."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def project_dir_for(hook: str, hook_input: dict) -> str:
+    """The project directory the hook itself would use."""
+    return os.environ.get(HOOKS[hook][1], hook_input.get("cwd", os.getcwd()))
+
+
+def forwarded_env(hook: str) -> dict:
+    project_var = HOOKS[hook][1]
+    return {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIXES) or k == project_var}
+
+
+def ask_daemon(hook: str, hook_input: dict, timeout: float = REQUEST_TIMEOUT):
+    """
+    Returns the daemon's decision (None = no output). Raises DaemonAbsent if
+    no daemon could be reached, or OSError/ValueError if one was reached but
+    did not answer properly.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonAbsent("Unix domain sockets are not supported here")
+    path = socket_path(project_dir_for(hook, hook_input))
+    if not is_private_dir(os.path.dirname(path)):
+        raise DaemonAbsent(f"no private socket directory at {os.path.dirname(path)}")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except OSError as e:
+            raise DaemonAbsent(str(e)) from None
+        request = {"hook": hook, "input": hook_input, "env": forwarded_env(hook), "cwd": os.getcwd()}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        chunks, size = [], 0
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_RESPONSE_BYTES:
+                raise ValueError("hook daemon response too large")
+    finally:
+        sock.close()
+
+    reply = json.loads(b"".join(chunks))
+    if "error" in reply:
+        raise ValueError(reply["error"])
+    return reply["decision"]
+
+
+def load_hook(hook: str):
+    """Imports the full hook module (and with it requests)."""
+    import importlib.util
+    if sys.flags.no_site:
+        import site
+        site.main()
+    module_name = HOOKS[hook][0]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(HOOKS_DIR, f"{module_name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    hook = sys.argv[1] if len(sys.argv) > 1 else "claude"
+    if hook not in HOOKS:
+        sys.stderr.write(f"Unknown hook '{hook}' (expected one of: {', '.join(HOOKS)})\n")
+        sys.exit(2)
+
+    raw = sys.stdin.read()
+    try:
+        hook_input = json.loads(raw)
+    except ValueError:
+        hook_input = None
+
+    if isinstance(hook_input, dict):
+        try:
+            decision = ask_daemon(hook, hook_input)
+        except DaemonAbsent:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            decision = load_hook(hook).make_deny(f"DTTP hook daemon failed: {e}. Fail-closed: tool call blocked.")
+            print(json.dumps(decision))
+            sys.exit(0)
+        else:
+            if decision is not None:
+                print(json.dumps(decision))
+            sys.exit(0)
+
+    # No daemon: run the hook in-process, as if it had been invoked directly.
+    module = load_hook(hook)
+    if not isinstance(hook_input, dict):
+        print(json.dumps(module.make_deny("DTTP hook: failed to parse hook input")))
+        sys.exit(0)
+    decision = module.decide(hook_input)
+    if decision is not None:
+        print(json.dumps(decision))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
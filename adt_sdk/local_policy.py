@@ -0,0 +1,113 @@
+"""
+Advisory, client-side evaluation of DTTP policy.
+
+LocalPolicy answers "would DTTP allow this?" from a /policy body (specs,
+jurisdictions and the gateway's fixed path rules) without a round trip per
+request, so an agent can plan a change set of hundreds of files up front.
+It applies the checks of DTTPGateway._authorize and PolicyEngine in the
+same order and reports the same denial reasons.
+
+It is ADVISORY ONLY. DTTP remains the enforcement point: every write still
+goes through /request, and checks that depend on server state are not
+made here (intent status for params with an intent_id, symlinks on the
+server's disk when the client runs on another machine).
+"""
+import os
+from typing import Any, Dict, Optional
+
+from adt_core.dttp.jurisdictions import JurisdictionManager
+from adt_core.dttp.paths import PathTrie
+
+
+class LocalPolicy:
+    """A DTTP policy snapshot compiled for local evaluation."""
+
+    def __init__(self, policy: Dict[str, Any]):
+        rules = policy.get("rules")
+        if rules is None:
+            raise ValueError("DTTP policy has no rules; the service is too old for local evaluation")
+        self.revision: Optional[str] = policy.get("policy_revision")
+        self.specs: Dict[str, Any] = policy.get("specs", {})
+        self.jurisdictions: Dict[str, Any] = policy.get("jurisdictions", {})
+        self.is_framework: bool = rules["is_framework"]
+        self.project_root: str = rules["project_root"]
+        self.sovereign_paths = set(rules["sovereign_paths"])
+        self.governance_locked = set(rules["governance_locked"])
+        self.constitutional_paths = set(rules["constitutional_paths"])
+        self._spec_tries = {spec_id: PathTrie(info.get("paths", []))
+                            for spec_id, info in self.specs.items() if isinstance(info, dict)}
+        self._role_tries = {role: PathTrie(JurisdictionManager._allowed_paths(config))
+                            for role, config in self.jurisdictions.items()}
+
+    def evaluate(self, role: str, spec_id: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Advisory verdict for one request: {"status": "allowed"|"denied",
+        "reason" (if denied), "tier", "advisory": True, "policy_revision"}.
+        "unverified" lists checks only DTTP can make for this request.
+        """
+        verdict = self._evaluate(role, spec_id, action, params)
+        verdict["advisory"] = True
+        verdict["policy_revision"] = self.revision
+        if params.get("intent_id"):
+            verdict["unverified"] = ["intent_id"]
+        return verdict
+
+    def _evaluate(self, role: str, spec_id: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Same order as DTTPGateway._authorize
+        if action in ("write", "create"):
+            action = "edit"
+        elif action == "replace":
+            action = "patch"
+
+        path = params.get("file") or params.get("path")
+        normalized_path = os.path.normpath(path) if path else None
+
+        def deny(reason: str, tier: int) -> Dict[str, Any]:
+            return {"status": "denied", "reason": reason, "tier": tier}
+
+        if path:
+            resolved = os.path.realpath(os.path.join(self.project_root, path))
+            if not (resolved == self.project_root or resolved.startswith(self.project_root + os.sep)):
+                return deny("path_outside_project_root", 1)
+
+        if normalized_path in self.governance_locked and not self.is_framework:
+            return deny("governance_file_protected", 1)
+
+        if self.is_framework and normalized_path in self.sovereign_paths:
+            return deny("sovereign_path_violation", 1)
+
+        tier = 3
+        is_tier2 = self.is_framework and (
+            normalized_path in self.constitutional_paths
+            or action == "git_tag"
+            or (action == "git_push" and params.get("branch") == "main")
+        )
+        if is_tier2:
+            tier = 2
+            if normalized_path in self.constitutional_paths:
+                authorized_paths = (self.specs.get(spec_id) or {}).get("paths", [])
+                if not any(normalized_path == os.path.normpath(ap) for ap in authorized_paths):
+                    return deny("tier2_authorization_required", 2)
+            if not params.get("tier2_justification"):
+                return deny("tier2_authorization_required", 2)
+
+        # Same checks as PolicyEngine._evaluate
+        if not self._spec_authorizes(spec_id, role, action):
+            return deny(f"Spec {spec_id} does not authorize role {role} for action {action}", tier)
+        if path:
+            trie = self._role_tries.get(role)
+            if trie is None or not trie.covers(path):
+                return deny(f"Path {path} is outside the jurisdiction of role {role}", tier)
+            trie = self._spec_tries.get(spec_id)
+            if trie is None or not trie.covers(path):
+                return deny(f"Path {path} is not authorized by spec {spec_id}", tier)
+
+        return {"status": "allowed", "tier": tier}
+
+    def _spec_authorizes(self, spec_id: str, role: str, action: str) -> bool:
+        spec_info = self.specs.get(spec_id)
+        if not spec_info:
+            return False
+        return (spec_info.get("status") in ("approved", "active")
+                and role in spec_info.get("roles", [])
+                and action in spec_info.get("action_types", []))
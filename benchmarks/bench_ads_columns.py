@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+ADS columnar store benchmark.
+
+Compares the dashboard-style Python loops over decoded events with the
+same aggregations on ADSColumnStore, using a synthetic ledger.
+
+Usage:
+    python benchmarks/bench_ads_columns.py
+    python benchmarks/bench_ads_columns.py --events 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.ads import columns
+from adt_core.ads.columns import ADSColumnStore
+from adt_core.ads.tail import ADSTailReader
+
+
+def _write_ledger(path, count):
+    agents = ["CLAUDE", "GEMINI", "CODEX", "HUMAN"]
+    actions = ["pending_edit", "completed_edit", "denied_edit", "session_start", "task_complete"]
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({
+                "event_id": f"evt_{i}",
+                "ts": f"2026-01-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:00Z",
+                "agent": agents[i % 4],
+                "role": f"role_{i % 9}",
+                "action_type": actions[i % 5],
+                "spec_ref": f"SPEC-{i % 40:03d}",
+                "authorized": i % 11 != 0,
+                "tier": i % 3 + 1,
+                "description": "benchmark event",
+            }) + "\n")
+
+
+def _python_aggregates(events):
+    denials = sum(1 for e in events if not e.get("authorized", True))
+    per_agent = Counter(e.get("agent") for e in events)
+    per_action = Counter(e.get("action_type") for e in events)
+    return denials, per_agent, per_action
+
+
+def _column_aggregates(store):
+    return (store.count(authorized=False), store.value_counts("agent"),
+            store.value_counts("action_type"), store.histogram(3600))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADS columnar store benchmark")
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.jsonl")
+        _write_ledger(path, args.events)
+
+        start = time.perf_counter()
+        events = ADSTailReader(path).get_events()
+        decode_s = time.perf_counter() - start
+        start = time.perf_counter()
+        _python_aggregates(events)
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ADSColumnStore(path).refresh()
+        build_s = time.perf_counter() - start
+        store = ADSColumnStore(path)
+        start = time.perf_counter()
+        store.refresh()
+        load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        _column_aggregates(store)
+        agg_s = time.perf_counter() - start
+
+    backend = "numpy" if columns.numpy is not None else "array"
+    print(f"{args.events} events, column backend: {backend}")
+    print(f"decode all events (tail reader)   {decode_s * 1000:10.1f} ms")
+    print(f"python loop aggregates            {loop_s * 1000:10.1f} ms")
+    print(f"column store build                {build_s * 1000:10.1f} ms")
+    print(f"column store load (new process)   {load_s * 1000:10.1f} ms")
+    print(f"column aggregates + histogram     {agg_s * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
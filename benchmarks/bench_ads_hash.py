@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+ADS hashing microbenchmark.
+
+Compares the original calculate_event_hash / json.dumps write path with the
+canonical-bytes path in adt_core.ads.crypto, and json.loads with
+decode_event (orjson when installed).
+
+Usage:
+    python benchmarks/bench_ads_hash.py
+    python benchmarks/bench_ads_hash.py --events 50000
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.ads import crypto
+from adt_core.ads.crypto import GENESIS_HASH, calculate_event_hash, decode_event, seal_event
+from adt_core.ads.schema import ADSEventSchema
+
+
+def legacy_event_hash(event, prev_hash):
+    event_copy = {k: v for k, v in event.items() if k != "hash"}
+    event_json = json.dumps(event_copy, sort_keys=True)
+    hasher = hashlib.sha256()
+    hasher.update(prev_hash.encode("utf-8"))
+    hasher.update(event_json.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def legacy_seal(event, prev_hash):
+    event["prev_hash"] = prev_hash
+    event["hash"] = legacy_event_hash(event, prev_hash)
+    return json.dumps(event)
+
+
+def _events(count):
+    return [
+        ADSEventSchema.create_event(
+            event_id=f"evt_bench_{i}",
+            agent="CLAUDE",
+            role="Backend_Engineer",
+            action_type="dry_run_validated_edit",
+            description=f"Dry-run validated edit on src/module_{i % 50}.py. Rationale: benchmark",
+            spec_ref="SPEC-017",
+            authorized=True,
+            tier=3,
+            action_data={"path": f"src/module_{i % 50}.py", "lines": i % 400},
+        )
+        for i in range(count)
+    ]
+
+
+def _time(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADS hashing microbenchmark")
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    events = _events(args.events)
+    lines = [seal_event(dict(e), GENESIS_HASH) for e in events]
+    parsed = [json.loads(line) for line in lines]
+
+    rows = [
+        ("write (hash + serialize)",
+         _time(lambda e: legacy_seal(dict(e), GENESIS_HASH), events),
+         _time(lambda e: seal_event(dict(e), GENESIS_HASH), events)),
+        ("verify hash",
+         _time(lambda e: legacy_event_hash(e, GENESIS_HASH), parsed),
+         _time(lambda e: calculate_event_hash(e, GENESIS_HASH), parsed)),
+        ("decode line",
+         _time(json.loads, lines),
+         _time(decode_event, lines)),
+    ]
+
+    backend = "orjson" if crypto.orjson is not None else "json"
+    print(f"{args.events} events, decode backend: {backend}")
+    print(f"{'operation':<26} {'legacy us/ev':>13} {'new us/ev':>10} {'speedup':>8}")
+    for name, legacy, new in rows:
+        per = 1e6 / args.events
+        print(f"{name:<26} {legacy * per:>13.2f} {new * per:>10.2f} {legacy / new:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
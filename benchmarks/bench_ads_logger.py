@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+ADS write throughput benchmark.
+
+Measures events/sec for ADSLogger.log with N concurrent writer threads, in
+the default per-event fsync mode and in group-commit mode.
+
+Usage:
+    python benchmarks/bench_ads_logger.py
+    python benchmarks/bench_ads_logger.py --writers 1 8 64 --events 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.schema import ADSEventSchema
+
+
+def _event(i: int) -> dict:
+    return ADSEventSchema.create_event(
+        event_id=f"evt_bench_{i}",
+        agent="CLAUDE",
+        role="Backend_Engineer",
+        action_type="dry_run_validated_edit",
+        description=f"Dry-run validated edit on src/module_{i % 50}.py. Rationale: benchmark",
+        spec_ref="SPEC-017",
+        authorized=True,
+        tier=3,
+    )
+
+
+def run(writers: int, total_events: int, group_commit: bool, max_batch_size: int, max_wait_ms: float) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        ads = ADSLogger(
+            os.path.join(tmp, "_cortex", "ads", "events.jsonl"),
+            group_commit=group_commit,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+        per_writer = max(1, total_events // writers)
+        barrier = threading.Barrier(writers + 1)
+
+        def worker(n: int):
+            barrier.wait()
+            for i in range(per_writer):
+                ads.log(_event(n * per_writer + i))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(writers)]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        ads.close()
+        return (per_writer * writers) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADSLogger write throughput")
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--events", type=int, default=2000, help="Total events per run")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(f"{'writers':>8} {'per-event fsync':>18} {'group commit':>15} {'speedup':>8}")
+    for writers in args.writers:
+        single = run(writers, args.events, False, args.max_batch_size, args.max_wait_ms)
+        grouped = run(writers, args.events, True, args.max_batch_size, args.max_wait_ms)
+        print(f"{writers:>8} {single:>14.0f} ev/s {grouped:>11.0f} ev/s {grouped / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
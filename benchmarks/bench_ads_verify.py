@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+ADS full-chain verification benchmark.
+
+Builds a synthetic ledger of N chained events and times
+ADSIntegrity.verify_chain serially and with a process pool.
+
+Usage:
+    python benchmarks/bench_ads_verify.py
+    python benchmarks/bench_ads_verify.py --events 100000 1000000 --jobs 2 4 8
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.ads.crypto import GENESIS_HASH, calculate_event_hash
+from adt_core.ads.integrity import ADSIntegrity
+from adt_core.ads.schema import ADSEventSchema
+
+
+def build_ledger(path: str, count: int):
+    prev_hash = GENESIS_HASH
+    with open(path, "w") as f:
+        for i in range(count):
+            event = ADSEventSchema.create_event(
+                event_id=f"evt_bench_{i}",
+                agent="CLAUDE",
+                role="Backend_Engineer",
+                action_type="dry_run_validated_edit",
+                description=f"Dry-run validated edit on src/module_{i % 50}.py. Rationale: benchmark",
+                spec_ref="SPEC-017",
+                authorized=True,
+                tier=3,
+            )
+            event["prev_hash"] = prev_hash
+            event["hash"] = calculate_event_hash(event, prev_hash)
+            prev_hash = event["hash"]
+            f.write(json.dumps(event) + "\n")
+
+
+def timed(path: str, parallel: int) -> float:
+    start = time.perf_counter()
+    is_valid, errors = ADSIntegrity.verify_chain(path, parallel=parallel)
+    elapsed = time.perf_counter() - start
+    assert is_valid, errors[:5]
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADS verify_chain throughput")
+    parser.add_argument("--events", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    jobs = sorted(set(j for j in args.jobs if j > 1))
+    print(f"{'events':>10} {'jobs':>5} {'seconds':>9} {'events/s':>11} {'speedup':>8}")
+    for count in args.events:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            build_ledger(path, count)
+            serial = timed(path, 1)
+            print(f"{count:>10} {1:>5} {serial:>9.2f} {count / serial:>11.0f} {1.0:>7.1f}x")
+            for n in jobs:
+                elapsed = timed(path, n)
+                print(f"{count:>10} {n:>5} {elapsed:>9.2f} {count / elapsed:>11.0f} {serial / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
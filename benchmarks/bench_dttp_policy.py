@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+DTTP policy evaluation benchmark.
+
+Builds a synthetic specs/jurisdictions config and times
+PolicyEngine.validate_request with the compiled path tries, cold and with
+the verdict cache warm, against the previous linear normpath scan.
+
+Usage:
+    python benchmarks/bench_dttp_policy.py
+    python benchmarks/bench_dttp_policy.py --specs 500 --roles 50 --paths 10000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.dttp.jurisdictions import JurisdictionManager
+from adt_core.dttp.policy import PolicyEngine
+from adt_core.sdd.validator import SpecValidator
+
+
+def _config(n_specs, n_roles, paths_per_spec, rng):
+    roles = [f"role_{i}" for i in range(n_roles)]
+    dirs = [f"src/pkg_{i}/mod_{j}" for i in range(50) for j in range(20)]
+    specs = {}
+    for i in range(n_specs):
+        specs[f"SPEC-{i:03d}"] = {
+            "status": "approved",
+            "roles": rng.sample(roles, 5),
+            "action_types": ["edit", "create", "delete"],
+            "paths": rng.sample(dirs, paths_per_spec),
+        }
+    jurisdictions = {role: rng.sample(dirs, 500) for role in roles}
+    return {"specs": specs}, {"jurisdictions": jurisdictions}, roles, dirs
+
+
+def _linear_validate(specs, jurisdictions, role, spec_id, action, path):
+    """The pre-trie algorithm, re-stated here for comparison."""
+    spec = specs.get(spec_id)
+    if not spec or spec["status"] not in ("approved", "active") or role not in spec["roles"] \
+            or action not in spec["action_types"]:
+        return False
+    normalized = os.path.normpath(path)
+    for allowed in (jurisdictions.get(role, []), spec["paths"]):
+        for prefix in allowed:
+            prefix_norm = os.path.normpath(prefix)
+            if normalized == prefix_norm or normalized.startswith(prefix_norm + os.sep):
+                break
+        else:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--specs", type=int, default=500)
+    parser.add_argument("--roles", type=int, default=50)
+    parser.add_argument("--paths", type=int, default=10000, help="distinct file paths to validate")
+    parser.add_argument("--paths-per-spec", type=int, default=40)
+    parser.add_argument("--requests", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    specs_cfg, juris_cfg, roles, dirs = _config(args.specs, args.roles, args.paths_per_spec, rng)
+    files_by_dir = {}
+    for i in range(args.paths):
+        directory = rng.choice(dirs)
+        files_by_dir.setdefault(directory, []).append(f"{directory}/file_{i}.py")
+    files = [f for group in files_by_dir.values() for f in group]
+    spec_ids = list(specs_cfg["specs"])
+    requests = []
+    for _ in range(args.requests):
+        spec_id = rng.choice(spec_ids)
+        spec = specs_cfg["specs"][spec_id]
+        role = rng.choice(spec["roles"]) if rng.random() < 0.9 else rng.choice(roles)
+        # Mostly files the spec covers, as in a real session; some strays.
+        in_spec = [f for d in spec["paths"] for f in files_by_dir.get(d, [])]
+        path = rng.choice(in_spec) if in_spec and rng.random() < 0.8 else rng.choice(files)
+        requests.append((role, spec_id, "edit", path))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        specs_path = os.path.join(tmp, "specs.json")
+        juris_path = os.path.join(tmp, "jurisdictions.json")
+        with open(specs_path, "w") as f:
+            json.dump(specs_cfg, f)
+        with open(juris_path, "w") as f:
+            json.dump(juris_cfg, f)
+
+        start = time.perf_counter()
+        engine = PolicyEngine(SpecValidator(specs_path), JurisdictionManager(juris_path))
+        compile_s = time.perf_counter() - start
+
+        print(f"{args.specs} specs x {args.roles} roles, {args.paths} paths, {args.requests} requests")
+        print(f"  load + compile:          {compile_s * 1000:8.1f} ms")
+
+        specs, jurisdictions = specs_cfg["specs"], juris_cfg["jurisdictions"]
+        start = time.perf_counter()
+        expected = [_linear_validate(specs, jurisdictions, *r) for r in requests]
+        linear_s = time.perf_counter() - start
+
+        engine.cache_size = 0
+        start = time.perf_counter()
+        cold = [engine.validate_request(*r)[0] for r in requests]
+        trie_s = time.perf_counter() - start
+
+        engine.cache_size = len(requests)
+        for r in requests:
+            engine.validate_request(*r)
+        start = time.perf_counter()
+        warm = [engine.validate_request(*r)[0] for r in requests]
+        cached_s = time.perf_counter() - start
+
+    assert cold == expected and warm == expected, "trie verdicts differ from the linear scan"
+    allowed = sum(expected)
+    for label, seconds in (("linear scan", linear_s), ("trie, no cache", trie_s), ("trie, cache warm", cached_s)):
+        print(f"  {label + ':':24} {seconds / len(requests) * 1e6:8.2f} us/request")
+    print(f"  allowed: {allowed}/{len(requests)}")
+
+
+if __name__ == "__main__":
+    main()
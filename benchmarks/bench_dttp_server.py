@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DTTP serving benchmark.
+
+Starts the DTTP service in a subprocess with each server mode and has N
+concurrent agents send dry-run /request calls, reporting p50/p99 latency
+and throughput. "werkzeug" is the server used before serving modes
+existed; "gunicorn" is skipped unless gunicorn is installed.
+
+Usage:
+    python benchmarks/bench_dttp_server.py
+    python benchmarks/bench_dttp_server.py --agents 50 --requests 40 --servers werkzeug threaded
+"""
+import argparse
+import importlib.util
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _make_project(root):
+    os.makedirs(os.path.join(root, "config"))
+    with open(os.path.join(root, "config", "specs.json"), "w") as f:
+        json.dump({"specs": {"SPEC-001": {"status": "approved", "roles": ["tester"],
+                                          "action_types": ["edit"], "paths": ["src/"]}}}, f)
+    with open(os.path.join(root, "config", "jurisdictions.json"), "w") as f:
+        json.dump({"jurisdictions": {"tester": ["src/"]}}, f)
+    with open(os.path.join(root, "config", "dttp.json"), "w") as f:
+        json.dump({"ads_group_commit": True}, f)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start(server, root, port, workers, threads):
+    cmd = [sys.executable, "-m", "adt_core.dttp.service", "--project-root", root, "--port", str(port),
+           "--mode", "production", "--server", server, "--workers", str(workers), "--threads", str(threads)]
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.Popen(cmd, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/status", timeout=1)
+            return proc
+        except requests.RequestException:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{server} server did not start")
+
+
+def _run_agents(url, agents, per_agent):
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(agents)
+
+    def agent(n):
+        session = requests.Session()
+        mine = []
+        barrier.wait()
+        for i in range(per_agent):
+            payload = {"agent": f"AGENT{n}", "role": "tester", "spec_id": "SPEC-001", "action": "edit",
+                       "params": {"file": f"src/module_{n}_{i}.py"}, "rationale": "bench", "dry_run": True}
+            start = time.perf_counter()
+            response = session.post(f"{url}/request", json=payload, timeout=60)
+            mine.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=agent, args=(n,)) for n in range(agents)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=40, help="requests per agent")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=16, help="request threads per process")
+    parser.add_argument("--servers", nargs="+", default=["werkzeug", "threaded", "gunicorn"])
+    args = parser.parse_args()
+
+    print(f"{args.agents} concurrent agents x {args.requests} dry-run requests")
+    for server in args.servers:
+        if server == "gunicorn" and importlib.util.find_spec("gunicorn") is None:
+            print(f"  {server:10} skipped (not installed)")
+            continue
+        with tempfile.TemporaryDirectory() as root:
+            _make_project(root)
+            port = _free_port()
+            proc = _start(server, root, port, args.workers, args.threads)
+            try:
+                latencies, elapsed = _run_agents(f"http://127.0.0.1:{port}", args.agents, args.requests)
+            finally:
+                proc.send_signal(signal.SIGTERM)
+                proc.wait(timeout=60)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        print(f"  {server:10} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms   {len(latencies) / elapsed:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
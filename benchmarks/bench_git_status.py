@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+git status benchmark.
+
+Builds a throwaway repository with N committed files and times
+`git status --porcelain` / `git rev-parse HEAD` subprocesses (what the
+governance routes ran on every poll) against GitState, warm and right
+after a file changed.
+
+Usage:
+    python benchmarks/bench_git_status.py
+    python benchmarks/bench_git_status.py --files 50000 --rounds 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adt_core.gitstate import GitState
+
+
+def _git(root, *args):
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+def _make_repo(root, n_files):
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "bench@example.com")
+    _git(root, "config", "user.name", "bench")
+    per_dir = 100
+    for i in range(n_files):
+        directory = os.path.join(root, "src", f"pkg_{i // (per_dir * 10)}", f"mod_{i // per_dir}")
+        if i % per_dir == 0:
+            os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file_{i}.py"), "w") as f:
+            f.write(f"x = {i}\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+
+
+def _time(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        _make_repo(root, args.files)
+        print(f"{args.files} files (setup {time.perf_counter() - start:.1f} s)")
+
+        def subprocesses():
+            _git(root, "rev-parse", "--abbrev-ref", "HEAD")
+            _git(root, "status", "--porcelain")
+
+        state = GitState(root)
+        start = time.perf_counter()
+        state.status()
+        first_ms = (time.perf_counter() - start) * 1000
+
+        def warm():
+            state.branch()
+            state.status()
+
+        target = os.path.join(root, "src", "pkg_0", "mod_0", "file_0.py")
+
+        def after_change():
+            with open(target, "a") as f:
+                f.write("#\n")
+            state.status()
+
+        results = (
+            ("git subprocesses", _time(subprocesses, args.rounds)),
+            ("GitState, first call", first_ms),
+            ("GitState, warm", _time(warm, args.rounds * 100)),
+            ("GitState, after a write", _time(after_change, args.rounds)),
+        )
+        for label, ms in results:
+            print(f"  {label + ':':26} {ms:9.3f} ms")
+        print(f"  tree backend: {state._tree.backend}")
+        state.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Pre-tool hook import-time benchmark.
+
+The hooks run in a fresh interpreter on every agent tool call, so their
+imports are on the critical path. This reports the cumulative import time
+of each hook module (python -X importtime, interpreter start-up excluded).
+It takes a few ms with the standard library only; importing requests alone
+takes 50-100 ms.
+
+Usage:
+    python benchmarks/bench_hook_import.py
+    python benchmarks/bench_hook_import.py --rounds 20 --budget-ms 40
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HOOKS_DIR = os.path.join(REPO_ROOT, "adt_sdk", "hooks")
+HOOKS = ["claude_pretool", "gemini_pretool"]
+
+
+def _import_us(module: str) -> int:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-S", "-c", f"import {module}"], cwd=HOOKS_DIR,
+                          capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and line.rstrip().endswith(f"| {module}"):
+            return int(line[len("import time:"):].split("|")[1])
+    raise RuntimeError(f"python -X importtime did not report {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Exit with status 1 if a hook's median import time exceeds this")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in HOOKS:
+        median = statistics.median(_import_us(module) for _ in range(args.rounds)) / 1000
+        print(f"  {'import ' + module + ':':30} {median:8.1f} ms")
+        over_budget |= args.budget_ms is not None and median > args.budget_ms
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
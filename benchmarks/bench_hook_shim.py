@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pre-tool hook latency benchmark.
+
+Times one hook invocation per round, as an agent runs it: the full
+claude_pretool.py hook in a fresh interpreter, against pretool_shim.py
+talking to a resident hookd.py daemon. The input is a sandboxed Bash
+command, so no DTTP service is needed and only the hook overhead is
+measured.
+
+Usage:
+    python benchmarks/bench_hook_shim.py
+    python benchmarks/bench_hook_shim.py --rounds 50
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HOOKS_DIR = os.path.join(REPO_ROOT, "adt_sdk", "hooks")
+sys.path.insert(0, HOOKS_DIR)
+
+import hookd  # noqa: E402
+
+
+def _time(argv, payload, env, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run(argv, input=payload, env=env, check=True, capture_output=True, text=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    runtime_dir = tempfile.mkdtemp(prefix="adt-run-")
+    project_dir = tempfile.mkdtemp(prefix="adt-project-")
+    env = {**os.environ, "XDG_RUNTIME_DIR": runtime_dir, "CLAUDE_PROJECT_DIR": project_dir, "ADT_SANDBOX": "1"}
+    payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": "ls"}})
+    try:
+        direct = _time([sys.executable, os.path.join(HOOKS_DIR, "claude_pretool.py")], payload, env, args.rounds)
+
+        os.environ["XDG_RUNTIME_DIR"] = runtime_dir
+        server = hookd.HookDaemon(project_dir)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            shimmed = _time([sys.executable, "-S", os.path.join(HOOKS_DIR, "pretool_shim.py"), "claude"],
+                            payload, env, args.rounds)
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        shutil.rmtree(runtime_dir, ignore_errors=True)
+        shutil.rmtree(project_dir, ignore_errors=True)
+
+    print(f"  {'hook, fresh interpreter:':30} {direct:8.1f} ms")
+    print(f"  {'shim + resident daemon:':30} {shimmed:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
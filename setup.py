@@ -18,6 +18,9 @@ setup(
     ],
     extras_require={
         "dev": ["pytest", "pytest-cov"],
+        "fast": ["orjson"],
+        "analytics": ["numpy"],
+        "server": ["gunicorn", "uvicorn"],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,126 @@
+import json
+import pytest
+from collections import Counter
+from adt_core.ads import columns as columns_module
+from adt_core.ads.columns import ADSColumnStore
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.query import ADSQuery
+from adt_core.ads.schema import ADSEventSchema
+
+
+def _write_events(path, events):
+    with open(path, "a") as f:
+        for e in events:
+            f.write(json.dumps(e) + "\n")
+
+
+def _events(start, count):
+    roles = ["backend", "frontend", "devops"]
+    return [
+        {
+            "event_id": f"evt_{i}",
+            "ts": f"2026-01-01T{i // 30:02d}:{i % 60:02d}:00Z",
+            "agent": "CLAUDE" if i % 2 else "GEMINI",
+            "role": roles[i % 3],
+            "action_type": "denied_edit" if i % 7 == 0 else "completed_edit",
+            "spec_ref": f"SPEC-{i % 5:03d}",
+            "authorized": None if i % 14 == 0 else i % 7 != 0,  # None reads as unauthorized
+            "tier": i % 3 + 1,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns_module, "numpy", None)
+    return request.param
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    _write_events(path, _events(0, 100))
+    return path
+
+
+def test_aggregations_match_python_loops(ledger, backend):
+    events = ADSQuery(ledger).get_all_events()
+    store = ADSColumnStore(ledger)
+
+    assert store.count() == 100
+    assert store.count(authorized=False) == sum(1 for e in events if not e.get("authorized", True))
+    assert store.value_counts("agent") == Counter(e["agent"] for e in events)
+    assert store.value_counts("role", agent="CLAUDE") == Counter(e["role"] for e in events if e["agent"] == "CLAUDE")
+    assert store.value_counts("tier") == Counter(e["tier"] for e in events)
+    assert store.value_counts("authorized", action_type=["denied_edit", "pending_edit"]) == {False: 15}
+    assert store.count(spec_ref="SPEC-999") == 0
+    with store.segments.snapshot() as snap:
+        selected = [json.loads(snap.read_line(pos))["event_id"]
+                    for pos in store.offsets(spec_ref="SPEC-001", role="frontend")]
+    assert selected == [e["event_id"] for e in events if e["spec_ref"] == "SPEC-001" and e["role"] == "frontend"]
+
+
+def test_histogram_buckets(ledger, backend):
+    store = ADSColumnStore(ledger)
+    hourly = store.histogram(3600)
+    assert hourly == [("2026-01-01T00:00:00Z", 30), ("2026-01-01T01:00:00Z", 30),
+                      ("2026-01-01T02:00:00Z", 30), ("2026-01-01T03:00:00Z", 10)]
+    assert store.histogram(3600, since="2026-01-01T02:00:00Z", authorized=False) == [
+        ("2026-01-01T02:00:00Z", 4), ("2026-01-01T03:00:00Z", 2),
+    ]
+    with pytest.raises(ValueError):
+        store.histogram(0)
+
+
+def test_refresh_is_incremental_and_shared(ledger, backend):
+    store = ADSColumnStore(ledger)
+    assert store.count() == 100
+    _write_events(ledger, _events(100, 20) + [{"event_id": "evt_new", "agent": "CODEX"}])
+    assert store.count() == 121
+    assert store.value_counts("agent")["CODEX"] == 1
+    # A second instance (another process) reads the same on-disk columns.
+    other = ADSColumnStore(ledger)
+    assert other.value_counts("agent") == store.value_counts("agent")
+    with open(ledger, "a") as f:
+        f.write('{"event_id": "partial"')
+    assert store.count() == 121
+
+
+def test_rewritten_ledger_rebuilds_store(ledger, backend):
+    store = ADSColumnStore(ledger)
+    assert store.count() == 100
+    with open(ledger, "w") as f:
+        for e in _events(0, 10):
+            e["agent"] = "REWRITTEN"
+            f.write(json.dumps(e) + "\n")
+    assert store.value_counts("agent") == {"REWRITTEN": 10}
+
+
+def test_store_follows_rotated_segments(tmp_path, backend):
+    path = str(tmp_path / "events.jsonl")
+    ads = ADSLogger(path, max_segment_events=4)
+    for i in range(10):
+        ads.log(ADSEventSchema.create_event(
+            event_id=f"evt{i}", agent="CLAUDE", role="tester", action_type="edit",
+            description="rotating", spec_ref="SPEC-001", authorized=i != 3,
+        ))
+    store = ADSColumnStore(path)
+    assert store.count() == 10
+    assert store.count(authorized=False) == 1
+    ads.log(ADSEventSchema.create_event(
+        event_id="evt10", agent="GEMINI", role="tester", action_type="edit",
+        description="rotating", spec_ref="SPEC-001",
+    ))
+    assert store.value_counts("agent") == {"CLAUDE": 10, "GEMINI": 1}
+
+
+def test_unknown_column_is_rejected(ledger):
+    store = ADSColumnStore(ledger)
+    with pytest.raises(ValueError):
+        store.count(description="x")
+    with pytest.raises(ValueError):
+        store.value_counts("ts")
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+import pytest
+from adt_core.ads import crypto
+from adt_core.ads.crypto import calculate_event_hash, decode_event, seal_event
+from adt_core.ads.integrity import ADSIntegrity
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.schema import ADSEventSchema
+
+PROJECT_LEDGER = os.path.join(os.path.dirname(__file__), "..", "_cortex", "ads", "events.jsonl")
+
+
+def legacy_event_hash(event, prev_hash):
+    """calculate_event_hash as originally shipped; the on-disk chain is defined by it."""
+    event_copy = {k: v for k, v in event.items() if k != "hash"}
+    event_json = json.dumps(event_copy, sort_keys=True)
+    hasher = hashlib.sha256()
+    hasher.update(prev_hash.encode("utf-8"))
+    hasher.update(event_json.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _ledger_lines():
+    if not os.path.exists(PROJECT_LEDGER):
+        pytest.skip("project ledger not present")
+    with open(PROJECT_LEDGER, "rb") as f:
+        return [line for line in f if line.strip()]
+
+
+def test_hash_matches_legacy_on_project_ledger():
+    checked = 0
+    for line in _ledger_lines():
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        prev_hash = event.get("prev_hash")
+        if not isinstance(prev_hash, str):
+            continue
+        expected = legacy_event_hash(event, prev_hash)
+        assert calculate_event_hash(event, prev_hash) == expected
+        assert calculate_event_hash(decode_event(line), prev_hash) == expected
+        checked += 1
+    assert checked > 0
+
+
+def test_sealed_line_round_trips_on_project_ledger():
+    for line in _ledger_lines():
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        prev_hash = event.get("prev_hash")
+        if not isinstance(prev_hash, str):
+            continue
+        sealed = seal_event(dict(event), prev_hash)
+        parsed = json.loads(sealed)
+        assert parsed == dict(event, hash=parsed["hash"])
+        assert parsed["hash"] == legacy_event_hash(parsed, prev_hash)
+
+
+def test_decode_event_falls_back_to_stdlib():
+    assert decode_event(b'{"n": NaN}')["n"] != decode_event(b'{"n": NaN}')["n"]
+    assert decode_event('{"big": 123456789012345678901234567890}')["big"] == 123456789012345678901234567890
+    with pytest.raises(json.JSONDecodeError):
+        decode_event(b'{"broken"')
+
+
+def test_logger_writes_canonical_bytes(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    ads = ADSLogger(path)
+    event = ADSEventSchema.create_event(
+        event_id="evt1", agent="TEST", role="tester", action_type="start",
+        description="café ✓", spec_ref="SPEC-001", action_data={"z": 1.5, "a": [1, None]},
+    )
+    ads.log(event)
+    with open(path, "r") as f:
+        line = f.readline().rstrip("\n")
+    written = json.loads(line)
+    assert written["hash"] == legacy_event_hash(written, written["prev_hash"])
+    assert line == crypto.canonical_json(written)[:-1] + f', "hash": "{written["hash"]}"}}'
+    assert ADSIntegrity.verify_chain(path) == (True, [])
@@ -0,0 +1,98 @@
+import json
+import os
+import pytest
+from adt_core.ads.index import ADSIndex
+from adt_core.ads.query import ADSQuery
+
+
+def _write_events(path, events):
+    with open(path, "a") as f:
+        for e in events:
+            f.write(json.dumps(e) + "\n")
+
+
+def _events(start, count):
+    roles = ["backend", "frontend", "devops"]
+    return [
+        {
+            "event_id": f"evt_{i}",
+            "agent": "CLAUDE" if i % 2 else "GEMINI",
+            "role": roles[i % 3],
+            "action_type": "edit",
+            "spec_ref": f"SPEC-{i % 5:03d}",
+            "session_id": f"sess_{i // 10}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _scan(path, **filters):
+    query = ADSQuery(path)
+    return query._scan_filter(filters)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    _write_events(path, _events(0, 100))
+    return path
+
+
+def test_index_matches_full_scan(ledger):
+    query = ADSQuery(ledger)
+    cases = [
+        {},
+        {"agent": "CLAUDE"},
+        {"role": "devops", "spec_ref": "SPEC-002"},
+        {"session_id": "sess_3", "agent": "GEMINI"},
+        {"action_type": "missing"},
+    ]
+    for filters in cases:
+        assert query.filter_events(**filters) == _scan(ledger, **filters)
+        assert query.filter_events(limit=3, offset=2, **filters) == _scan(ledger, **filters)[2:5]
+
+
+def test_index_follows_appends(ledger):
+    query = ADSQuery(ledger)
+    assert len(query.filter_events(role="backend")) == 34
+    _write_events(ledger, _events(100, 30))
+    assert len(query.filter_events(role="backend")) == 44
+    assert query.filter_events(role="backend", limit=1, offset=43)[0]["event_id"] == "evt_129"
+
+
+def test_index_ignores_partial_trailing_line(ledger):
+    with open(ledger, "a") as f:
+        f.write('{"event_id": "evt_partial", "agent": "CLA')
+    query = ADSQuery(ledger)
+    assert len(query.filter_events()) == 100
+    with open(ledger, "a") as f:
+        f.write('UDE"}\n')
+    assert query.filter_events(limit=1, offset=100)[0]["event_id"] == "evt_partial"
+
+
+def test_index_rebuilds_after_rewrite(ledger):
+    query = ADSQuery(ledger)
+    assert len(query.filter_events(agent="CLAUDE")) == 50
+    # Rewrite in place (same inode) with different content, as heal_ads does
+    with open(ledger, "w") as f:
+        for e in _events(0, 120):
+            e["agent"] = "HUMAN"
+            f.write(json.dumps(e) + "\n")
+    assert query.filter_events(agent="CLAUDE") == []
+    assert len(query.filter_events(agent="HUMAN")) == 120
+
+
+def test_index_is_disposable(ledger):
+    index = ADSIndex(ledger)
+    index.update()
+    assert os.path.exists(index.meta_path)
+    index.rebuild()
+    assert len(index.query({"role": "frontend"})) == 33
+
+
+def test_index_non_string_values(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    _write_events(path, [{"event_id": "a", "session_id": 7}, {"event_id": "b", "session_id": "7"}])
+    query = ADSQuery(path)
+    assert [e["event_id"] for e in query.filter_events(session_id=7)] == ["a"]
+    assert [e["event_id"] for e in query.filter_events(session_id="7")] == ["b"]
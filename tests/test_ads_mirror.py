@@ -0,0 +1,101 @@
+import json
+import os
+import pytest
+import sqlite3
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.mirror import ADSMirror
+from adt_core.ads.schema import ADSEventSchema
+
+
+def _log(ads, i, **overrides):
+    fields = dict(
+        event_id=f"evt{i}", agent="CLAUDE" if i % 2 else "GEMINI", role="Backend_Engineer",
+        action_type="completed_edit", description=f"Edited src/module_{i}.py for caching",
+        spec_ref="SPEC-017", authorized=True,
+    )
+    fields.update(overrides)
+    ads.log(ADSEventSchema.create_event(**fields))
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    ads = ADSLogger(path)
+    for i in range(10):
+        _log(ads, i)
+    _log(ads, 10, action_type="denied_edit", authorized=False,
+         description="DENIED: Tier 2 path adt_core/dttp/gateway.py. Rationale: refactor the gateway")
+    _log(ads, 11, action_type="completed_edit", description="Session bookkeeping",
+         action_data={"path": "config/specs.json", "lines": 4})
+    return path
+
+
+def test_search_text_and_filters(ledger):
+    mirror = ADSMirror(ledger)
+    assert [e["event_id"] for e in mirror.search("src/module_3.py")] == ["evt3"]
+    assert [e["event_id"] for e in mirror.search("rationale gateway", authorized=False)] == ["evt10"]
+    assert mirror.search("gateway", authorized=True) == []
+    assert [e["event_id"] for e in mirror.search("config/specs.json")] == ["evt11"]
+    assert [e["event_id"] for e in mirror.search("caching", agent="GEMINI", limit=2)] == ["evt8", "evt6"]
+    assert [e["event_id"] for e in mirror.search("caching", agent="GEMINI", limit=2, offset=2)] == ["evt4", "evt2"]
+    # Query syntax in user text is matched literally rather than parsed.
+    assert mirror.search('"unbalanced AND (') == []
+    assert mirror.search("*") == []
+
+
+def test_mirror_follows_appends_and_rewrites(ledger):
+    mirror = ADSMirror(ledger)
+    assert mirror.count() == 12
+    _log(ADSLogger(ledger), 12, description="Late addition about telemetry")
+    assert [e["event_id"] for e in mirror.search("telemetry")] == ["evt12"]
+    assert mirror.update() == 0
+
+    with open(ledger) as f:
+        first = f.readline()
+    with open(ledger, "w") as f:
+        f.write(first)
+    assert mirror.count() == 1
+    assert mirror.search("telemetry") == []
+
+
+def test_verify_against_chain(ledger):
+    mirror = ADSMirror(ledger)
+    assert mirror.verify() == (True, [])
+
+    # Tamper with the mirror itself: the recomputed hash no longer matches.
+    conn = sqlite3.connect(mirror.db_path)
+    raw = conn.execute("SELECT raw FROM events WHERE event_id = 'evt4'").fetchone()[0]
+    conn.execute("UPDATE events SET raw = ? WHERE event_id = 'evt4'",
+                 (raw.replace("module_4", "module_X"),))
+    conn.commit()
+    conn.close()
+    is_valid, errors = mirror.verify()
+    assert not is_valid
+    assert any("hash does not match mirrored content" in e for e in errors)
+
+    os.remove(mirror.db_path)
+    assert ADSMirror(ledger).verify() == (True, [])
+
+
+def test_search_endpoint(ledger, monkeypatch):
+    from adt_center.app import create_app
+    app = create_app()
+    monkeypatch.setattr(app, "get_project_paths", lambda name=None: {"ads": ledger})
+    client = app.test_client()
+    resp = client.get("/api/ads/search?q=gateway&authorized=false")
+    assert resp.status_code == 200
+    assert [e["event_id"] for e in json.loads(resp.data)] == ["evt10"]
+    assert client.get("/api/ads/search?limit=0").status_code == 400
+
+
+def test_cli_search_uses_the_endpoint_query(ledger, monkeypatch, capsys):
+    from adt_core import cli
+    monkeypatch.setattr("sys.argv", ["adt", "ads", "search", "gateway", "--status", "denied", "--json",
+                                     "--path", ledger])
+    cli.main()
+    assert [e["event_id"] for e in json.loads(capsys.readouterr().out)] == ["evt10"]
+
+    monkeypatch.setattr("sys.argv", ["adt", "ads", "search", "--limit", "0", "--path", ledger])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert "limit must be between 1 and 1000" in capsys.readouterr().out
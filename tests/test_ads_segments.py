@@ -0,0 +1,229 @@
+import json
+import os
+import pytest
+from adt_core.ads import integrity
+from adt_core.ads import segments as segments_module
+from adt_core.ads.healer import heal_ads
+from adt_core.ads.integrity import ADSIntegrity
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.query import ADSQuery
+from adt_core.ads.schema import ADSEventSchema
+from adt_core.ads.segments import ADSSegments
+from adt_core.ads.tail import ADSTailReader
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return str(tmp_path / "events.jsonl")
+
+
+def _event(i, agent="CLAUDE"):
+    return ADSEventSchema.create_event(
+        event_id=f"evt{i}", agent=agent, role="tester",
+        action_type="edit", description=f"Event {i}", spec_ref="SPEC-001"
+    )
+
+
+def test_rotation_seals_segments_and_continues_chain(ledger, tmp_path):
+    ads = ADSLogger(ledger, max_segment_events=5)
+    for i in range(12):
+        ads.log(_event(i))
+
+    assert sorted(p.name for p in tmp_path.glob("events.0*.jsonl")) == ["events.000001.jsonl", "events.000002.jsonl"]
+    sealed = ADSSegments(ledger).sealed()
+    assert [s["events"] for s in sealed] == [5, 5]
+    with open(ledger) as f:
+        first_active = json.loads(f.readline())
+    assert first_active["prev_hash"] == sealed[-1]["last_hash"]
+
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+    query = ADSQuery(ledger)
+    assert [e["event_id"] for e in query.get_all_events()] == [f"evt{i}" for i in range(12)]
+    assert [e["event_id"] for e in query.get_all_events(limit=3)] == ["evt9", "evt10", "evt11"]
+    assert query.count_events() == 12
+
+
+def test_readers_follow_rotation_without_reset(ledger):
+    ads = ADSLogger(ledger, max_segment_events=4)
+    ads.log(_event(0))
+    ads.log(_event(1, agent="GEMINI"))
+    reader = ADSTailReader(ledger)
+    assert len(reader.get_events()) == 2
+    query = ADSQuery(ledger)
+    assert len(query.filter_events(agent="GEMINI")) == 1
+
+    for i in range(2, 11):
+        ads.log(_event(i, agent="GEMINI" if i % 2 else "CLAUDE"))
+
+    assert [e["event_id"] for e in reader.get_events()] == [f"evt{i}" for i in range(11)]
+    assert reader.resets == 0
+    assert [e["event_id"] for e in query.filter_events(agent="GEMINI")] == ["evt1", "evt3", "evt5", "evt7", "evt9"]
+
+
+def test_concurrent_loggers_share_rotation(ledger):
+    first = ADSLogger(ledger, max_segment_events=3)
+    second = ADSLogger(ledger, max_segment_events=3)
+    for i in range(10):
+        (first if i % 2 else second).log(_event(i))
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+    assert len(ADSSegments(ledger).sealed()) == 3
+
+
+def test_verify_reports_logical_line_numbers(ledger, monkeypatch):
+    ads = ADSLogger(ledger, max_segment_events=5)
+    for i in range(12):
+        ads.log(_event(i))
+    segment = ADSSegments(ledger).sealed()[1]["path"]
+    with open(segment) as f:
+        lines = f.readlines()
+    lines[1] = lines[1].replace("Event 6", "Event X")
+    # Keep the sealed size unchanged so the manifest still describes the file.
+    with open(segment, "w") as f:
+        f.writelines(lines)
+
+    is_valid, errors = ADSIntegrity.verify_chain(ledger)
+    assert not is_valid
+    assert errors[0].startswith("Line 7: Invalid hash")
+    monkeypatch.setattr(integrity, "PARALLEL_MIN_BYTES", 0)
+    assert ADSIntegrity.verify_chain(ledger, parallel=2) == (is_valid, errors)
+
+
+def test_heal_merges_segments(ledger, tmp_path):
+    ads = ADSLogger(ledger, max_segment_events=4)
+    for i in range(9):
+        ads.log(_event(i))
+    heal_ads(ledger)
+    assert not list(tmp_path.glob("events.0*.jsonl"))
+    assert not os.path.exists(ADSSegments(ledger).manifest_path)
+    events = ADSQuery(ledger).get_all_events()
+    assert [e["event_id"] for e in events[:9]] == [f"evt{i}" for i in range(9)]
+    assert events[-1]["action_type"] == "integrity_reset"
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+
+
+def test_interrupted_rotation_is_completed(ledger, monkeypatch):
+    ads = ADSLogger(ledger)
+    for i in range(3):
+        ads.log(_event(i))
+    segments = ADSSegments(ledger)
+    def crash(*args):
+        raise OSError("simulated crash")
+    with monkeypatch.context() as m:
+        m.setattr(os, "rename", crash)
+        with open(ledger, "a+") as f:
+            with pytest.raises(OSError):
+                segments.seal_active(f)
+
+    # A rotation inside the grace period may still belong to a live writer.
+    segments.recover()
+    assert not os.path.exists(segments.segment_path(1))
+
+    monkeypatch.setattr(segments_module, "ROTATION_GRACE_SECONDS", -1)
+    ADSLogger(ledger).log(_event(3))
+    assert os.path.exists(segments.segment_path(1))
+    assert [e["event_id"] for e in ADSQuery(ledger).get_all_events()] == [f"evt{i}" for i in range(4)]
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+
+
+def _sealed_ledger(ledger, events=12, per_segment=5):
+    ads = ADSLogger(ledger, max_segment_events=per_segment)
+    for i in range(events):
+        ads.log(_event(i, agent="GEMINI" if i % 3 == 0 else "CLAUDE"))
+    return ads
+
+
+def test_compressed_segments_read_like_plain(ledger, tmp_path, monkeypatch):
+    _sealed_ledger(ledger, events=40, per_segment=15)
+    query = ADSQuery(ledger)
+    expected = query.get_all_events()
+    reader = ADSTailReader(ledger)
+    assert len(reader.get_events()) == 40
+
+    # Small blocks so reads cross block boundaries.
+    compressed = ADSSegments(ledger).compress("gzip", block_size=1024)
+    assert [e["name"] for e in compressed] == ["events.000001.jsonl", "events.000002.jsonl"]
+    assert not list(tmp_path.glob("events.0*.jsonl"))
+    assert all(e["stored_bytes"] < e["bytes"] for e in compressed)
+    assert ADSSegments(ledger).compress("gzip") == []
+
+    query = ADSQuery(ledger)
+    assert query.get_all_events() == expected
+    assert query.get_all_events(limit=3) == expected[-3:]
+    assert [e["event_id"] for e in query.filter_events(agent="GEMINI")] == [f"evt{i}" for i in range(0, 40, 3)]
+    assert query.count_events() == 40
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+    monkeypatch.setattr(integrity, "PARALLEL_MIN_BYTES", 0)
+    assert ADSIntegrity.verify_chain(ledger, parallel=2) == (True, [])
+
+    ADSLogger(ledger).log(_event(40))
+    assert [e["event_id"] for e in reader.get_events()] == [f"evt{i}" for i in range(41)]
+    assert reader.resets == 0
+
+
+def test_compress_keeps_plain_segment_when_copy_is_bad(ledger, tmp_path, monkeypatch):
+    _sealed_ledger(ledger, events=12, per_segment=5)
+    write_compressed = ADSSegments._write_compressed
+
+    def corrupt(plain_path, stored_path, codec, block_size):
+        with open(plain_path, "rb") as f:
+            data = f.read()
+        with open(plain_path, "wb") as f:
+            f.write(data.replace(b"Event 1", b"Event X"))
+        try:
+            return write_compressed(plain_path, stored_path, codec, block_size)
+        finally:
+            with open(plain_path, "wb") as f:
+                f.write(data)
+
+    monkeypatch.setattr(ADSSegments, "_write_compressed", staticmethod(corrupt))
+    compressed = ADSSegments(ledger).compress("gzip")
+    assert [e["name"] for e in compressed] == ["events.000002.jsonl"]  # only segment 1 was corrupted
+    assert sorted(p.name for p in tmp_path.glob("events.0*")) == [
+        "events.000001.jsonl", "events.000002.jsonl.gz", "events.000002.jsonl.gz.idx"]
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+
+
+def test_snapshot_reads_lines_across_blocks(ledger):
+    _sealed_ledger(ledger, events=30, per_segment=30)
+    segments = ADSSegments(ledger)
+    with segments.snapshot() as snap:
+        plain = list(snap.iter_lines())
+    segments.compress("gzip", block_size=700)
+    with segments.snapshot() as snap:
+        assert list(snap.iter_lines()) == plain
+        for offset, line in reversed(plain):
+            assert snap.read_line(offset) == line
+
+
+def test_reader_with_stale_manifest_finds_compressed_copy(ledger):
+    _sealed_ledger(ledger)
+    stale = ADSSegments(ledger)
+    sealed = stale.sealed()
+    ADSSegments(ledger).compress("gzip")
+    # Pin the pre-compression manifest, as a reader that loaded it just before would.
+    stale.sealed = lambda: sealed
+    with stale.snapshot() as snap:
+        events = [json.loads(line) for _, line in snap.iter_lines()]
+    assert [e["event_id"] for e in events] == [f"evt{i}" for i in range(12)]
+
+
+def test_logger_compresses_sealed_segments(ledger, tmp_path):
+    ads = ADSLogger(ledger, max_segment_events=5, segment_codec="gzip")
+    for i in range(12):
+        ads.log(_event(i))
+    ads.close()
+    assert sorted(p.name for p in tmp_path.glob("events.0*")) == [
+        "events.000001.jsonl.gz", "events.000001.jsonl.gz.idx",
+        "events.000002.jsonl.gz", "events.000002.jsonl.gz.idx",
+    ]
+    assert ADSIntegrity.verify_chain(ledger) == (True, [])
+
+    heal_ads(ledger)
+    assert not list(tmp_path.glob("events.0*"))
+    assert [e["event_id"] for e in ADSQuery(ledger).get_all_events()[:12]] == [f"evt{i}" for i in range(12)]
+
+
+def test_compress_rejects_unknown_codec(ledger):
+    _sealed_ledger(ledger)
+    with pytest.raises(ValueError):
+        ADSSegments(ledger).compress("lz4")
@@ -0,0 +1,137 @@
+import json
+import pytest
+from adt_core.ads import stream as stream_module
+from adt_core.ads.logger import ADSLogger
+from adt_core.ads.schema import ADSEventSchema
+from adt_core.ads.stream import ADSBroadcaster
+
+
+def _event(i, agent="CLAUDE"):
+    return ADSEventSchema.create_event(
+        event_id=f"evt{i}", agent=agent, role="tester",
+        action_type="edit", description=f"Event {i}", spec_ref="SPEC-001"
+    )
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    ads = ADSLogger(path)
+    for i in range(3):
+        ads.log(_event(i))
+    return path
+
+
+def _drain(sub):
+    messages = []
+    while True:
+        message = sub.get(timeout=0)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_subscribers_receive_only_new_events(ledger):
+    broadcaster = ADSBroadcaster(ledger, poll_interval=60)
+    with broadcaster.subscribe() as everyone, broadcaster.subscribe(filters={"agent": "GEMINI"}) as gemini:
+        ads = ADSLogger(ledger)
+        ads.log(_event(3))
+        ads.log(_event(4, agent="GEMINI"))
+        broadcaster.poll()
+        assert [(k, e["event_id"]) for k, _, e in _drain(everyone)] == [("event", "evt3"), ("event", "evt4")]
+        assert [e["event_id"] for _, _, e in _drain(gemini)] == ["evt4"]
+
+
+def test_resume_from_offset_replays_without_gaps_or_repeats(ledger):
+    broadcaster = ADSBroadcaster(ledger, poll_interval=60)
+    first = broadcaster.subscribe(since=0)
+    seen = _drain(first)
+    assert [e["event_id"] for _, _, e in seen] == ["evt0", "evt1", "evt2"]
+    resume_at = seen[0][1]
+    first.close()
+
+    ads = ADSLogger(ledger)
+    ads.log(_event(3))
+    with broadcaster.subscribe(since=resume_at) as resumed:
+        ads.log(_event(4))
+        broadcaster.poll()
+        assert [e["event_id"] for _, _, e in _drain(resumed)] == ["evt1", "evt2", "evt3", "evt4"]
+
+
+def test_stale_offset_and_rewrite_send_reset(ledger):
+    broadcaster = ADSBroadcaster(ledger, poll_interval=60)
+    with broadcaster.subscribe(since=10 ** 9) as stale:
+        kind, offset, _ = _drain(stale)[0]
+        assert kind == "reset" and offset == broadcaster.offset
+
+        with open(ledger) as f:
+            first = f.readline()
+        with open(ledger, "w") as f:
+            f.write(first)
+        broadcaster.poll()
+        assert [m[0] for m in _drain(stale)] == ["reset"]
+        ADSLogger(ledger).log(_event(9))
+        broadcaster.poll()
+        assert [e["event_id"] for _, _, e in _drain(stale)] == ["evt9"]
+
+
+def test_slow_subscriber_is_dropped(ledger, monkeypatch):
+    monkeypatch.setattr(stream_module, "SUBSCRIBER_QUEUE_SIZE", 2)
+    broadcaster = ADSBroadcaster(ledger, poll_interval=60)
+    with broadcaster.subscribe() as slow:
+        ads = ADSLogger(ledger)
+        for i in range(3, 6):
+            ads.log(_event(i))
+        broadcaster.poll()
+        assert slow.overflowed
+        assert _drain(slow)[-1][0] == "overflow"
+
+
+def test_backlog_is_replayed_in_pages_past_the_queue_size(ledger, monkeypatch):
+    monkeypatch.setattr(stream_module, "SUBSCRIBER_QUEUE_SIZE", 2)
+    monkeypatch.setattr(stream_module, "REPLAY_PAGE_BYTES", 10)  # shorter than a line
+    ads = ADSLogger(ledger)
+    for i in range(3, 6):
+        ads.log(_event(i, agent="GEMINI" if i % 2 else "CLAUDE"))
+    broadcaster = ADSBroadcaster(ledger, poll_interval=60)
+    with broadcaster.subscribe(since=0, filters={"agent": "CLAUDE"}) as resumed:
+        ads.log(_event(6))
+        broadcaster.poll()
+        messages = _drain(resumed)
+        assert not resumed.overflowed
+        assert [e["event_id"] for _, _, e in messages] == ["evt0", "evt1", "evt2", "evt4", "evt6"]
+        assert [m[1] for m in messages] == sorted(m[1] for m in messages)
+
+
+def test_stream_endpoint(ledger, monkeypatch):
+    from adt_center.app import create_app
+    app = create_app()
+    monkeypatch.setattr(app, "get_project_paths", lambda name=None: {"ads": ledger})
+    client = app.test_client()
+
+    resp = client.get("/api/ads/stream", headers={"Last-Event-ID": "0"})
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    chunks = iter(resp.response)
+    assert b"event: open" in next(chunks)
+    message = next(chunks).decode()
+    assert message.startswith("id: ")
+    assert json.loads(message.split("data: ", 1)[1])["event_id"] == "evt0"
+    resp.close()
+
+    assert client.get("/api/ads/stream?last_event_id=abc").status_code == 400
+    resp = client.get("/api/ads/events", headers={"Origin": "tauri://localhost"})
+    assert int(resp.headers["X-ADS-Offset"]) == app.get_ads_broadcaster(ledger).offset
+    assert "X-ADS-Offset" in resp.headers["Access-Control-Expose-Headers"]
+
+
+def test_tail_thread_delivers_and_stops(ledger):
+    broadcaster = ADSBroadcaster(ledger, poll_interval=0.01)
+    sub = broadcaster.subscribe()
+    ADSLogger(ledger).log(_event(3))
+    kind, _, event = sub.get(timeout=5)
+    assert (kind, event["event_id"]) == ("event", "evt3")
+    thread = broadcaster._thread
+    sub.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
@@ -0,0 +1,96 @@
+import json
+import os
+import pytest
+from adt_core.ads.query import ADSQuery
+from adt_core.ads.tail import ADSTailReader
+
+
+def _append(path, start, count):
+    with open(path, "a") as f:
+        for i in range(start, start + count):
+            f.write(json.dumps({"id": i, "hash": f"{i:064x}"}) + "\n")
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    _append(path, 0, 5)
+    return path
+
+
+def test_read_since_returns_only_new_events(ledger):
+    query = ADSQuery(ledger)
+    events, offset = query.read_since(0)
+    assert [e["id"] for e in events] == [0, 1, 2, 3, 4]
+    assert offset == os.path.getsize(ledger)
+
+    assert query.read_since(offset) == ([], offset)
+    _append(ledger, 5, 2)
+    events, new_offset = query.read_since(offset)
+    assert [e["id"] for e in events] == [5, 6]
+    assert new_offset == os.path.getsize(ledger)
+
+
+def test_read_since_leaves_partial_line(ledger):
+    query = ADSQuery(ledger)
+    _, offset = query.read_since(0)
+    with open(ledger, "a") as f:
+        f.write('{"id": 5')
+    assert query.read_since(offset) == ([], offset)
+    with open(ledger, "a") as f:
+        f.write('}\n')
+    events, _ = query.read_since(offset)
+    assert events == [{"id": 5}]
+
+
+def test_tail_reader_parses_incrementally(ledger, monkeypatch):
+    reader = ADSTailReader(ledger)
+    assert len(reader.get_events()) == 5
+
+    calls = []
+    real_read_entries_since = ADSQuery.read_entries_since
+    def spy(self, offset=0):
+        calls.append(offset)
+        return real_read_entries_since(self, offset)
+    monkeypatch.setattr(ADSQuery, "read_entries_since", spy)
+
+    assert len(reader.get_events()) == 5
+    assert calls == []  # nothing appended, nothing parsed
+    offset_before = reader.offset
+    _append(ledger, 5, 3)
+    assert [e["id"] for e in reader.get_events()][-3:] == [5, 6, 7]
+    assert calls == [offset_before]
+    assert reader.resets == 0
+
+
+def test_tail_reader_resets_on_truncation(ledger):
+    reader = ADSTailReader(ledger)
+    reader.get_events()
+    with open(ledger, "w") as f:
+        pass
+    _append(ledger, 100, 2)
+    assert [e["id"] for e in reader.get_events()] == [100, 101]
+    assert reader.resets == 1
+
+
+def test_tail_reader_resets_on_in_place_rewrite(ledger):
+    reader = ADSTailReader(ledger)
+    reader.get_events()
+    # Same inode, larger file, different content (heal_ads style rewrite)
+    with open(ledger, "w") as f:
+        for i in range(7):
+            f.write(json.dumps({"id": i, "hash": f"{i + 1000:064x}"}) + "\n")
+    events = reader.get_events()
+    assert len(events) == 7
+    assert events[0]["hash"] == f"{1000:064x}"
+    assert reader.resets == 1
+
+
+def test_tail_reader_resets_on_replacement(ledger, tmp_path):
+    reader = ADSTailReader(ledger)
+    reader.get_events()
+    replacement = str(tmp_path / "new.jsonl")
+    _append(replacement, 50, 9)
+    os.replace(replacement, ledger)
+    assert [e["id"] for e in reader.get_events()][0] == 50
+    assert reader.resets == 1
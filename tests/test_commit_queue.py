@@ -0,0 +1,154 @@
+import asyncio
+import json
+import subprocess
+import pytest
+from adt_core.ads.logger import ADSLogger
+from adt_core.dttp.actions import ActionHandler
+from adt_core.dttp.commit_queue import CommitQueue
+from adt_core.dttp.config import DTTPConfig
+from adt_core.dttp.service import create_dttp_app
+from adt_core.dttp.sync import AsyncGitSync, GitSync
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    work = tmp_path / "work"
+    work.mkdir()
+    _git(work, "init", "-q")
+    _git(work, "config", "user.email", "dttp@example.com")
+    _git(work, "config", "user.name", "DTTP")
+    (work / "README").write_text("x")
+    _git(work, "add", "README")
+    _git(work, "commit", "-q", "-m", "init")
+    _git(work, "remote", "add", "origin", str(remote))
+    _git(work, "push", "-q", "-u", "origin", "HEAD")
+    return work
+
+
+def _events(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_burst_is_one_commit_logged_with_its_hash(repo, tmp_path):
+    ads = ADSLogger(str(tmp_path / "events.jsonl"))
+    queue = CommitQueue(GitSync(str(repo)), ads, window_s=60)
+    handler = ActionHandler(str(repo), commit_queue=queue)
+
+    for i in range(5):
+        handler.execute("edit", {"file": f"src/f{i}.txt", "content": str(i)}, agent="CLAUDE", role="tester",
+                        spec_id="SPEC-001")
+    handler.execute("delete", {"file": "README"}, agent="CLAUDE", role="tester", spec_id="SPEC-001")
+
+    assert _git(repo, "rev-list", "--count", "HEAD") == "1"  # nothing committed inline
+    assert queue.status()["queue_depth"] == 6
+    assert queue.flush(timeout=30)
+
+    head = _git(repo, "rev-parse", "HEAD")
+    assert _git(repo, "rev-list", "--count", "HEAD") == "2"
+    assert _git(repo, "status", "--porcelain") == ""
+    assert _git(repo, "rev-parse", "@{u}") == head
+    assert _git(repo, "log", "-1", "--format=%s") == "[ADT] 6 changes: edit src/f0.txt, edit src/f1.txt, " \
+                                                     "edit src/f2.txt, ... - CLAUDE (tester)"
+
+    commit_events = [e for e in _events(ads.file_path) if e["action_type"] == "git_commit"]
+    assert [e["commit"] for e in commit_events] == [head]
+    assert commit_events[0]["spec_ref"] == "SPEC-001"
+    assert [e["action_type"] for e in _events(ads.file_path)] == ["git_commit", "git_push"]
+
+    status = queue.status()
+    assert status["queue_depth"] == 0 and status["commits"] == 1 and status["unpushed_commits"] == 0
+    queue.close(timeout=5)
+
+
+def test_groups_by_spec(repo):
+    queue = CommitQueue(GitSync(str(repo)), window_s=60, group_by="spec", push=False)
+    queue.submit("a.txt", "edit a.txt", "CLAUDE", "tester", "SPEC-001")
+    queue.submit("b.txt", "edit b.txt", "GEMINI", "tester", "SPEC-002")
+    queue.submit("c.txt", "edit c.txt", "CLAUDE", "tester", "SPEC-001")
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (repo / name).write_text(name)
+    assert queue.status()["pending_groups"] == 2
+    queue.close(timeout=30)
+
+    assert _git(repo, "log", "--format=%s", "-2").splitlines() == [
+        "[ADT] edit b.txt - GEMINI (tester)",
+        "[ADT] 2 changes: edit a.txt, edit c.txt - CLAUDE (tester)",
+    ]
+    assert queue.status()["unpushed_commits"] == 2
+    with pytest.raises(RuntimeError):
+        queue.submit("d.txt", "edit d.txt")
+
+
+def test_push_is_retried_then_reported(repo, tmp_path):
+    _git(repo, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    ads = ADSLogger(str(tmp_path / "events.jsonl"))
+    queue = CommitQueue(GitSync(str(repo)), ads, window_s=0, push_retries=2, retry_backoff_s=0)
+    (repo / "a.txt").write_text("a")
+    queue.submit("a.txt", "edit a.txt", "CLAUDE", "tester", "SPEC-001")
+    assert queue.flush(timeout=30)
+
+    status = queue.status()
+    assert status["commits"] == 1 and status["unpushed_commits"] == 1 and status["push_failures"] == 1
+    failed = [e for e in _events(ads.file_path) if e["action_type"] == "git_push_failed"]
+    assert failed[0]["attempts"] == 3
+    queue.close(timeout=5)
+
+
+def test_failed_commit_is_requeued_and_reported(repo, tmp_path):
+    ads = ADSLogger(str(tmp_path / "events.jsonl"))
+    queue = CommitQueue(GitSync(str(repo)), ads, window_s=0, push=False, retry_backoff_s=60)
+    lock = repo / ".git" / "index.lock"
+    lock.write_text("")  # another git process holds the index
+    (repo / "a.txt").write_text("a")
+    queue.submit("a.txt", "edit a.txt", "CLAUDE", "tester", "SPEC-001")
+    assert not queue.flush(timeout=30)
+
+    status = queue.status()
+    assert status["commits"] == 0 and status["commit_failures"] == 1 and status["queue_depth"] == 1
+    failed = [e for e in _events(ads.file_path) if e["action_type"] == "git_commit_failed"]
+    assert failed[0]["files"] == ["a.txt"] and failed[0]["attempts"] == 1
+
+    lock.unlink()
+    queue.close(timeout=30)  # closing retries the group without waiting out the backoff
+    assert _git(repo, "log", "-1", "--format=%s") == "[ADT] edit a.txt - CLAUDE (tester)"
+    assert queue.status()["queue_depth"] == 0
+
+
+def test_sync_status_endpoint(tmp_path):
+    (tmp_path / "config").mkdir()
+    specs = tmp_path / "config" / "specs.json"
+    specs.write_text(json.dumps({"specs": {}}))
+    juris = tmp_path / "config" / "jurisdictions.json"
+    juris.write_text(json.dumps({"jurisdictions": {}}))
+    config = DTTPConfig(ads_path=str(tmp_path / "events.jsonl"), specs_config=str(specs),
+                        jurisdictions_config=str(juris), project_root=str(tmp_path))
+
+    assert create_dttp_app(config).test_client().get("/sync/status").get_json() == {"enabled": False}
+
+    config.git_commit_queue = True
+    body = create_dttp_app(config).test_client().get("/sync/status").get_json()
+    assert body["enabled"] and body["queue_depth"] == 0 and body["group_by"] == "window"
+
+
+def test_async_git_sync_commits_and_pushes(repo):
+    sync = AsyncGitSync(str(repo))
+    assert not isinstance(sync, GitSync)
+    (repo / "a.txt").write_text("a")
+
+    async def run():
+        return await sync.commit(["a.txt"], "add a"), await sync.push()
+
+    commit, pushed = asyncio.run(run())
+    assert commit == _git(repo, "rev-parse", "HEAD")
+    assert pushed is True
+    assert _git(repo, "rev-parse", "@{u}") == commit
+
+    _git(repo, "remote", "set-url", "origin", str(repo.parent / "missing.git"))
+    assert asyncio.run(sync.push()) is False
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import pytest
+from adt_core.ads.integrity import ADSIntegrity
+from adt_core.dttp.asgi import create_dttp_asgi_app
+from adt_core.dttp.config import DTTPConfig
+from adt_core.dttp.gateway import AsyncDTTPGateway
+from adt_core.dttp.service import create_gateway
+
+
+@pytest.fixture
+def config(tmp_path):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "data").mkdir()
+    specs = tmp_path / "config" / "specs.json"
+    specs.write_text(json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit", "delete"], "paths": ["data/"]}}}))
+    juris = tmp_path / "config" / "jurisdictions.json"
+    juris.write_text(json.dumps({"jurisdictions": {"tester": ["data/"]}}))
+    return DTTPConfig(
+        ads_path=str(tmp_path / "_cortex" / "ads" / "events.jsonl"),
+        specs_config=str(specs), jurisdictions_config=str(juris),
+        project_root=str(tmp_path), project_name="test-project",
+    )
+
+
+def _payload(file="data/a.txt", **overrides):
+    payload = {"agent": "TEST", "role": "tester", "spec_id": "SPEC-001", "action": "edit",
+               "params": {"file": file, "content": "hello"}, "rationale": "check"}
+    payload.update(overrides)
+    return payload
+
+
+async def _call(app, method, path, body=None, headers=()):
+    """Drives the ASGI app directly; returns (status, decoded JSON or None)."""
+    raw = json.dumps(body).encode() if body is not None else b""
+    received = []
+
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+
+    async def send(message):
+        received.append(message)
+
+    path, _, query = path.partition("?")
+    await app({"type": "http", "method": method, "path": path, "query_string": query.encode(),
+               "headers": list(headers)}, receive, send)
+    return received[0]["status"], json.loads(received[1]["body"]) if received[1]["body"] else None
+
+
+def _events(config):
+    with open(config.ads_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_concurrent_dry_runs_share_one_chain(config):
+    app = create_dttp_asgi_app(config)
+
+    async def run():
+        return await asyncio.gather(*(
+            _call(app, "POST", "/request", _payload(f"data/f{i}.txt", agent=f"AGENT{i}", dry_run=True))
+            for i in range(300)))
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        app.gateway.logger.close()
+
+    assert [status for status, _ in results] == [200] * 300
+    revision = app.gateway.policy_engine.revision_tag
+    assert all(body == {"status": "allowed", "dry_run": True, "policy_revision": revision} for _, body in results)
+    assert len(_events(config)) == 300
+    assert ADSIntegrity.verify_chain(config.ads_path) == (True, [])
+
+
+def test_endpoints(config, tmp_path):
+    app = create_dttp_asgi_app(config)
+
+    async def run():
+        edit = await _call(app, "POST", "/request", _payload())
+        denied = await _call(app, "POST", "/request", _payload("other/x.txt"))
+        invalid = await _call(app, "POST", "/request", {"agent": "TEST"})
+        batch = await _call(app, "POST", "/request/batch", {
+            "agent": "TEST", "role": "tester", "spec_id": "SPEC-001", "rationale": "check", "dry_run": True,
+            "requests": [{"action": "edit", "params": {"file": "data/b.txt"}}]})
+        status = await _call(app, "GET", "/status")
+        missing = await _call(app, "GET", "/nope")
+        wrong_method = await _call(app, "GET", "/request")
+        revision = status[1]["policy_revision"]
+        policy = await _call(app, "GET", "/policy", headers=[(b"if-none-match", f'"{revision}"'.encode())])
+        delta = await _call(app, "GET", f"/policy/delta?since={revision}")
+        return edit, denied, invalid, batch, status, missing, wrong_method, policy, delta
+
+    try:
+        edit, denied, invalid, batch, status, missing, wrong_method, policy, delta = asyncio.run(run())
+    finally:
+        app.gateway.logger.close()
+
+    assert edit[0] == 200 and (tmp_path / "data" / "a.txt").read_text() == "hello"
+    assert denied[0] == 403 and denied[1]["status"] == "denied"
+    assert invalid[0] == 400
+    assert batch[0] == 200 and batch[1]["status"] == "allowed"
+    assert status[0] == 200 and status[1]["total_requests"] == 3 and status[1]["total_denials"] == 1
+    assert missing[0] == 404 and wrong_method[0] == 405
+    assert policy == (304, None)
+    assert delta[0] == 200 and delta[1]["full"] is False and delta[1]["specs"] == {}
+
+
+def test_async_gateway_matches_sync_gateway(config, tmp_path):
+    sequence = [
+        _payload("data/a.txt"),
+        _payload("data/a.txt", dry_run=True),
+        _payload("other/x.txt"),
+        _payload("data/a.txt", role="intruder"),
+        _payload("config/specs.json"),
+        _payload("data/a.txt", action="delete", params={"file": "data/a.txt"}),
+        _payload("data/../../escape.txt"),
+    ]
+
+    def run(gateway, call):
+        outcomes = [call(gateway, dict(p, params=dict(p["params"]))) for p in sequence]
+        gateway.logger.close()
+        return outcomes, [(e["action_type"], e.get("tier"), e["authorized"]) for e in _events(config)]
+
+    def sync_call(gateway, p):
+        return gateway.request(p["agent"], p["role"], p["spec_id"], p["action"], p["params"], p["rationale"],
+                               dry_run=p.get("dry_run", False))
+
+    sync_outcomes, sync_events = run(create_gateway(config), sync_call)
+    (tmp_path / "_cortex" / "ads" / "events.jsonl").unlink()
+
+    async_gateway = AsyncDTTPGateway(create_gateway(config))
+
+    def async_call(gateway, p):
+        return asyncio.run(gateway.request(p["agent"], p["role"], p["spec_id"], p["action"], p["params"],
+                                           p["rationale"], dry_run=p.get("dry_run", False)))
+
+    async_outcomes, async_events = run(async_gateway, async_call)
+
+    assert [o["status"] for o in async_outcomes] == [o["status"] for o in sync_outcomes]
+    assert async_events == sync_events
+    assert len(sync_events) > len(sequence)
+
+
+def test_log_async_appends_to_chain(config):
+    app = create_dttp_asgi_app(config)
+    logger = app.gateway.logger
+    event = {"event_id": "evt1", "ts": "2026-01-01T00:00:00Z", "agent": "TEST", "role": "tester",
+             "action_type": "note", "description": "d", "spec_ref": "SPEC-001", "authorized": True}
+
+    async def run():
+        event_id = await logger.log_async(dict(event))
+        with pytest.raises(ValueError):
+            await logger.log_async({"event_id": "bad"})
+        return event_id
+
+    try:
+        assert asyncio.run(run()) == "evt1"
+    finally:
+        logger.close()
+    assert [e["event_id"] for e in _events(config)] == ["evt1"]
@@ -0,0 +1,103 @@
+import json
+import os
+import random
+import threading
+from adt_core.sdd import validator as validator_module
+from adt_core.dttp.jurisdictions import JurisdictionManager
+from adt_core.dttp.paths import PathTrie
+from adt_core.dttp.policy import PolicyEngine
+from adt_core.sdd.validator import SpecValidator
+
+
+def _linear_covers(prefixes, path):
+    normalized = os.path.normpath(path)
+    for prefix in prefixes:
+        prefix_norm = os.path.normpath(prefix)
+        if normalized == prefix_norm or normalized.startswith(prefix_norm + os.sep):
+            return True
+    return False
+
+
+def test_trie_matches_on_component_boundaries():
+    trie = PathTrie(["data/", "adt_core/dttp/gateway.py", "./docs"])
+    assert trie.covers("data")
+    assert trie.covers("data/x/y.txt")
+    assert trie.covers("./data/../data/x")
+    assert not trie.covers("database/x")
+    assert trie.covers("adt_core/dttp/gateway.py")
+    assert not trie.covers("adt_core/dttp/gateway.pyc")
+    assert not trie.covers("adt_core/dttp")
+    assert trie.covers("docs/index.md")
+    assert not PathTrie([]).covers("data")
+
+
+def test_trie_agrees_with_linear_scan():
+    rng = random.Random(7)
+    parts = ["a", "b", "ab", "..", ".", "c.py", ""]
+    def random_path():
+        return "/".join(rng.choice(parts) for _ in range(rng.randint(1, 4)))
+    for _ in range(200):
+        prefixes = [random_path() for _ in range(rng.randint(0, 5))]
+        trie = PathTrie(prefixes)
+        for _ in range(20):
+            path = random_path()
+            assert trie.covers(path) == _linear_covers(prefixes, path), (prefixes, path)
+
+
+def test_verdicts_cached_until_config_changes(tmp_path):
+    spec_path = tmp_path / "specs.json"
+    spec_path.write_text(json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit"], "paths": ["data/"]}}}))
+    juris_path = tmp_path / "juris.json"
+    juris_path.write_text(json.dumps({"jurisdictions": {"tester": {"paths": ["data/", "docs/"]}}}))
+    engine = PolicyEngine(SpecValidator(str(spec_path)), JurisdictionManager(str(juris_path)))
+
+    assert engine.validate_request("tester", "SPEC-001", "edit", "docs/a.md")[0] is False
+    assert engine.validate_request("tester", "SPEC-001", "edit", "data/a.txt") == (True, "Authorized")
+    revision = engine.revision
+    assert len(engine._verdicts) == 2
+
+    spec_path.write_text(json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit"], "paths": ["docs/"]}}}))
+    assert engine.validate_request("tester", "SPEC-001", "edit", "docs/a.md") == (True, "Authorized")
+    assert engine.validate_request("tester", "SPEC-001", "edit", "data/a.txt")[0] is False
+    assert engine.revision != revision
+
+
+def test_verdict_cache_is_bounded(tmp_path):
+    engine = PolicyEngine(SpecValidator(str(tmp_path / "none.json")),
+                          JurisdictionManager(str(tmp_path / "none.json")), cache_size=3)
+    for i in range(10):
+        assert engine.validate_request("r", "SPEC-001", "edit", f"f{i}")[0] is False
+    assert list(engine._verdicts) == [("r", "SPEC-001", "edit", f"f{i}") for i in (7, 8, 9)]
+
+
+def test_reload_in_progress_never_exposes_empty_config(tmp_path, monkeypatch):
+    spec_path = tmp_path / "specs.json"
+    specs = json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit"], "paths": ["data/"]}}})
+    spec_path.write_text(specs)
+    juris_path = tmp_path / "juris.json"
+    juris_path.write_text(json.dumps({"jurisdictions": {"tester": ["data/"]}}))
+    engine = PolicyEngine(SpecValidator(str(spec_path)), JurisdictionManager(str(juris_path)))
+    assert engine.validate_request("tester", "SPEC-001", "edit", "data/a.txt") == (True, "Authorized")
+
+    loading, release = threading.Event(), threading.Event()
+    real_load = json.load
+    def slow_load(f):
+        if not loading.is_set():
+            loading.set()
+            release.wait(5)
+        return real_load(f)
+    monkeypatch.setattr(validator_module.json, "load", slow_load)
+
+    spec_path.write_text(specs)  # same content, new version
+    slow = threading.Thread(target=engine.validate_request, args=("tester", "SPEC-001", "edit", "data/b.txt"))
+    slow.start()
+    assert loading.wait(5)
+    try:
+        assert engine.validate_request("tester", "SPEC-001", "edit", "data/a.txt") == (True, "Authorized")
+    finally:
+        release.set()
+        slow.join(5)
+    assert engine.validate_request("tester", "SPEC-001", "edit", "data/a.txt") == (True, "Authorized")
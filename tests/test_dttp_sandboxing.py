@@ -389,5 +389,5 @@ class TestGeminiPreToolHook:
         mod, _ = _load_gemini_hook()
         # Verify the source code contains GEMINI as default
         import inspect
-        source = inspect.getsource(mod.main)
+        source = inspect.getsource(mod.decide)
         assert '"GEMINI"' in source
@@ -0,0 +1,139 @@
+import json
+import threading
+import pytest
+import requests
+from adt_core.dttp.config import DTTPConfig
+from adt_core.dttp.server import InFlightTracker, PooledWSGIServer
+from adt_core.dttp.service import create_dttp_app
+
+
+@pytest.fixture
+def dttp_app(tmp_path):
+    (tmp_path / "config").mkdir()
+    specs = tmp_path / "config" / "specs.json"
+    specs.write_text(json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit"], "paths": ["data/"]}}}))
+    juris = tmp_path / "config" / "jurisdictions.json"
+    juris.write_text(json.dumps({"jurisdictions": {"tester": ["data/"]}}))
+    config = DTTPConfig(
+        ads_path=str(tmp_path / "_cortex" / "ads" / "events.jsonl"),
+        specs_config=str(specs), jurisdictions_config=str(juris),
+        project_root=str(tmp_path), project_name="test-project",
+        ads_group_commit=True, server="threaded", server_threads=4,
+    )
+    app = create_dttp_app(config)
+    yield app
+    app.dttp_shutdown(timeout=0)
+
+
+def test_pooled_server_handles_concurrent_agents(dttp_app):
+    httpd = PooledWSGIServer("127.0.0.1", 0, dttp_app, threads=4)
+    url = f"http://127.0.0.1:{httpd.socket.getsockname()[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        statuses = []
+
+        def agent(i):
+            payload = {"agent": f"AGENT{i}", "role": "tester", "spec_id": "SPEC-001", "action": "edit",
+                       "params": {"file": f"data/f{i}.txt" if i % 5 else "other/x.txt"},
+                       "rationale": "check", "dry_run": True}
+            statuses.append(requests.post(f"{url}/request", json=payload, timeout=10).status_code)
+
+        agents = [threading.Thread(target=agent, args=(i,)) for i in range(20)]
+        for t in agents: t.start()
+        for t in agents: t.join()
+        assert sorted(statuses) == [200] * 16 + [403] * 4
+
+        status = requests.get(f"{url}/status", timeout=10).json()
+        assert (status["total_requests"], status["total_denials"]) == (20, 4)
+        assert status["server"] == "threaded"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        dttp_app.dttp_shutdown()
+    assert dttp_app.dttp_in_flight.count == 0
+    with open(dttp_app.config["DTTP"].ads_path) as f:
+        assert len([line for line in f if line.strip()]) == 20
+
+
+def test_malformed_tuning_key_keeps_the_others(tmp_path, caplog):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "dttp.json").write_text(json.dumps({
+        "port": 5102, "ads_max_batch_size": "lots", "server": "threaded", "server_threads": 8}))
+    config = DTTPConfig.from_project_root(str(tmp_path))
+    assert config.port == 5102
+    assert config.ads_max_batch_size == DTTPConfig.ads_max_batch_size
+    assert (config.server, config.server_threads) == ("threaded", 8)
+    assert "ads_max_batch_size" in caplog.text
+
+
+def test_in_flight_tracker_waits_for_responses():
+    release = threading.Event()
+
+    def slow_app(environ, start_response):
+        start_response("200 OK", [])
+        release.wait(5)
+        yield b"done"
+
+    tracker = InFlightTracker(slow_app)
+    body = tracker({}, lambda *args: None)
+    reader = threading.Thread(target=lambda: (list(body), body.close()))
+    reader.start()
+    assert tracker.count == 1
+    assert tracker.wait_idle(0.05) is False
+    release.set()
+    assert tracker.wait_idle(5) is True
+    reader.join()
+
+
+def test_client_revalidates_cached_policy(dttp_app, monkeypatch, tmp_path):
+    from adt_sdk.client import ADTClient
+
+    httpd = PooledWSGIServer("127.0.0.1", 0, dttp_app, threads=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    statuses = []
+    get = requests.get
+    monkeypatch.setattr(requests, "get", lambda *a, **kw: statuses.append(get(*a, **kw)) or statuses[-1])
+    try:
+        client = ADTClient(dttp_url=f"http://127.0.0.1:{httpd.socket.getsockname()[1]}")
+        first = client.get_policy()
+        assert client.get_policy() == first
+        (tmp_path / "config" / "jurisdictions.json").write_text(
+            json.dumps({"jurisdictions": {"tester": ["data/"], "writer": ["docs/"]}}))
+        second = client.get_policy()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert [r.status_code for r in statuses] == [200, 304, 200]
+    assert statuses[2].url.split("?")[0].endswith("/policy/delta")
+    assert statuses[2].json()["jurisdictions"] == {"writer": ["docs/"]}
+    assert second["specs"] == first["specs"]
+    assert second["jurisdictions"] == {"tester": ["data/"], "writer": ["docs/"]}
+    assert second["policy_revision"] != first["policy_revision"]
+
+
+def test_client_validates_writes_locally(dttp_app):
+    from adt_sdk.client import ADTClient
+
+    httpd = PooledWSGIServer("127.0.0.1", 0, dttp_app, threads=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = ADTClient(dttp_url=f"http://127.0.0.1:{httpd.socket.getsockname()[1]}", role="tester")
+        plan = client.validate_writes_local([
+            {"spec_id": "SPEC-001", "action": "edit", "params": {"file": f"data/f{i}.txt"}} for i in range(300)
+        ] + [{"spec_id": "SPEC-001", "action": "edit", "params": {"file": "other/x.txt"}}])
+        single = client.validate_write_local("SPEC-001", "delete", {"file": "data/a.txt"})
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert plan["status"] == "ok" and plan["advisory"] is True
+    assert (plan["allowed"], plan["denied"]) == (300, 1)
+    assert plan["results"][-1]["reason"] == "Path other/x.txt is outside the jurisdiction of role tester"
+    assert single["status"] == "denied" and single["advisory"] is True
+    with open(dttp_app.config["DTTP"].ads_path) as f:
+        assert f.read().strip() == ""  # nothing went through /request
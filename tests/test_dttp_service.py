@@ -189,6 +189,50 @@ class TestDTTPPolicy:
         assert "SPEC-001" in data["specs"]
         assert "tester" in data["jurisdictions"]
 
+    def test_policy_etag_and_not_modified(self, client):
+        resp = client.get("/policy")
+        revision = resp.get_json()["policy_revision"]
+        assert resp.headers["ETag"] == f'"{revision}"'
+        assert client.get("/status").get_json()["policy_revision"] == revision
+
+        resp = client.get("/policy", headers={"If-None-Match": f'"{revision}"'})
+        assert resp.status_code == 304
+        assert resp.data == b""
+        assert client.get("/policy", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    def test_policy_delta(self, client, dttp_app):
+        first = client.get("/policy").get_json()
+        config = dttp_app.config["DTTP"]
+        with open(config.specs_config) as f:
+            specs = json.load(f)
+        specs["specs"]["SPEC-002"] = {"status": "approved", "roles": ["tester"],
+                                      "action_types": ["edit"], "paths": ["docs/"]}
+        with open(config.specs_config, "w") as f:
+            json.dump(specs, f)
+        with open(config.jurisdictions_config, "w") as f:
+            json.dump({"jurisdictions": {"writer": ["docs/"]}}, f)
+
+        resp = client.get(f"/policy/delta?since={first['policy_revision']}")
+        delta = resp.get_json()
+        assert resp.status_code == 200
+        assert delta["policy_revision"] != first["policy_revision"]
+        assert resp.headers["ETag"] == f'"{delta["policy_revision"]}"'
+        assert delta["full"] is False
+        assert list(delta["specs"]) == ["SPEC-002"]
+        assert delta["removed_specs"] == []
+        assert delta["jurisdictions"] == {"writer": ["docs/"]}
+        assert delta["removed_roles"] == ["tester"]
+        # The policy's content hash, not its file metadata, defines the revision.
+        assert delta["policy_revision"] == client.get("/policy").get_json()["policy_revision"]
+
+        current = delta["policy_revision"]
+        unchanged = client.get(f"/policy/delta?since={current}", headers={"If-None-Match": f'"{current}"'})
+        assert unchanged.status_code == 304
+
+        unknown = client.get("/policy/delta?since=0123456789abcdef").get_json()
+        assert unknown["full"] is True and set(unknown["specs"]) == {"SPEC-001", "SPEC-002"}
+        assert client.get("/policy/delta").status_code == 400
+
 
 # === Security: Path Traversal ===
 
@@ -226,3 +270,102 @@ class TestJurisdictionBoundary:
             params={"file": "data2/sneaky.txt", "content": "nope"}
         ))
         assert resp.status_code == 403
+
+
+# === POST /request/batch ===
+
+def _batch(*files, **overrides):
+    payload = {
+        "agent": "TEST",
+        "role": "tester",
+        "spec_id": "SPEC-001",
+        "rationale": "Batch refactor",
+        "requests": [{"action": "edit", "params": {"file": f, "content": "x"}} for f in files],
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _ads_events(dttp_app):
+    with open(dttp_app.config["DTTP"].ads_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestDTTPRequestBatch:
+    def test_best_effort_reports_denials_per_item(self, client, dttp_app):
+        resp = client.post("/request/batch", json=_batch("data/a.txt", "other/b.txt", "data/c.txt"))
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["status"] == "partial"
+        assert [r["status"] for r in data["results"]] == ["allowed", "denied", "allowed"]
+        assert "jurisdiction" in data["results"][1]["reason"]
+
+        root = dttp_app.config["DTTP"].project_root
+        assert os.path.exists(os.path.join(root, "data", "a.txt"))
+        assert os.path.exists(os.path.join(root, "data", "c.txt"))
+        action_types = [e["action_type"] for e in _ads_events(dttp_app)]
+        assert action_types == ["pending_edit", "denied_edit", "pending_edit", "completed_edit", "completed_edit"]
+
+        status = client.get("/status").get_json()
+        assert (status["total_requests"], status["total_denials"]) == (3, 1)
+
+    def test_all_or_nothing_runs_nothing_on_denial(self, client, dttp_app):
+        resp = client.post("/request/batch", json=_batch("data/a.txt", "other/b.txt", mode="all_or_nothing"))
+        data = resp.get_json()
+        assert data["status"] == "denied"
+        assert [r["status"] for r in data["results"]] == ["skipped", "denied"]
+        assert not os.path.exists(os.path.join(dttp_app.config["DTTP"].project_root, "data", "a.txt"))
+        assert [e["action_type"] for e in _ads_events(dttp_app)] == ["denied_edit"]
+
+    def test_all_or_nothing_rolls_back_on_failed_change(self, client, dttp_app):
+        root = dttp_app.config["DTTP"].project_root
+        os.makedirs(os.path.join(root, "data"), exist_ok=True)
+        with open(os.path.join(root, "data", "a.txt"), "w") as f:
+            f.write("original")
+        payload = _batch("data/a.txt", "data/new.txt", mode="all_or_nothing")
+        payload["requests"].append({"action": "delete", "params": {"file": "data/missing.txt"}})
+        payload["requests"].append({"action": "edit", "params": {"file": "data/c.txt", "content": "x"}})
+
+        data = client.post("/request/batch", json=payload).get_json()
+        assert data["status"] == "failed"
+        assert [r["status"] for r in data["results"]] == ["failed", "failed", "failed", "skipped"]
+        assert [r["result"]["status"] for r in data["results"][:3]] == ["rolled_back", "rolled_back", "error"]
+        with open(os.path.join(root, "data", "a.txt")) as f:
+            assert f.read() == "original"
+        assert not os.path.exists(os.path.join(root, "data", "new.txt"))
+        assert not os.path.exists(os.path.join(root, "data", "c.txt"))
+        assert [e["action_type"] for e in _ads_events(dttp_app)] == [
+            "pending_edit", "pending_edit", "pending_delete", "pending_edit",
+            "completed_edit", "completed_edit", "completed_delete"]
+
+    def test_all_or_nothing_accepts_only_file_changes(self, client, dttp_app):
+        specs_config = dttp_app.config["DTTP"].specs_config
+        with open(specs_config) as f:
+            specs = json.load(f)
+        specs["specs"]["SPEC-001"]["action_types"].append("deploy")
+        with open(specs_config, "w") as f:
+            json.dump(specs, f)
+        payload = _batch("data/a.txt", mode="all_or_nothing")
+        payload["requests"].append({"action": "deploy", "params": {"file": "data/", "target": "prod"}})
+
+        data = client.post("/request/batch", json=payload).get_json()
+        assert data["status"] == "denied"
+        assert data["results"] == [{"status": "skipped", "reason": "batch_denied"},
+                                   {"status": "skipped", "reason": "not_revertible"}]
+        assert not os.path.exists(os.path.join(dttp_app.config["DTTP"].project_root, "data", "a.txt"))
+
+    def test_dry_run_logs_one_group(self, client, dttp_app):
+        resp = client.post("/request/batch", json=_batch("data/a.txt", "data/b.txt", dry_run=True))
+        data = resp.get_json()
+        assert data["status"] == "allowed"
+        assert all(r == {"status": "allowed", "dry_run": True} for r in data["results"])
+        events = _ads_events(dttp_app)
+        assert [e["action_type"] for e in events] == ["dry_run_validated_edit"] * 2
+        assert events[1]["prev_hash"] == events[0]["hash"]
+
+    def test_invalid_batches(self, client):
+        assert client.post("/request/batch", json={"requests": []}).status_code == 400
+        assert client.post("/request/batch", json=_batch("data/a.txt", mode="sometimes")).status_code == 400
+        resp = client.post("/request/batch", json=_batch("data/a.txt", rationale=""))
+        assert resp.status_code == 400
+        assert resp.get_json()["index"] == 0
@@ -0,0 +1,81 @@
+import subprocess
+import pytest
+from adt_core.gitstate import GitState
+from adt_core.watch import FileWatcher
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dttp@example.com")
+    _git(tmp_path, "config", "user.name", "DTTP")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.txt").write_text("a")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+@pytest.fixture(params=["poll", "inotify"])
+def state(request, repo):
+    try:
+        watcher = FileWatcher(backend=request.param, poll_interval=0)
+        git = GitState(str(repo), watcher=watcher, tree_backend=request.param)
+    except OSError:
+        pytest.skip("inotify unavailable")
+    yield git
+    git.close()
+    watcher.close()
+
+
+def test_head_and_branch_match_git(repo, state):
+    assert state.head() == _git(repo, "rev-parse", "HEAD")
+    assert state.branch() == "main"
+
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "second")
+    assert state.head() == _git(repo, "rev-parse", "HEAD")
+
+    _git(repo, "pack-refs", "--all")  # loose ref gone, now only in packed-refs
+    assert state.head() == _git(repo, "rev-parse", "HEAD")
+
+    _git(repo, "checkout", "-q", "-b", "feature/x")
+    assert state.branch() == "feature/x"
+
+    _git(repo, "checkout", "-q", "--detach")
+    assert state.branch() == "HEAD"
+    assert state.head() == _git(repo, "rev-parse", "HEAD")
+
+
+def test_status_follows_working_tree_and_index(repo, state, monkeypatch):
+    runs = []
+    run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: runs.append(a) or run(*a, **kw))
+    assert state.status() == []
+    assert state.status() == []
+    # With inotify nothing changed, so git ran once; polling re-runs it.
+    assert len(runs) == (1 if state._tree.backend == "inotify" else 2)
+
+    (repo / "src" / "a.txt").write_text("changed")
+    assert state.status() == [" M src/a.txt"]
+
+    (repo / "src" / "new" / "deep").mkdir(parents=True)
+    (repo / "src" / "new" / "deep" / "b.txt").write_text("b")
+    assert state.status() == [" M src/a.txt", "?? src/new/"]
+
+    _git(repo, "add", "-A")
+    assert state.status() == ["M  src/a.txt", "A  src/new/deep/b.txt"]
+
+    _git(repo, "commit", "-q", "-m", "more")
+    assert state.status() == []
+
+    (repo / "src" / "new" / "deep" / "b.txt").write_text("again")
+    assert state.status() == [" M src/new/deep/b.txt"]
+
+
+def test_not_a_repository(tmp_path):
+    with pytest.raises(ValueError):
+        GitState(str(tmp_path))
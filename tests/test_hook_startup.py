@@ -0,0 +1,62 @@
+"""Start-up profile of the pre-tool hooks (python -X importtime).
+
+The hooks run in a fresh interpreter on every agent tool call, so their
+imports are on the critical path. Local decisions (non-intercepted tools,
+sandbox read and Bash checks) must need the standard library only. Import
+times themselves are measured by benchmarks/bench_hook_import.py.
+"""
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+HOOKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "adt_sdk", "hooks")
+
+HOOKS = {
+    "claude_pretool": ("CLAUDE_PROJECT_DIR", "Read", "Bash"),
+    "gemini_pretool": ("GEMINI_PROJECT_DIR", "read_file", "run_shell_command"),
+}
+
+
+def _importtime(args, stdin="", env=None):
+    """Runs python -X importtime; returns ({module: cumulative us}, stdout)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=HOOKS_DIR, input=stdin,
+                          capture_output=True, text=True, env=env, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules, proc.stdout
+
+
+def _third_party(modules):
+    stdlib = set(sys.stdlib_module_names) | set(HOOKS)
+    return sorted({name.split(".")[0] for name in modules} - stdlib)
+
+
+@pytest.mark.parametrize("hook", HOOKS)
+def test_hook_module_imports_stdlib_only(hook):
+    modules, _ = _importtime(["-S", "-c", f"import {hook}"])
+    assert _third_party(modules) == []
+
+
+@pytest.mark.parametrize("hook", HOOKS)
+def test_local_decisions_do_not_load_network_libraries(hook, tmp_path):
+    project_var, read_tool, bash_tool = HOOKS[hook]
+    env = {**os.environ, project_var: str(tmp_path), "ADT_SANDBOX": "1", "DTTP_URL": "http://127.0.0.1:9"}
+    (tmp_path / "a.txt").write_text("a")
+    cases = [
+        ({"tool_name": read_tool, "tool_input": {"file_path": str(tmp_path / "a.txt")}}, "allow"),
+        ({"tool_name": bash_tool, "tool_input": {"command": "ls"}}, "allow"),
+        ({"tool_name": bash_tool, "tool_input": {"command": "cat /etc/shadow"}}, "deny"),
+    ]
+    for hook_input, expected in cases:
+        modules, stdout = _importtime([f"{hook}.py"], stdin=json.dumps(hook_input), env=env)
+        assert expected in stdout, stdout
+        assert "requests" not in modules
+        assert "urllib3" not in modules
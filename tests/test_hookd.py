@@ -0,0 +1,155 @@
+"""Tests for the resident pre-tool hook daemon (hookd.py) and its shim."""
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import pytest
+
+HOOKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "adt_sdk", "hooks")
+
+
+def _load(module_name):
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(HOOKS_DIR, f"{module_name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+hookd = _load("hookd")
+shim = hookd.shim
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    # Unix socket paths are limited to ~100 bytes, too short for some tmp_path values.
+    runtime_dir = tempfile.mkdtemp(prefix="adt-run-")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", runtime_dir)
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    monkeypatch.setenv("DTTP_URL", "http://127.0.0.1:9")  # nothing listens: DTTP unreachable
+    monkeypatch.delenv("ADT_SANDBOX", raising=False)
+    (tmp_path / "config").mkdir()
+    yield tmp_path
+    shutil.rmtree(runtime_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(project):
+    server = hookd.HookDaemon(str(project), audit_interval=3600)  # tests flush explicitly
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+CASES = [
+    ({}, {"tool_name": "Read", "tool_input": {"file_path": "README.md"}}),
+    ({"ADT_SANDBOX": "1"}, {"tool_name": "Bash", "tool_input": {"command": "sudo ls"}}),
+    ({"ADT_SANDBOX": "1"}, {"tool_name": "Bash", "tool_input": {"command": "ls"}}),
+    ({}, {"tool_name": "Write", "tool_input": {"file_path": "data/x.txt", "content": "x"}}),
+]
+
+
+@pytest.mark.parametrize("env,hook_input", CASES)
+def test_daemon_matches_in_process_hook(daemon, project, monkeypatch, env, hook_input):
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    hook = _load("claude_pretool")
+    assert shim.ask_daemon("claude", hook_input) == hook.decide(hook_input)
+
+
+def test_daemon_socket_is_private(daemon):
+    assert shim.is_private_dir(os.path.dirname(daemon.path))
+    with pytest.raises(RuntimeError):
+        hookd.HookDaemon(daemon.project_dir)  # already served
+
+
+def test_shim_reports_absent_daemon(project):
+    with pytest.raises(shim.DaemonAbsent):
+        shim.ask_daemon("claude", {"tool_name": "Write", "tool_input": {}})
+
+    # A socket left behind by a crashed daemon is replaced on start.
+    server = hookd.HookDaemon(str(project))
+    server.socket.close()
+    with pytest.raises(shim.DaemonAbsent):
+        shim.ask_daemon("claude", {"tool_name": "Write", "tool_input": {}})
+    hookd.HookDaemon(str(project)).server_close()
+
+
+def test_cached_config_follows_dttp_json(project):
+    config = hookd.CachedProjectConfig(_load("claude_pretool"))
+    dttp_json = project / "config" / "dttp.json"
+    dttp_json.write_text(json.dumps({"port": 5101}))
+    assert config.dttp_url(str(project)) == "http://localhost:5101"
+    dttp_json.write_text(json.dumps({"port": 51020}))
+    assert config.dttp_url(str(project)) == "http://localhost:51020"
+
+
+def test_shim_runs_hook_in_process_without_daemon(project):
+    hook_input = {"tool_name": "Bash", "tool_input": {"command": "sudo ls"}}
+    proc = subprocess.run([sys.executable, "-S", os.path.join(HOOKS_DIR, "pretool_shim.py"), "claude"],
+                          input=json.dumps(hook_input), capture_output=True, text=True,
+                          env={**os.environ, "ADT_SANDBOX": "1"}, timeout=30)
+    assert proc.returncode == 0
+    decision = json.loads(proc.stdout)
+    assert decision["hookSpecificOutput"]["permissionDecision"] == "deny"
+    assert "sudo" in decision["hookSpecificOutput"]["permissionDecisionReason"]
+
+
+def test_daemon_reuses_allowed_dry_runs_until_policy_changes(daemon, project, monkeypatch):
+    from adt_core.dttp.config import DTTPConfig
+    from adt_core.dttp.server import PooledWSGIServer
+    from adt_core.dttp.service import create_dttp_app
+
+    specs = project / "config" / "specs.json"
+    specs.write_text(json.dumps({"specs": {"SPEC-001": {
+        "status": "approved", "roles": ["tester"], "action_types": ["edit"], "paths": ["data/"]}}}))
+    (project / "config" / "jurisdictions.json").write_text(json.dumps({"jurisdictions": {"tester": ["data/"]}}))
+    ads_path = project / "_cortex" / "ads" / "events.jsonl"
+    app = create_dttp_app(DTTPConfig(
+        ads_path=str(ads_path), specs_config=str(specs),
+        jurisdictions_config=str(project / "config" / "jurisdictions.json"),
+        project_root=str(project), project_name="test-project"))
+    httpd = PooledWSGIServer("127.0.0.1", 0, app, threads=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("DTTP_URL", f"http://127.0.0.1:{httpd.socket.getsockname()[1]}")
+    monkeypatch.setenv("ADT_ROLE", "tester")
+    monkeypatch.setenv("ADT_SPEC_ID", "SPEC-001")
+
+    def write(path):
+        hook_input = {"tool_name": "Write", "tool_input": {"file_path": str(project / path), "content": "x"}}
+        return shim.ask_daemon("claude", hook_input)["hookSpecificOutput"]["permissionDecision"]
+
+    def dry_run_events():
+        return [line for line in ads_path.read_text().splitlines() if "dry_run" in line]
+
+    try:
+        assert [write("data/a.txt") for _ in range(3)] == ["allow"] * 3
+        assert len(dry_run_events()) == 1  # two cache hits
+        daemon.flush_audit()
+        assert len(dry_run_events()) == 3  # the hits, replayed as one batch
+        assert write("data/b.txt") == "allow"  # miss: reports the hits
+        cache = app.test_client().get("/status").get_json()["hook_cache"]
+        assert cache == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+
+        # Another agent does not reuse the verdict.
+        monkeypatch.setenv("ADT_AGENT", "OTHER")
+        assert write("data/a.txt") == "allow"
+        assert daemon.verdicts.hits == 2
+        monkeypatch.delenv("ADT_AGENT")
+
+        # The next response carries the new revision and drops the cached verdicts.
+        specs.write_text(specs.read_text().replace('"data/"', '"other/"'))
+        assert write("data/c.txt") == "deny"
+        assert write("data/a.txt") == "deny"
+        assert daemon.verdicts.hits == 2
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        app.dttp_shutdown(timeout=0)
@@ -0,0 +1,85 @@
+"""Parity of the advisory client-side evaluator with DTTPGateway + PolicyEngine."""
+import json
+import random
+import pytest
+
+from adt_core.dttp.config import DTTPConfig
+from adt_core.dttp.gateway import CONSTITUTIONAL_PATHS, SOVEREIGN_PATHS
+from adt_core.dttp.service import create_dttp_app
+from adt_sdk.local_policy import LocalPolicy
+
+ROLES = ["tester", "Backend_Engineer", "DevOps_Engineer", "nobody"]
+SPECS = ["SPEC-001", "SPEC-002", "SPEC-003", "SPEC-004", "SPEC-404"]
+ACTIONS = ["edit", "write", "create", "patch", "replace", "delete", "git_tag", "git_push", "git_commit"]
+PATHS = [
+    "data/a.txt", "data/sub/b.txt", "database/x", "docs/", "docs/guide.md", "adt_core/dttp/x.py",
+    "./data/../docs/c.md", "../outside.txt", "/etc/passwd", "data/../../x", "", None,
+    *SOVEREIGN_PATHS, *CONSTITUTIONAL_PATHS,
+]
+
+
+def _write_policy(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "specs.json").write_text(json.dumps({"specs": {
+        "SPEC-001": {"status": "approved", "roles": ["tester", "Backend_Engineer"],
+                     "action_types": ["edit", "patch", "delete"], "paths": ["data/", "docs/guide.md"]},
+        "SPEC-002": {"status": "active", "roles": ["DevOps_Engineer"],
+                     "action_types": ["edit", "git_tag", "git_push", "git_commit"],
+                     "paths": ["adt_core/dttp/gateway.py", "config/", "_cortex/"]},
+        "SPEC-003": {"status": "draft", "roles": ["tester"], "action_types": ["edit"], "paths": ["data/"]},
+        "SPEC-004": {"status": "approved", "roles": ["Backend_Engineer"],
+                     "action_types": ["edit", "patch"], "paths": ["adt_core/", "database"]},
+    }}))
+    (config_dir / "jurisdictions.json").write_text(json.dumps({"jurisdictions": {
+        "tester": ["data/"],
+        "Backend_Engineer": {"paths": ["adt_core/", "data/", "database"], "action_types": ["edit"]},
+        "DevOps_Engineer": ["adt_core/", "config/", "_cortex/", "docs/"],
+    }}))
+    return config_dir
+
+
+def _requests(seed, n):
+    rng = random.Random(seed)
+    for _ in range(n):
+        params = {}
+        path = rng.choice(PATHS)
+        if path is not None:
+            params[rng.choice(["file", "file", "path"])] = path
+        if rng.random() < 0.3:
+            params["tier2_justification"] = "release"
+        if rng.random() < 0.3:
+            params["branch"] = rng.choice(["main", "feature"])
+        yield rng.choice(ROLES), rng.choice(SPECS), rng.choice(ACTIONS), params
+
+
+@pytest.mark.parametrize("is_framework", [False, True])
+def test_local_verdicts_match_gateway(tmp_path, is_framework):
+    config_dir = _write_policy(tmp_path)
+    app = create_dttp_app(DTTPConfig(
+        ads_path=str(tmp_path / "_cortex" / "ads" / "events.jsonl"),
+        specs_config=str(config_dir / "specs.json"), jurisdictions_config=str(config_dir / "jurisdictions.json"),
+        project_root=str(tmp_path), project_name="test-project", is_framework_project=is_framework))
+    gateway = app.dttp_gateway
+    local = LocalPolicy(app.test_client().get("/policy").get_json())
+
+    outcomes = set()
+    for role, spec_id, action, params in _requests(seed=int(is_framework), n=2000):
+        auth = gateway._authorize("AGENT", role, spec_id, action, params, "parity")
+        expected = auth.denial or {"status": "allowed"}
+        verdict = local.evaluate(role, spec_id, action, params)
+        assert verdict["advisory"] is True
+        assert {k: verdict[k] for k in expected} == expected, (role, spec_id, action, params)
+        assert verdict["tier"] == auth.tier
+        outcomes.add(expected.get("reason", "allowed").split(" ")[0])
+
+    # The generated set reaches every branch that applies to this kind of project.
+    expected_outcomes = {"allowed", "path_outside_project_root", "Spec", "Path"}
+    expected_outcomes |= ({"sovereign_path_violation", "tier2_authorization_required"} if is_framework
+                          else {"governance_file_protected"})
+    assert expected_outcomes <= outcomes
+
+
+def test_local_policy_requires_rules():
+    with pytest.raises(ValueError):
+        LocalPolicy({"specs": {}, "jurisdictions": {}, "policy_revision": "x"})
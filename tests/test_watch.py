@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import pytest
+from adt_core.watch import FileWatcher
+from adt_core.sdd.registry import SpecRegistry
+from adt_core.sdd.tasks import TaskManager
+
+BACKENDS = ["poll"] + (["inotify"] if sys.platform.startswith("linux") else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def watcher(request):
+    w = FileWatcher(backend=request.param, poll_interval=0)
+    yield w
+    w.close()
+
+
+def _write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def test_write_and_atomic_replace_change_version(watcher, tmp_path):
+    path = str(tmp_path / "specs.json")
+    _write(path, "{}")
+    v1 = watcher.version(path)
+    assert watcher.version(path) == v1
+
+    _write(path, '{"a": 1}')
+    v2 = watcher.version(path)
+    assert v2 != v1
+
+    tmp = path + ".tmp"
+    _write(tmp, '{"b": 2}')
+    os.replace(tmp, path)
+    assert watcher.version(path) != v2
+
+
+def test_unrelated_files_do_not_change_version(watcher, tmp_path):
+    path = str(tmp_path / "tasks.json")
+    _write(path, "{}")
+    v1 = watcher.version(path)
+    _write(str(tmp_path / "other.json"), "{}")
+    assert watcher.version(path) == v1
+
+
+def test_directory_tracks_entries(watcher, tmp_path):
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    v1 = watcher.version(str(specs))
+    _write(str(specs / "SPEC-001.md"), "# SPEC-001: One\n")
+    v2 = watcher.version(str(specs))
+    assert v2 != v1
+    _write(str(specs / "SPEC-001.md"), "# SPEC-001: Renamed\n")
+    assert watcher.version(str(specs)) != v2
+
+
+def test_missing_file_and_parent(watcher, tmp_path):
+    path = str(tmp_path / "later" / "requests.md")
+    v1 = watcher.version(path)
+    os.makedirs(os.path.dirname(path))
+    _write(path, "## REQ-001: First\n")
+    assert watcher.version(path) != v1
+
+
+def test_invalidate_and_load(watcher, tmp_path):
+    path = str(tmp_path / "caps.jsonl")
+    _write(path, "{}\n")
+    cache, calls = {}, []
+
+    def loader(p):
+        calls.append(p)
+        return len(calls)
+
+    assert watcher.load(path, loader, cache) == 1
+    assert watcher.load(path, loader, cache) == 1
+    watcher.invalidate(path)
+    assert watcher.load(path, loader, cache) == 2
+
+
+def test_registry_and_tasks_reload_on_change(tmp_path):
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    _write(str(specs / "SPEC-001_one.md"), "# SPEC-001: One\n\n**Status:** APPROVED\n")
+    registry = SpecRegistry(str(specs))
+    assert [s["id"] for s in registry.list_specs()] == ["SPEC-001"]
+    _write(str(specs / "SPEC-002_two.md"), "# SPEC-002: Two\n\n**Status:** DRAFT\n")
+    assert [s["id"] for s in registry.list_specs()] == ["SPEC-001", "SPEC-002"]
+
+    tasks_path = str(tmp_path / "tasks.json")
+    _write(tasks_path, json.dumps({"project": "p", "tasks": [{"id": "task-001", "status": "pending"}]}))
+    manager = TaskManager(tasks_path)
+    tasks = manager.list_tasks()
+    tasks[0]["status"] = "mutated"  # callers get copies
+    assert manager.list_tasks(status="pending")[0]["id"] == "task-001"
+    assert manager.update_task("task-001", {"status": "completed"})
+    assert manager.list_tasks()[0]["status"] == "completed"
+
+
+def test_concurrent_lookups(tmp_path):
+    import threading
+    watcher = FileWatcher(poll_interval=0)
+    path = str(tmp_path / "specs.json")
+    _write(path, "{}")
+    errors = []
+
+    def lookup():
+        try:
+            for _ in range(2000):
+                watcher.version(path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    watcher.close()
+    assert errors == []